@@ -0,0 +1,75 @@
+"""Cost of DataPortalClient._handle_response on recorded payloads.
+
+Replays ``response_raw.json`` scaled to ``--rows`` rows through the previous
+implementation (``response.text`` + substring search + ``response.json()``) and the
+current one (byte sniffing + pluggable decoder) with each installed decoder.
+
+Usage:
+    uv run python benchmarks/bench_decode.py [--rows 1 1000 10000] [--repeat 200]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import httpx
+
+from kr_data_portal.client import DataPortalClient
+from kr_data_portal.decoders import get_json_loads
+
+RAW = json.loads((Path(__file__).parent.parent / "response_raw.json").read_text(encoding="utf-8"))
+
+
+def payload(rows: int) -> bytes:
+    data = json.loads(json.dumps(RAW))
+    row = data["response"]["body"]["items"]["item"][0]
+    data["response"]["body"]["items"]["item"] = [{**row, "srtnCd": f"{i:06d}"} for i in range(rows)]
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def previous(response: httpx.Response) -> dict:
+    """What _handle_response did before: decode to str, search it, parse again."""
+    content = response.text
+    if "<returnAuthMsg>" in content or "<cmmMsgHeader>" in content:
+        raise AssertionError("unexpected error payload")
+    return response.json()
+
+
+def measure(handle, content: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        # A fresh response each time: httpx caches .text on the instance.
+        response = httpx.Response(200, content=content)
+        start = time.perf_counter()
+        handle(response)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    cases = {"previous (text + response.json)": previous}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            client = DataPortalClient(service_key="bench", json_loads=get_json_loads(name))
+        except ImportError:
+            continue
+        cases[f"bytes sniff + {name}"] = client._handle_response
+
+    for rows in args.rows:
+        content = payload(rows)
+        print(f"\n{rows:,} rows, {len(content):,} bytes")
+        baseline = None
+        for name, handle in cases.items():
+            elapsed = measure(handle, content, max(3, args.repeat // max(1, rows // 1000)))
+            baseline = baseline or elapsed
+            print(f"  {name:34s} {elapsed * 1e6:10.1f} us  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
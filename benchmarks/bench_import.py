@@ -0,0 +1,77 @@
+"""Import time of the service registry and per-call cost of response specialization.
+
+Each import is timed in a fresh interpreter (best of ``--repeat``): the bare registry,
+a client through the registry and the generated module imported directly. The second
+part compares subscripting ``DataPortalResponse[Model]`` on every call, as the
+generated methods used to, with the module-level aliases they use now.
+
+Usage:
+    uv run python benchmarks/bench_import.py [--repeat 10] [--calls 100000]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from kr_data_portal.financial_services import StockPriceInfoResponse
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+IMPORTS = {
+    "import kr_data_portal.services": "import kr_data_portal.services",
+    "services.FinancialClient": "from kr_data_portal.services import FinancialClient",
+    "import kr_data_portal.financial_services": "import kr_data_portal.financial_services",
+}
+
+TIMER = "import time; t = time.perf_counter(); {stmt}; print(time.perf_counter() - t)"
+
+
+def import_time(stmt: str, repeat: int) -> float:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(SRC), os.environ.get("PYTHONPATH", "")]),
+    }
+    best = float("inf")
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(stmt=stmt)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best = min(best, float(out.stdout))
+    return best
+
+
+def per_call(make, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        make()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print("import (fresh interpreter, best of", args.repeat, "runs)")
+    for name, stmt in IMPORTS.items():
+        print(f"  {name:42s} {import_time(stmt, args.repeat) * 1e3:8.1f} ms")
+
+    print("\nresponse type per call")
+    subscript = per_call(lambda: DataPortalResponse[StockPriceInfoItem], args.calls)
+    alias = per_call(lambda: StockPriceInfoResponse, args.calls)
+    print(f"  {'DataPortalResponse[StockPriceInfoItem]':42s} {subscript * 1e6:8.2f} us")
+    print(f"  {'StockPriceInfoResponse (module level)':42s} {alias * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
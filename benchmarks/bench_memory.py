@@ -0,0 +1,100 @@
+"""Retained memory of a year of daily prices in each item representation.
+
+Simulates paging through ``--days`` trading days of ``--tickers`` rows each. Every
+page is decoded into fresh dicts and strings (as ``json.loads`` would), converted,
+and then dropped, so only the converted representation stays alive.
+
+Usage:
+    uv run python benchmarks/bench_memory.py [--tickers 400] [--days 250]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from datetime import date, timedelta
+
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+
+def decoded_page(day: str, tickers: int) -> DataPortalResponse[StockPriceInfoItem]:
+    items = [
+        {
+            "basDt": f"{day}",
+            "srtnCd": f"{i:06d}",
+            "isinCd": f"KR7{i:06d}003",
+            "itmsNm": f"종목{i}",
+            "mrktCtg": "KOSPI" if i % 2 else "KOSDAQ",
+            "clpr": f"{10000 + i}",
+            "vs": f"{-i}",
+            "fltRt": f"{i / 100:.2f}",
+            "mkp": f"{10100 + i}",
+            "hipr": f"{10200 + i}",
+            "lopr": f"{9900 + i}",
+            "trqu": f"{i * 1000}",
+            "trPrc": f"{i * 10_000_000}",
+            "lstgStCnt": f"{i * 100_000}",
+            "mrktTotAmt": f"{i * 1_000_000_000}",
+        }
+        for i in range(tickers)
+    ]
+    data = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body": {"items": {"item": items}, "numOfRows": tickers, "pageNo": 1},
+        }
+    }
+    return DataPortalResponse[StockPriceInfoItem].model_validate(data)
+
+
+def days(count: int) -> list[str]:
+    start = date(2025, 1, 1)
+    return [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(count)]
+
+
+def retained(convert, tickers: int, day_list: list[str]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    for day in day_list:
+        convert(kept, decoded_page(day, tickers))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=400)
+    parser.add_argument("--days", type=int, default=250)
+    args = parser.parse_args()
+
+    day_list = days(args.days)
+    rows = args.tickers * args.days
+
+    def keep_frame(kept, page):
+        if kept:
+            kept[0].extend(page.columns())
+        else:
+            kept.append(page.columns())
+
+    cases = {
+        "pydantic models": lambda kept, page: kept.extend(page.items()),
+        "raw dicts": lambda kept, page: kept.extend(page.raw_items()),
+        "compact records": lambda kept, page: kept.extend(page.records()),
+        "PriceFrame columns": keep_frame,
+    }
+    print(f"{rows:,} rows ({args.tickers} tickers x {args.days} days)")
+    baseline = None
+    for name, convert in cases.items():
+        size = retained(convert, args.tickers, day_list)
+        baseline = baseline or size
+        print(
+            f"{name:20s} {size / 2**20:9.1f} MiB  {size / rows:7.0f} B/row  x{size / baseline:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Throughput of concurrent requests against a local stand-in server by pool size.
+
+Starts a plain HTTP/1.1 keep-alive server on localhost that answers every request
+with ``response_raw.json`` after ``--latency`` seconds, then fires ``--requests``
+requests at several concurrency levels for each pool size and reports requests/s
+and the number of TCP connections the server accepted.
+
+HTTP/2 is not covered: httpx only negotiates it over TLS (no h2c), which this
+stand-in server does not speak.
+
+Usage:
+    uv run python benchmarks/bench_pool.py [--latency 0.05] [--requests 400]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from pathlib import Path
+
+import httpx
+
+from kr_data_portal.client import DataPortalClient
+
+BODY = (Path(__file__).parent.parent / "response_raw.json").read_bytes()
+HEAD = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n"
+
+
+class StandInServer:
+    """Keep-alive HTTP/1.1 server run in its own process, counting accepted connections."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self._connections = multiprocessing.Value("i", 0)
+        self._port = multiprocessing.Value("i", 0)
+        self._ready = multiprocessing.Event()
+        self._process = multiprocessing.Process(target=self._serve, daemon=True)
+
+    @property
+    def connections(self) -> int:
+        return self._connections.value
+
+    @connections.setter
+    def connections(self, value: int) -> None:
+        self._connections.value = value
+
+    def start(self) -> int:
+        self._process.start()
+        self._ready.wait()
+        return self._port.value
+
+    def stop(self) -> None:
+        self._process.terminate()
+
+    def _serve(self) -> None:
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self._port.value = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        with self._connections.get_lock():
+            self._connections.value += 1
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(self.latency)
+                writer.write(HEAD % len(BODY) + BODY)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class PlainHTTPTransport(httpx.AsyncBaseTransport):
+    """Sends the client's (always https) requests to the plain-HTTP stand-in server."""
+
+    def __init__(self, pool: int):
+        limits = httpx.Limits(max_connections=pool, max_keepalive_connections=pool)
+        self._inner = httpx.AsyncHTTPTransport(limits=limits)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http")
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+async def run(url: str, server: StandInServer, requests: int, concurrency: int, pool: int):
+    server.connections = 0
+    transport = PlainHTTPTransport(pool)
+    client = DataPortalClient(service_key="bench", requests_per_second=1e9, transport=transport)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            await client._request(url, params={"pageNo": i})
+
+    async with client:
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+    await transport.aclose()
+    return requests / elapsed, server.connections
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--pool", type=int, nargs="+", default=[10, 100])
+    args = parser.parse_args()
+
+    server = StandInServer(args.latency)
+    url = f"https://127.0.0.1:{server.start()}/getStockPriceInfo"
+
+    print(f"latency {args.latency * 1000:.0f} ms, {args.requests} requests")
+    print(f"{'pool':>6} {'concurrency':>12} {'req/s':>10} {'connections':>12}")
+    try:
+        for pool in args.pool:
+            for concurrency in args.concurrency:
+                rps, connections = await run(url, server, args.requests, concurrency, pool)
+                print(f"{pool:>6} {concurrency:>12} {rps:>10.1f} {connections:>12}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
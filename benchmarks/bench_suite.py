@@ -0,0 +1,226 @@
+"""End-to-end benchmark of FinancialClient against the spec-driven mock portal.
+
+Runs every scenario for every endpoint through ``MockPortal.transport()`` (see
+``kr_data_portal.mockserver``), so transport, decoding, pagination and validation
+are all exercised without network access or a service key:
+
+    paginate  paginate() with validated models
+    parse     iter_pages() + raw_items(), no validation
+    columns   iter_pages() + columns()
+    stream    stream_items(raw=True) of a single page holding every row (one request,
+              so no retries and no error injection)
+
+For each run it reports rows/s, p50/p99 request latency (from the metrics hooks)
+and peak traced memory (from a second, tracemalloc-enabled pass).
+
+``--save`` writes the results to JSON; ``--baseline`` compares against such a file
+and exits with status 1 if rows/s dropped by more than ``--tolerance``.
+
+Usage:
+    uv run python benchmarks/bench_suite.py [--rows 20000] [--page-size 1000] \\
+        [--latency 0.01] [--error-rate 0.02] [--save results.json] [--baseline results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from kr_data_portal import metrics
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.mockserver import MockPortal
+from kr_data_portal.retry import RetryBudget, RetryPolicy
+
+SPEC = Path(__file__).parent.parent / "specs" / "financial_services.yaml"
+BASDT = "20260205"
+KEY = "bench_key"
+
+
+async def paginate(client, op, args) -> int:
+    rows = 0
+    async for _ in client.paginate(
+        getattr(client, op), numOfRows=args.page_size, concurrency=args.concurrency, basDt=BASDT
+    ):
+        rows += 1
+    return rows
+
+
+async def parse(client, op, args) -> int:
+    rows = 0
+    async for page in client.iter_pages(
+        getattr(client, op), numOfRows=args.page_size, concurrency=args.concurrency, basDt=BASDT
+    ):
+        rows += len(page.raw_items())
+    return rows
+
+
+async def columns(client, op, args) -> int:
+    rows = 0
+    async for page in client.iter_pages(
+        getattr(client, op), numOfRows=args.page_size, concurrency=args.concurrency, basDt=BASDT
+    ):
+        rows += len(page.columns())
+    return rows
+
+
+async def stream(client, op, args) -> int:
+    rows = 0
+    async for _ in client.stream_items(op, raw=True, numOfRows=args.rows, basDt=BASDT):
+        rows += 1
+    return rows
+
+
+SCENARIOS = {"paginate": paginate, "parse": parse, "columns": columns, "stream": stream}
+
+
+def make_client(scenario, op, args) -> tuple[FinancialClient, MockPortal]:
+    portal = MockPortal.from_yaml(
+        SPEC,
+        total_count=args.rows,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=0.0 if scenario == "stream" else args.error_rate,
+        error_code=args.error_code,
+        cache_pages=True,
+    )
+    # Build every page up front so serving costs no CPU during the measurement.
+    path = urlsplit(FinancialClient.endpoints[op].url).path
+    page_size = args.rows if scenario == "stream" else args.page_size
+    for page_no in range(1, -(-args.rows // page_size) + 1):
+        params = {"numOfRows": str(page_size), "pageNo": str(page_no), "basDt": BASDT}
+        portal.respond(path, {"serviceKey": KEY, "resultType": "json", **params})
+    portal.requests = portal.errors = 0
+    retry = RetryPolicy(max_retries=5, base_delay=0.0, budget=RetryBudget(ratio=1.0, capacity=1e9))
+    client = FinancialClient(
+        KEY,
+        requests_per_second=1e6,
+        retry=retry,
+        coalesce=False,
+        transport=portal.transport(),
+    )
+    return client, portal
+
+
+async def run_once(scenario, op, args) -> tuple[int, float, list[float], MockPortal]:
+    latencies: list[float] = []
+
+    def hook(event):
+        if isinstance(event, metrics.RequestEvent):
+            latencies.append(event.total)
+
+    client, portal = make_client(scenario, op, args)
+    metrics.add_hook(hook)
+    try:
+        start = time.perf_counter()
+        rows = await SCENARIOS[scenario](client, op, args)
+        elapsed = time.perf_counter() - start
+    finally:
+        metrics.remove_hook(hook)
+        await client.close()
+    # Streamed requests are not instrumented; the single request is the whole run.
+    return rows, elapsed, latencies or [elapsed], portal
+
+
+async def peak_memory(scenario, op, args) -> int:
+    client, _ = make_client(scenario, op, args)
+    tracemalloc.start()
+    try:
+        await SCENARIOS[scenario](client, op, args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        await client.close()
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[round(q * 100) - 1]
+
+
+async def main_async(args) -> dict[str, dict]:
+    results = {}
+    for op in args.endpoints:
+        for scenario in args.scenarios:
+            best = None
+            for _ in range(args.repeat):
+                run = await run_once(scenario, op, args)
+                if best is None or run[1] < best[1]:
+                    best = run
+            rows, elapsed, latencies, portal = best
+            peak = await peak_memory(scenario, op, args)
+            results[f"{op}/{scenario}"] = {
+                "rows": rows,
+                "rows_per_second": rows / elapsed,
+                "p50_ms": percentile(latencies, 0.5) * 1000,
+                "p99_ms": percentile(latencies, 0.99) * 1000,
+                "requests": portal.requests,
+                "errors": portal.errors,
+                "peak_mib": peak / 2**20,
+            }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        ratio = result["rows_per_second"] / before["rows_per_second"]
+        if ratio < 1 - tolerance:
+            regressions.append(f"{name}: {ratio:.0%} of baseline rows/s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000, help="totalCount per endpoint")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-code", default="05", help='portal code or HTTP status ("503")')
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--endpoints", nargs="+", default=list(FinancialClient.endpoints), metavar="OP"
+    )
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=SCENARIOS)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare with a JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    print(
+        f"{'endpoint/scenario':38s} {'rows/s':>12s} {'p50 ms':>8s} {'p99 ms':>8s} "
+        f"{'reqs':>5s} {'errs':>5s} {'peak MiB':>9s}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:38s} {r['rows_per_second']:>12,.0f} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+            f"{r['requests']:>5d} {r['errors']:>5d} {r['peak_mib']:>9.1f}"
+        )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
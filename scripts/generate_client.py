@@ -1,121 +1,292 @@
+import argparse
+from pathlib import Path
+
 import yaml
-from jinja2 import Template
+from jinja2 import Environment
+
+ROOT = Path(__file__).resolve().parent.parent
+SPECS = ROOT / "specs"
+PACKAGE = ROOT / "src" / "kr_data_portal"
+
+env = Environment(trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+
+TEMPLATE = '''from typing import Any
 
-TEMPLATE = """
-from typing import Any, Dict, Optional, Union
 from .client import DataPortalClient
+from .keys import ServiceKeyPool
 from .models.base import DataPortalResponse
-from .models.{{ module_name }} import {{ models_list | join(', ') }}
+from .models.{{ module_name }} import (
+{% for model in models_list | sort %}
+    {{ model }},
+{% endfor %}
+)
+from .plans import Param, RequestPlan
+
+# Response types are specialized once here rather than on every call.
+{% for service in services %}
+{{ service.response_name }} = DataPortalResponse[{{ service.model_name }}]
+{% endfor %}
+
+# Per-operation request plans (URL, parameters, validators), compiled at import.
+PLANS = {
+{% for service in services %}
+    "{{ service.name }}": RequestPlan(
+        "{{ service.name }}",
+        "{{ base_url | replace("http://", "https://") }}{{ service.path }}",
+        {{ service.model_name }},
+        params=(
+{% for param in service.call_params %}
+            Param("{{ param.name }}", "{{ param.type }}"{% if param.default_repr != "None" %}, {{ param.default_repr }}{% endif %}{% if param.required %}, required=True{% endif %}),
+{% endfor %}
+        ),
+{% if service.filters %}
+        filters=(
+{% for filter in service.filters %}
+            ("{{ filter.name }}", "{{ filter.field }}", "{{ filter.filter }}"),
+{% endfor %}
+        ),
+{% endif %}
+    ),
+{% endfor %}
+}
+
 
 class {{ class_name }}(DataPortalClient):
-    \"\"\"{{ description }}
-    
-    Base URL: {{ base_url }}
-    \"\"\"
+    """{{ description }}
+
+    Base URL: {{ base_url | replace("http://", "https://") }}
+    """
+
+    endpoints = {name: plan.endpoint for name, plan in PLANS.items()}
+
+    def __init__(
+        self,
+        service_key: str | ServiceKeyPool,
+        requests_per_second: float = 10.0,
+        timeout: float = 30.0,
+        use_retry: bool = False,
+        max_retries: int = 3,
+        **kwargs: Any,
+    ):
+        super().__init__(
+            service_key=service_key,
+            requests_per_second=requests_per_second,
+            timeout=timeout,
+            use_retry=use_retry,
+            max_retries=max_retries,
+            **kwargs,
+        )
+{% for service in services %}
 
-    {% for service in services %}
     async def {{ service.name }}(
         self,
-        {% for param in service.parameters if param.name != 'serviceKey' and param.name != 'resultType' %}
-        {{ param.name }}: {{ param.type }} = {{ param.default if param.default is defined and param.default is not none else 'None' }},
-        {% endfor %}
-        **kwargs: Any
-    ) -> DataPortalResponse[{{ service.model_name }}]:
-        \"\"\"{{ service.description }}
+{% for param in service.call_params %}
+        {{ param.name }}: {{ param.type }} = {{ param.default_repr }},
+{% endfor %}
+        **kwargs: Any,
+    ) -> {{ service.response_name }}:
+        """{{ service.description }}
+{% if service.update_policy %}
 
         Data Update Policy:
         - Cycle: {{ service.update_policy.cycle }}
         - Timing: {{ service.update_policy.timing }}
+{% endif %}
 
         Args:
-            {% for param in service.parameters if param.name != 'serviceKey' and param.name != 'resultType' %}
+{% for param in service.call_params %}
             {{ param.name }} ({{ param.type }}): {{ param.description or 'No description' }}
-            {% endfor %}
+{% endfor %}
             **kwargs: Additional request parameters.
 
         Returns:
-            DataPortalResponse[{{ service.model_name }}]: The API response.
-        \"\"\"
-        params = {
-            "resultType": "json",
-            {% for param in service.parameters if param.name != 'serviceKey' and param.name != 'resultType' %}
-            "{{ param.name }}": {{ param.name }},
-            {% endfor %}
-        }
-        params.update(kwargs)
-        
-        data = await self._request(
-            "{{ base_url }}{{ service.path }}",
-            params={k: v for k, v in params.items() if v is not None}
+            {{ service.response_name }}: The API response.
+        """
+        return await self._call(
+            PLANS["{{ service.name }}"],
+            {
+{% for param in service.call_params %}
+                "{{ param.name }}": {{ param.name }},
+{% endfor %}
+                **kwargs,
+            },
         )
-        return DataPortalResponse[{{ service.model_name }}].model_validate(data)
+{% endfor %}
+'''
 
-    {% endfor %}
-"""
+MODEL_TEMPLATE = '''from pydantic import BaseModel
+{% for service in services %}
 
-MODEL_TEMPLATE = """
-from pydantic import BaseModel
-from typing import Optional
 
-{% for service in services %}
 class {{ service.model_name }}(BaseModel):
-    \"\"\"Model for {{ service.name }} item.\"\"\"
+    """Model for {{ service.name }} item."""
+
     # Note: In production, these fields should be mapped based on actual API response
     # For now, we use dynamic fields or common ones if known.
     # We'll define some common stock fields here.
-    basDt: Optional[str] = None
-    srtnCd: Optional[str] = None
-    isinCd: Optional[str] = None
-    itmsNm: Optional[str] = None
-    mrktCtg: Optional[str] = None
-    clpr: Optional[str] = None
-    vs: Optional[str] = None
-    fltRt: Optional[str] = None
-    mkp: Optional[str] = None
-    hipr: Optional[str] = None
-    lopr: Optional[str] = None
-    trqu: Optional[str] = None
-    trPrc: Optional[str] = None
-    lstgStCnt: Optional[str] = None
-    mrktTotAmt: Optional[str] = None
-
+{% for field in item_fields %}
+    {{ field }}: str | None = None
 {% endfor %}
+{% endfor %}
+'''
+
+REGISTRY_TEMPLATE = '''"""Lazy registry of the generated service clients.
+
+Each spec in ``specs/`` generates a client module. This package imports one (and its
+models) only when it is first accessed, by module or client class name, so importing
+the registry costs nothing however many services are generated:
+
+    >>> from kr_data_portal.services import FinancialClient
+    >>> from kr_data_portal import services
+    >>> services.financial_services.FinancialClient
+
+Generated by ``scripts/generate_client.py``.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Generated module name -> client class name.
+SERVICES = {
+{% for spec in specs %}
+    "{{ spec.module_name }}": "{{ spec.class_name }}",
+{% endfor %}
+}
+
+_MODULES = {client: module for module, client in SERVICES.items()}
+
+__all__ = [
+{% for name in names %}
+    "{{ name }}",
+{% endfor %}
+]
+
+if TYPE_CHECKING:
+{% for spec in specs %}
+    from .. import {{ spec.module_name }}
+    from ..{{ spec.module_name }} import {{ spec.class_name }}
+{% endfor %}
+
+
+def __getattr__(name: str) -> Any:
+    if name in SERVICES:
+        value = importlib.import_module(f"..{name}", __name__)
+    elif name in _MODULES:
+        value = getattr(importlib.import_module(f"..{_MODULES[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the module global and skip __getattr__.
+    globals()[name] = value
+    return value
+
 
-def generate():
-    with open("specs/financial_services.yaml") as f:
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+'''
+
+ITEM_FIELDS = [
+    "basDt",
+    "srtnCd",
+    "isinCd",
+    "itmsNm",
+    "mrktCtg",
+    "clpr",
+    "vs",
+    "fltRt",
+    "mkp",
+    "hipr",
+    "lopr",
+    "trqu",
+    "trPrc",
+    "lstgStCnt",
+    "mrktTotAmt",
+]
+
+# Docstrings of filter parameters the spec leaves undescribed.
+FILTER_DESCRIPTIONS = {
+    "ge": "{field} greater than or equal to the value",
+    "lt": "{field} less than the value",
+    "like": "{field} containing the value",
+}
+
+
+def load_spec(path: Path) -> dict:
+    """Parse a spec and derive the names the templates need."""
+    with open(path, encoding="utf-8") as f:
         spec = yaml.safe_load(f)
 
-    services = spec["services"]
-    for s in services:
-        # Simple name conversion: getStockPriceInfo -> StockPrice
+    # specs/financial_services.yaml -> kr_data_portal.financial_services
+    spec["module_name"] = spec["info"].get("module", path.stem)
+    spec["class_name"] = spec["info"].get(
+        "client", "".join(word.title() for word in spec["module_name"].split("_")) + "Client"
+    )
+    for s in spec["services"]:
+        # Simple name conversion: getStockPriceInfo -> StockPriceInfoItem
         s["model_name"] = s["name"].replace("get", "")
         if not s["model_name"].endswith("Item"):
             s["model_name"] += "Item"
+        s["response_name"] = s["model_name"].removesuffix("Item") + "Response"
+        for p in s["parameters"]:
+            if "filter" in p and not p.get("description"):
+                p["description"] = FILTER_DESCRIPTIONS[p["filter"]].format(field=p["field"])
+        s["call_params"] = [
+            {**p, "default_repr": repr(p.get("default"))}
+            for p in s["parameters"]
+            if p["name"] not in ("serviceKey", "resultType")
+        ]
+        # Parameters compared other than by equality, e.g. beginBasDt (basDt >= value).
+        s["filters"] = [p for p in s["parameters"] if "filter" in p]
+    return spec
+
 
-    module_name = "financial_services"
+def generate_service(spec: dict) -> None:
+    """Write the models and client modules of one spec."""
+    services = spec["services"]
+    module_name = spec["module_name"]
     models_list = [s["model_name"] for s in services]
 
     # Generate Models
-    model_t = Template(MODEL_TEMPLATE)
-    model_content = model_t.render(services=services)
-    with open(f"src/kr_data_portal/models/{module_name}.py", "w") as f:
+    model_content = env.from_string(MODEL_TEMPLATE).render(
+        services=services, item_fields=ITEM_FIELDS
+    )
+    with open(PACKAGE / "models" / f"{module_name}.py", "w", encoding="utf-8") as f:
         f.write(model_content)
 
     # Generate Client
-    client_t = Template(TEMPLATE)
-    client_content = client_t.render(
+    client_content = env.from_string(TEMPLATE).render(
         module_name=module_name,
-        class_name="FinancialClient",
+        class_name=spec["class_name"],
         description=spec["info"]["description"],
         base_url=spec["info"]["base_url"],
         services=services,
         models_list=models_list,
     )
-    with open(f"src/kr_data_portal/{module_name}.py", "w") as f:
+    with open(PACKAGE / f"{module_name}.py", "w", encoding="utf-8") as f:
         f.write(client_content)
 
 
+def generate(paths: list[Path] | None = None) -> None:
+    """Generate the given specs (default: every spec in ``specs/``) and the registry.
+
+    The registry always lists every spec in ``specs/`` plus the given ones, so
+    regenerating one service keeps the others registered.
+    """
+    known = sorted(SPECS.glob("*.yaml"))
+    for path in paths or known:
+        generate_service(load_spec(path))
+
+    registered = {path.resolve(): path for path in [*known, *(paths or [])]}
+    specs = sorted(
+        (load_spec(path) for path in registered.values()), key=lambda s: s["module_name"]
+    )
+    names = sorted(name for spec in specs for name in (spec["module_name"], spec["class_name"]))
+    registry = env.from_string(REGISTRY_TEMPLATE).render(specs=specs, names=names)
+    (PACKAGE / "services").mkdir(exist_ok=True)
+    with open(PACKAGE / "services" / "__init__.py", "w", encoding="utf-8") as f:
+        f.write(registry)
+
+
 if __name__ == "__main__":
-    generate()
+    parser = argparse.ArgumentParser(description="Generate service clients from YAML specs.")
+    parser.add_argument("specs", nargs="*", type=Path, help="Spec files (default: specs/*.yaml)")
+    generate(parser.parse_args().specs or None)
@@ -0,0 +1,66 @@
+"""Run a local stand-in for the portal from an API spec.
+
+Serves every operation of the spec at ``http://HOST:PORT/<path>`` (the portal's full
+path works too) with synthetic rows, or rows loaded with ``--data OP=FILE``. Point a
+client at it with ``kr_data_portal.mockserver.LocalPortalTransport``.
+
+Usage:
+    python scripts/mock_server.py [--spec specs/financial_services.yaml] [--port 8080] \\
+        [--rows 10000] [--rate-limit 30] [--daily-limit 10000] [--latency 0.05] \\
+        [--error-rate 0.01 --error-code 05] [--data getStockPriceInfo=response_raw.json]
+"""
+
+import argparse
+
+from kr_data_portal.mockserver import MockPortal, load_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", default="specs/financial_services.yaml")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--rows", type=int, default=1000, help="synthetic totalCount per day")
+    parser.add_argument("--data", action="append", default=[], metavar="OP=FILE")
+    parser.add_argument("--keys", nargs="+", help="accepted service keys (default: any)")
+    parser.add_argument("--rate-limit", type=float, help="requests per second per key")
+    parser.add_argument("--throttle-code", default="429")
+    parser.add_argument("--daily-limit", type=int)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-code", default="05", help='portal code or HTTP status ("503")')
+    args = parser.parse_args()
+
+    datasets = {}
+    for entry in args.data:
+        op, _, path = entry.partition("=")
+        datasets[op] = load_rows(path)
+
+    portal = MockPortal.from_yaml(
+        args.spec,
+        datasets=datasets,
+        total_count=args.rows,
+        keys=args.keys,
+        rate_limit=args.rate_limit,
+        throttle_code=args.throttle_code,
+        daily_limit=args.daily_limit,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_code=args.error_code,
+    )
+    server = portal.server(args.host, args.port)
+    print(f"Serving {', '.join(op.name for op in portal.operations.values())}")
+    print(f"on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"{portal.requests} requests, {portal.errors} errors, {portal.throttled} throttled")
+
+
+if __name__ == "__main__":
+    main()
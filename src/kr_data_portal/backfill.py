@@ -0,0 +1,269 @@
+import asyncio
+import inspect
+import json
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .client import DataPortalClient, page_count
+from .models.base import DataPortalResponse
+
+
+class WorkUnit(NamedTuple):
+    """A single page request of a backfill: one endpoint, one ``basDt``, one page."""
+
+    endpoint: str
+    basDt: str
+    page: int
+
+
+@dataclass
+class BackfillStats:
+    """Running counters of a backfill job."""
+
+    requests: int = 0
+    rows: int = 0
+    skipped: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.monotonic() - self.started, 1e-9)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed
+
+
+class Checkpoint:
+    """Append-only JSON-lines log of completed work units.
+
+    Each line records one finished page. The first page of an ``(endpoint, basDt)``
+    pair also records the total number of pages, so a restarted job knows exactly
+    which pages are still missing without asking the API again.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._done: set[WorkUnit] = set()
+        self._pages: dict[tuple[str, str], int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        data = self.path.read_bytes()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            # A torn final line from a crash: cut it off so the next record starts on a
+            # line of its own. The unit will simply be refetched.
+            with self.path.open("r+b") as f:
+                f.truncate(complete)
+        for line in data[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            unit = WorkUnit(entry["endpoint"], entry["basDt"], entry["page"])
+            self._done.add(unit)
+            if "pages" in entry:
+                self._pages[(unit.endpoint, unit.basDt)] = entry["pages"]
+
+    def is_done(self, unit: WorkUnit) -> bool:
+        return unit in self._done
+
+    def pages_for(self, endpoint: str, basDt: str) -> int | None:
+        """Total page count for a day, if its first page has been fetched."""
+        return self._pages.get((endpoint, basDt))
+
+    def record(self, unit: WorkUnit, rows: int, pages: int | None = None) -> None:
+        entry: dict[str, Any] = {**unit._asdict(), "rows": rows}
+        if pages is not None:
+            entry["pages"] = pages
+            self._pages[(unit.endpoint, unit.basDt)] = pages
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._done.add(unit)
+
+
+Sink = Callable[[WorkUnit, DataPortalResponse[Any]], Awaitable[None] | None]
+
+
+def date_range(start: str | date, end: str | date, skip_weekends: bool = True) -> Iterator[str]:
+    """Yield ``YYYYMMDD`` strings from ``start`` to ``end`` inclusive."""
+    day, last = as_date(start), as_date(end)
+    while day <= last:
+        if not (skip_weekends and day.weekday() >= 5):
+            yield day.strftime("%Y%m%d")
+        day += timedelta(days=1)
+
+
+def as_date(value: str | date) -> date:
+    """``value`` as a date, parsing ``YYYYMMDD`` strings."""
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y%m%d").date()  # noqa: DTZ007
+
+
+class Backfill:
+    """Resumable date-range backfill over one or more client operations.
+
+    The job is sharded into ``(endpoint, basDt, page)`` units. The first page of each
+    day is fetched to learn ``totalCount``; the other pages of that day are then queued.
+    Units run on a bounded pool of workers and every completed unit is appended to the
+    checkpoint, so a restarted job only fetches what is missing.
+
+    Example:
+        >>> job = Backfill(
+        ...     client,
+        ...     endpoints=["getStockPriceInfo", "getEtfPriceInfo"],
+        ...     start="20250101",
+        ...     end="20251231",
+        ...     checkpoint="backfill.jsonl",
+        ...     sink=store_page,
+        ... )
+        >>> stats = await job.run()
+
+    Args:
+        client: Client whose operations are backfilled.
+        endpoints: Operation names on ``client``, e.g. ``"getStockPriceInfo"``.
+        start: First ``basDt`` (``YYYYMMDD`` or ``date``).
+        end: Last ``basDt``, inclusive.
+        checkpoint: Path of the JSON-lines checkpoint file.
+        sink: Called with each unit and its page before the unit is checkpointed.
+            May be a coroutine function.
+        numOfRows: Page size.
+        concurrency: Number of concurrent workers.
+        skip_weekends: Skip Saturdays and Sundays (no trading data).
+        on_progress: Called with the running ``BackfillStats``.
+        progress_interval: Minimum seconds between ``on_progress`` calls.
+        **params: Extra parameters passed to every request.
+    """
+
+    def __init__(
+        self,
+        client: DataPortalClient,
+        endpoints: Iterable[str],
+        start: str | date,
+        end: str | date,
+        checkpoint: str | Path,
+        *,
+        sink: Sink | None = None,
+        numOfRows: int = 1000,
+        concurrency: int = 4,
+        skip_weekends: bool = True,
+        on_progress: Callable[[BackfillStats], None] | None = None,
+        progress_interval: float = 5.0,
+        **params: Any,
+    ):
+        self.client = client
+        self.endpoints = list(endpoints)
+        for name in self.endpoints:
+            if not callable(getattr(client, name, None)):
+                raise ValueError(f"{type(client).__name__} has no operation {name!r}")
+        self.days = list(date_range(start, end, skip_weekends))
+        self.checkpoint = Checkpoint(checkpoint)
+        self.sink = sink
+        self.numOfRows = numOfRows
+        self.concurrency = max(1, concurrency)
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.params = params
+        self.stats = BackfillStats()
+        self._last_progress = 0.0
+
+    def missing_units(self) -> list[WorkUnit]:
+        """Units not yet recorded in the checkpoint.
+
+        Days whose first page is still missing contribute only that page; their other
+        pages are discovered once it has been fetched.
+        """
+        units = []
+        for endpoint in self.endpoints:
+            for day in self.days:
+                pages = self.checkpoint.pages_for(endpoint, day)
+                for page in range(1, (pages or 1) + 1):
+                    unit = WorkUnit(endpoint, day, page)
+                    if self.checkpoint.is_done(unit):
+                        self.stats.skipped += 1
+                    else:
+                        units.append(unit)
+        return units
+
+    async def run(self) -> BackfillStats:
+        """Run until every unit is checkpointed and return the final stats.
+
+        The first failing unit cancels the job and its exception is raised; all units
+        completed before that remain in the checkpoint.
+        """
+        self.stats = BackfillStats()
+        queue: asyncio.Queue[WorkUnit] = asyncio.Queue()
+        for unit in self.missing_units():
+            queue.put_nowait(unit)
+
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+        join = asyncio.create_task(queue.join())
+        try:
+            done, _ = await asyncio.wait([join, *workers], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not join and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            join.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(join, *workers, return_exceptions=True)
+
+        self._report(force=True)
+        return self.stats
+
+    async def _worker(self, queue: "asyncio.Queue[WorkUnit]") -> None:
+        while True:
+            unit = await queue.get()
+            try:
+                for follow_up in await self._fetch(unit):
+                    queue.put_nowait(follow_up)
+            finally:
+                queue.task_done()
+
+    async def _fetch(self, unit: WorkUnit) -> list[WorkUnit]:
+        method = getattr(self.client, unit.endpoint)
+        response = await method(
+            numOfRows=self.numOfRows, pageNo=unit.page, basDt=unit.basDt, **self.params
+        )
+        rows = len(response.raw_items())
+        if self.sink is not None:
+            result = self.sink(unit, response)
+            if inspect.isawaitable(result):
+                await result
+
+        follow_ups: list[WorkUnit] = []
+        pages = None
+        if unit.page == 1:
+            pages = page_count(response, self.numOfRows)
+            follow_ups = [
+                WorkUnit(unit.endpoint, unit.basDt, page)
+                for page in range(2, pages + 1)
+                if not self.checkpoint.is_done(WorkUnit(unit.endpoint, unit.basDt, page))
+            ]
+        self.checkpoint.record(unit, rows, pages)
+
+        self.stats.requests += 1
+        self.stats.rows += rows
+        self._report()
+        return follow_ups
+
+    def _report(self, force: bool = False) -> None:
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if force or now - self._last_progress >= self.progress_interval:
+            self._last_progress = now
+            self.on_progress(self.stats)
@@ -0,0 +1,197 @@
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from .codes import is_retryable
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker of one endpoint.
+
+    Closed, requests pass and their outcomes are tracked over a sliding ``window``.
+    Once at least ``min_requests`` were seen and the failure rate reaches
+    ``failure_rate``, the breaker opens: requests fail immediately with
+    ``CircuitOpenError`` for ``reset_timeout`` seconds, without taking a limiter token.
+    It then turns half-open and lets ``half_open_requests`` probes through; if they
+    all succeed it closes again, and any failure reopens it.
+
+    Only transient failures (the errors a ``RetryPolicy`` would retry) count against
+    the endpoint. Parameter, no-data and key errors show the endpoint is answering.
+
+    Args:
+        url: Endpoint URL, used in error messages.
+        failure_rate: Failure rate in the window that opens the breaker.
+        min_requests: Requests needed in the window before the rate is trusted.
+        window: Seconds of history considered.
+        reset_timeout: Seconds the breaker stays open before probing.
+        half_open_requests: Probes let through, and successes needed, while half-open.
+        is_failure: Classifier deciding which errors count as failures.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_requests: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_retryable,
+    ):
+        self.url = url
+        self.failure_rate_threshold = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self.is_failure = is_failure
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._probes = 0
+        self._probe_successes = 0
+        # Incremented on every turn to half-open, so a probe's outcome only counts in
+        # the half-open period that admitted it.
+        self._half_opened = 0
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"``."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = self._probe_successes = 0
+            self._half_opened += 1
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Failure rate over the current window."""
+        self._prune(time.monotonic())
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until an open breaker starts probing; 0 otherwise."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Admit a request and record its outcome.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all probes
+                in flight.
+        """
+        probe = self._admit()
+        try:
+            yield
+        except Exception as e:
+            self._record(not self.is_failure(e), probe)
+            raise
+        except BaseException:
+            # Cancelled: no outcome, but free the probe slot.
+            if self._is_current_probe(probe):
+                self._probes -= 1
+            raise
+        else:
+            self._record(True, probe)
+
+    def _admit(self) -> int | None:
+        """Admit a request; return the half-open period it probes, None if closed."""
+        state = self.state
+        if state == CLOSED:
+            return None
+        if state == HALF_OPEN and self._probes < self.half_open_requests:
+            self._probes += 1
+            return self._half_opened
+        retry_in = self.retry_in
+        raise CircuitOpenError(
+            f"Circuit open for {self.url}; retry in {retry_in:.1f}s",
+            url=self.url,
+            retry_in=retry_in,
+        )
+
+    def _is_current_probe(self, probe: int | None) -> bool:
+        return probe is not None and probe == self._half_opened and self._state == HALF_OPEN
+
+    def _record(self, ok: bool, probe: int | None) -> None:
+        if probe is not None:
+            if not self._is_current_probe(probe):
+                # A probe of an earlier half-open period, already decided.
+                return
+            self._probes -= 1
+            if not ok:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_requests:
+                self._close()
+            return
+        if self._state != CLOSED:
+            # Admitted while closed, finishing after the breaker opened.
+            return
+
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        if not ok:
+            self._failures += 1
+        self._prune(now)
+        if (
+            len(self._outcomes) >= self.min_requests
+            and self._failures / len(self._outcomes) >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def _prune(self, now: float) -> None:
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] < now - self.window:
+            _, ok = outcomes.popleft()
+            if not ok:
+                self._failures -= 1
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker({self.url!r}, state={self.state!r})"
+
+
+class CircuitBreakers:
+    """One ``CircuitBreaker`` per endpoint URL, created on first use.
+
+    Takes the ``CircuitBreaker`` options and applies them to every endpoint.
+
+    Example:
+        >>> client = FinancialClient(service_key, breakers=CircuitBreakers(failure_rate=0.5))
+        >>> client.circuit_state("getDerivativesPriceInfo")
+        'closed'
+    """
+
+    def __init__(self, **options):
+        self.options = options
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(url)
+        if breaker is None:
+            breaker = self._breakers[url] = CircuitBreaker(url, **self.options)
+        return breaker
+
+    def states(self) -> dict[str, str]:
+        """State of every endpoint used so far, by URL."""
+        return {url: breaker.state for url, breaker in self._breakers.items()}
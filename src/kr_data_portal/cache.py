@@ -0,0 +1,220 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from datetime import time as dtime
+from pathlib import Path
+from typing import Any
+
+KST = timezone(timedelta(hours=9))
+
+# Matches the ``update_policy`` recorded for every service in specs/*.yaml:
+# "Daily, after market close (16:00 KST)".
+DEFAULT_PUBLISH_TIME = dtime(16, 0)
+
+# Parameters bounding the trading days of a query from above; a response can only be
+# final if one is present and all are in the past. ``beginBasDt`` alone leaves the
+# range open, so new trading days keep joining it.
+DATE_PARAMS = ("basDt", "endBasDt")
+
+
+def cache_key(url: str, params: dict[str, Any]) -> str:
+    """Canonical key for a request, independent of parameter order and service key."""
+    if url.startswith("http://"):
+        url = url.replace("http://", "https://", 1)
+    canonical = "&".join(
+        f"{k}={params[k]}" for k in sorted(params) if k != "serviceKey" and params[k] is not None
+    )
+    return hashlib.sha256(f"{url}?{canonical}".encode()).hexdigest()
+
+
+def expires_at(
+    params: dict[str, Any],
+    now: datetime | None = None,
+    publish_time: dtime = DEFAULT_PUBLISH_TIME,
+    data: dict[str, Any] | None = None,
+) -> float | None:
+    """Expiry timestamp for a response requested with ``params``.
+
+    Responses for a ``basDt`` (or ``endBasDt``) before today (KST) never change and
+    never expire (``None``). Everything else - today's date, future dates, open-ended
+    ranges or no date at all - expires at the next daily publish time. So does an
+    empty response (``totalCount`` 0, given the decoded ``data``) for a past date,
+    which may only mean the day has not been published yet.
+    """
+    now = (now or datetime.now(KST)).astimezone(KST)
+    dates = [str(params[p]) for p in DATE_PARAMS if params.get(p)]
+    if dates and max(dates) < now.strftime("%Y%m%d") and not _is_empty(data):
+        return None
+
+    publish = now.replace(
+        hour=publish_time.hour, minute=publish_time.minute, second=0, microsecond=0
+    )
+    if publish <= now:
+        publish += timedelta(days=1)
+    return publish.timestamp()
+
+
+def _is_empty(data: dict[str, Any] | None) -> bool:
+    if data is None:
+        return False
+    body = (data.get("response") or {}).get("body")
+    return isinstance(body, dict) and not int(body.get("totalCount") or 0)
+
+
+def copy_response(data: Any) -> Any:
+    """Copy of a decoded JSON response, so callers sharing one can mutate theirs.
+
+    Only dicts and lists are copied; strings and numbers are immutable.
+    """
+    if type(data) is dict:
+        return {
+            k: copy_response(v) if type(v) is dict or type(v) is list else v
+            for k, v in data.items()
+        }
+    if type(data) is list:
+        return [copy_response(v) if type(v) is dict or type(v) is list else v for v in data]
+    return data
+
+
+class MemoryCache:
+    """Small in-process LRU of decoded responses, bounded by entry count.
+
+    Entries honour the same expiry as ``ResponseCache``. Each hit returns its own copy,
+    so mutating a result does not change the cached entry.
+
+    Args:
+        maxsize: Maximum number of responses kept.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float | None, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response for ``key``, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, data = entry
+        if expires is not None and expires <= time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return copy_response(data)
+
+    def set(self, key: str, data: dict[str, Any], expires: float | None) -> None:
+        """Store ``data`` under ``key``. ``expires`` of None means never expire."""
+        self._data[key] = (expires, copy_response(data))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+
+
+class ResponseCache:
+    """Size-bounded, on-disk LRU cache of decoded API responses.
+
+    Entries are stored zlib-compressed in a single SQLite file. When the total
+    compressed size exceeds ``max_bytes`` the least recently used entries are evicted.
+
+    Args:
+        path: SQLite database file. Created if missing.
+        max_bytes: Upper bound on the total compressed size of stored responses.
+        publish_time: Daily KST publish time used to expire same-day responses.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        publish_time: dtime = DEFAULT_PUBLISH_TIME,
+    ):
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.publish_time = publish_time
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires REAL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total compressed size of stored responses in bytes."""
+        return self._size
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response for ``key``, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, size, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, size, expires = row
+            if expires is not None and expires <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(value))
+
+    def set(self, key: str, data: dict[str, Any], expires: float | None) -> None:
+        """Store ``data`` under ``key``. ``expires`` of None means never expire."""
+        value = zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), expires, time.time()),
+            )
+            self._size += len(value) - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def expires_for(
+        self, params: dict[str, Any], data: dict[str, Any] | None = None
+    ) -> float | None:
+        """Expiry timestamp for ``data``, a response requested with ``params``."""
+        return expires_at(params, publish_time=self.publish_time, data=data)
+
+    def _evict(self) -> None:
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if self._size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,232 @@
+"""Record/replay transport for offline tests and benchmarks.
+
+``CassetteTransport`` plugs into any client through ``transport=``. In record mode it
+forwards requests to the portal and stores the responses in a ``CassetteStore``, with
+the service key removed from URLs and bodies; in replay mode it serves them from
+memory without network access.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote, unquote, unquote_plus
+
+import httpx
+
+RECORD = "record"
+REPLAY = "replay"
+AUTO = "auto"
+
+REDACTED = "REDACTED"
+
+# Headers that describe the wire encoding rather than the (decoded) stored body.
+_DROPPED_HEADERS = frozenset(
+    ["content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"]
+)
+
+
+class CassetteMiss(httpx.TransportError):
+    """A replayed request has no recorded response."""
+
+
+class Interaction(NamedTuple):
+    """A recorded response."""
+
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    elapsed: float
+
+
+def interaction_key(request: httpx.Request) -> str:
+    """Key of a request, independent of parameter order and the service key."""
+    url = request.url.copy_with(query=None, fragment=None)
+    params = sorted((k, v) for k, v in request.url.params.multi_items() if k != "serviceKey")
+    canonical = "&".join(f"{k}={v}" for k, v in params)
+    return hashlib.sha256(f"{request.method} {url}?{canonical}".encode()).hexdigest()
+
+
+def redact(request: httpx.Request, body: bytes) -> tuple[str, bytes]:
+    """Request URL and response body with the service key removed."""
+    kept, keys = [], []
+    for part in request.url.query.decode().split("&"):
+        name, _, value = part.partition("=")
+        if name == "serviceKey":
+            keys.append(value)
+        elif part:
+            kept.append(part)
+    url = str(request.url.copy_with(query="&".join(kept).encode() or None))
+    for key in keys:
+        if not key:
+            continue
+        # The key is appended as given (usually already encoded); the portal may echo
+        # it back in any form.
+        decoded = unquote(key)
+        for form in {key, decoded, unquote_plus(key), quote(decoded, safe="")}:
+            body = body.replace(form.encode(), REDACTED.encode())
+    return url, body
+
+
+class CassetteStore:
+    """Recorded responses, zlib-compressed in one SQLite file indexed by request key.
+
+    Entries are read once and then served from memory.
+
+    Args:
+        path: SQLite database file. Created if missing.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS interactions ("
+            " key TEXT PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " status INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " elapsed REAL NOT NULL,"
+            " recorded REAL NOT NULL)"
+        )
+        self._memory: dict[str, Interaction] = {}
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> Interaction | None:
+        interaction = self._memory.get(key)
+        if interaction is not None:
+            return interaction
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, body, elapsed FROM interactions WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, status, headers, body, elapsed = row
+        interaction = Interaction(
+            url, status, [tuple(h) for h in json.loads(headers)], zlib.decompress(body), elapsed
+        )
+        self._memory[key] = interaction
+        return interaction
+
+    def put(self, key: str, interaction: Interaction) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO interactions"
+                " (key, url, status, headers, body, elapsed, recorded)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    interaction.url,
+                    interaction.status,
+                    json.dumps(interaction.headers),
+                    zlib.compress(interaction.body),
+                    interaction.elapsed,
+                    time.time(),
+                ),
+            )
+        self._memory[key] = interaction
+
+    def urls(self) -> list[str]:
+        """Redacted URLs of every recorded request."""
+        return [row[0] for row in self._db.execute("SELECT url FROM interactions ORDER BY url")]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """Transport recording portal responses to a ``CassetteStore`` or replaying them.
+
+    ``record`` sends every request through ``transport`` and stores the response,
+    with the service key stripped from the URL and body. ``replay`` serves stored
+    responses without network access and raises ``CassetteMiss`` for unknown
+    requests. ``auto`` replays what is recorded and records the rest.
+
+    Example:
+        >>> transport = CassetteTransport("tests/cassettes/prices.db", mode="auto")
+        >>> async with FinancialClient(service_key, transport=transport) as client:
+        ...     await client.getStockPriceInfo(basDt="20260205")
+
+    Args:
+        store: Cassette store or the path of its SQLite file.
+        mode: ``"record"``, ``"replay"`` or ``"auto"``.
+        latency: Replayed latency as a fraction of the recorded one (1.0 replays in
+            real time). 0 serves responses immediately.
+        transport: Transport used to record. Defaults to ``httpx.AsyncHTTPTransport()``.
+    """
+
+    def __init__(
+        self,
+        store: CassetteStore | str | Path,
+        mode: str = REPLAY,
+        latency: float = 0.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        if mode not in (RECORD, REPLAY, AUTO):
+            raise ValueError(f"Unknown cassette mode {mode!r}")
+        self.store = store if isinstance(store, CassetteStore) else CassetteStore(store)
+        self.mode = mode
+        self.latency = latency
+        self._transport = transport
+        self.hits = 0
+        self.recorded = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = interaction_key(request)
+        if self.mode != RECORD:
+            interaction = self.store.get(key)
+            if interaction is not None:
+                self.hits += 1
+                if self.latency:
+                    await asyncio.sleep(interaction.elapsed * self.latency)
+                return httpx.Response(
+                    interaction.status,
+                    headers=interaction.headers,
+                    content=interaction.body,
+                    request=request,
+                )
+            if self.mode == REPLAY:
+                url, _ = redact(request, b"")
+                raise CassetteMiss(f"No recorded response for {request.method} {url}")
+        return await self._record(key, request)
+
+    async def _record(self, key: str, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - start
+        # The body is stored decompressed, so drop the headers describing the wire format.
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        url, redacted = redact(request, body)
+        self.store.put(key, Interaction(url, response.status_code, headers, redacted, elapsed))
+        self.recorded += 1
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        if self._transport is not None:
+            await self._transport.aclose()
@@ -1,43 +1,182 @@
-from typing import Any
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractContextManager, aclosing, asynccontextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
+
 import httpx
 from aiolimiter import AsyncLimiter
+from pydantic import ValidationError
+
+from . import metrics
+from .breaker import CLOSED, CircuitBreakers
+from .cache import MemoryCache, ResponseCache, cache_key, copy_response, expires_at
+from .codes import error_code, is_key_error, is_quota_exceeded, is_throttling
+from .decoders import JsonLoads, default_json_loads
+from .exceptions import DataPortalError, ServiceError
+from .keys import ServiceKeyPool
+from .models.base import DataPortalResponse
+from .ratelimit import AdaptiveLimiter
+from .retry import RetryPolicy
+from .streaming import ItemStreamParser
+
+if TYPE_CHECKING:
+    from .plans import RequestPlan
+
+# Bytes of the body inspected for an XML error envelope.
+_SNIFF_BYTES = 64
+_XML_MSG = re.compile(r"<(returnAuthMsg|errMsg)>(.*?)</\1>")
+_XML_CODE = re.compile(r"<(returnReasonCode|returnCode)>(.*?)</\1>")
+
+
+class Endpoint(NamedTuple):
+    """URL, item model and filter parameters of a generated operation.
+
+    ``filters`` lists the parameters that compare a row field other than by equality,
+    as ``(parameter, field, op)`` with ``op`` one of ``ge``, ``lt`` or ``like``; e.g.
+    ``("beginBasDt", "basDt", "ge")``.
+    """
+
+    url: str
+    model: type
+    filters: tuple[tuple[str, str, str], ...] = ()
 
-class DataPortalError(Exception):
-    """Base exception for KR Data Portal Client."""
-    def __init__(self, message: str, code: str = None, response: httpx.Response = None):
-        self.message = message
-        self.code = code
-        self.response = response
-        super().__init__(self.message)
+    def filter_param(self, field: str, op: str) -> str | None:
+        """Name of the parameter applying ``op`` to ``field``, if the operation has one."""
+        for param, filter_field, filter_op in self.filters:
+            if filter_field == field and filter_op == op:
+                return param
+        return None
 
-class ServiceError(DataPortalError):
-    """Exception for API-level errors (e.g., SERVICE_TIMEOUT, INVALID_SERVICE_KEY)."""
-    pass
 
 class DataPortalClient:
     """Base client for KR Public Data Portal.
 
     Attributes:
-        service_key: The API service key provided by the portal.
+        service_key: The API service key provided by the portal, or a
+            ``ServiceKeyPool`` to spread requests over several keys. A pool brings its
+            own per-key limiters, so the rate options below are ignored.
         rate_limit: Maximum requests per second.
-        use_retry: Whether to use automatic retries.
+        adaptive_rate: Adapt the rate to the portal instead of holding it fixed. It
+            starts at ``requests_per_second``, grows while requests succeed and halves
+            on throttling (``SERVICE_TIMEOUT``, traffic exceeded, HTTP 429/503,
+            timeouts or latency spikes). The current value is ``rate``.
+        min_requests_per_second: Lower bound of the adaptive rate.
+        max_requests_per_second: Upper bound of the adaptive rate. None means unbounded.
+        use_retry: Whether to use automatic retries, with a default ``RetryPolicy``.
         max_retries: Maximum number of retries if use_retry is True.
+        retry: Retry policy (backoff, error classification, retry budget). Overrides
+            ``use_retry`` and ``max_retries``; share one to share its budget.
+        breakers: Per-endpoint circuit breakers. An endpoint that keeps failing
+            is failed fast with ``CircuitOpenError`` until probes succeed again; see
+            ``circuit_state``.
+        cache: Optional on-disk response cache. Past-date responses are served from it
+            forever; same-day responses until the next 16:00 KST publish time.
+        memory_cache_size: Number of recent responses kept in an in-process LRU in
+            front of the network (and of ``cache``). 0 disables it.
+        coalesce: Share a single upstream request between concurrent identical calls.
+        json_loads: JSON decoder taking the raw body bytes. Defaults to orjson or
+            msgspec when installed and the standard library otherwise.
+        max_connections: Maximum number of open connections in the pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        http2: Negotiate HTTP/2 so concurrent requests share one multiplexed TLS
+            connection. Requires the ``http2`` extra.
+        accept_encoding: ``Accept-Encoding`` header to send. By default httpx offers
+            gzip and deflate, plus brotli/zstd when those packages are installed.
+        transport: Transport to send requests through, e.g. one shared by several
+            clients. It carries its own pool, so the pool options above are ignored,
+            and it is not closed by ``close()``.
     """
 
+    endpoints: ClassVar[dict[str, Endpoint]] = {}
+
     def __init__(
         self,
-        service_key: str,
+        service_key: str | ServiceKeyPool,
         requests_per_second: float = 10.0,
         timeout: float = 30.0,
         use_retry: bool = False,
         max_retries: int = 3,
+        cache: ResponseCache | None = None,
+        memory_cache_size: int = 0,
+        coalesce: bool = True,
+        json_loads: JsonLoads | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        accept_encoding: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        breakers: CircuitBreakers | None = None,
+        adaptive_rate: bool = False,
+        min_requests_per_second: float = 1.0,
+        max_requests_per_second: float | None = None,
     ):
-        self.service_key = service_key
-        self._limiter = AsyncLimiter(requests_per_second, 1)
+        self.key_pool = service_key if isinstance(service_key, ServiceKeyPool) else None
+        self.service_key = None if self.key_pool is not None else service_key
+        if adaptive_rate:
+            self._limiter = AdaptiveLimiter(
+                requests_per_second,
+                min_rate=min_requests_per_second,
+                max_rate=max_requests_per_second,
+            )
+        else:
+            self._limiter = AsyncLimiter(requests_per_second, 1)
         self._timeout = timeout
-        self._client = httpx.AsyncClient(timeout=self._timeout)
-        self._use_retry = use_retry
-        self._max_retries = max_retries
+        self._owns_transport = transport is None
+        self._client = httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            headers={"Accept-Encoding": accept_encoding} if accept_encoding else None,
+            transport=transport,
+        )
+        if retry is None and use_retry:
+            retry = RetryPolicy(max_retries=max_retries)
+        self.retry = retry
+        self.breakers = breakers
+        self._cache = cache
+        self._memory = MemoryCache(memory_cache_size) if memory_cache_size > 0 else None
+        self._coalesce = coalesce
+        self._json_loads = json_loads or default_json_loads()
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._key_suffixes: dict[str, str] = {}
+
+    @property
+    def rate(self) -> float:
+        """Current request rate limit in requests per second (summed over pooled keys)."""
+        if self.key_pool is not None:
+            return self.key_pool.rate
+        if isinstance(self._limiter, AdaptiveLimiter):
+            return self._limiter.rate
+        return self._limiter.max_rate / self._limiter.time_period
+
+    @asynccontextmanager
+    async def _slot(self, params: dict[str, Any]) -> AsyncIterator[tuple[str, Any]]:
+        """Wait for permission to send; yields the service key and its limiter.
+
+        An explicit ``serviceKey`` in ``params`` goes through the client's own limiter.
+        """
+        key = params.get("serviceKey")
+        if self.key_pool is None or key is not None:
+            async with self._limiter:
+                yield key or self.service_key, self._limiter
+        else:
+            async with self.key_pool.acquire() as state:
+                yield state.key, state.limiter
+
+    async def _call(self, plan: "RequestPlan", values: dict[str, Any]) -> DataPortalResponse[Any]:
+        """Run one call of an operation through its precompiled ``RequestPlan``."""
+        # The plan's URL was normalized when the plan was built.
+        data = await self._get(plan.url, plan.query(values))
+        return plan.response.model_validate(data)
 
     async def _request(
         self,
@@ -53,92 +192,591 @@ class DataPortalClient:
         if url.startswith("http://"):
             url = url.replace("http://", "https://", 1)
 
-        # Ensure serviceKey is in params
-        if "serviceKey" not in params:
-            params["serviceKey"] = self.service_key
-
-        async with self._limiter:
-            # Manual URL construction to prevent double-encoding of serviceKey
-            base_url = httpx.URL(url)
-            
-            # Extract serviceKey to handle it separately
-            key = params.pop("serviceKey")
-            
-            # Build query string
-            query_parts = []
-            for k, v in params.items():
-                query_parts.append(f"{k}={v}")
-            
-            # Append raw serviceKey
-            query_string = "&".join(query_parts)
-            if query_string:
-                final_url = f"{url}?{query_string}&serviceKey={key}"
-            else:
-                final_url = f"{url}?serviceKey={key}"
+        if method != "GET" or kwargs:
+            return await self._fetch(url, method, params, None, **kwargs)
+        return await self._get(url, params)
+
+    async def _get(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """GET of an ``https`` URL through the memory cache and single-flight."""
+        key = cache_key(url, params)
+        if self._memory is not None:
+            cached = self._memory.get(key)
+            if cached is not None:
+                return cached
+
+        if not self._coalesce:
+            return await self._fetch(url, "GET", params, key)
+
+        # Single-flight: identical concurrent calls await the same upstream request.
+        # The shared task is shielded so one cancelled caller does not fail the others.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, "GET", params, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(key, t))
+            return await asyncio.shield(task)
+        # Callers joining the request get a copy, taken before the caller that started
+        # it resumes with the original; responses keep the decoded rows by reference.
+        return await _copy_when_done(task)
+
+    def _forget_inflight(self, key: str, task: "asyncio.Future[dict[str, Any]]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            task.exception()
+
+    async def _fetch(
+        self,
+        url: str,
+        method: str,
+        params: dict[str, Any],
+        key: str | None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Serve a request from the disk cache or the network and fill the caches."""
+        if key is not None and self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if self._memory is not None:
+                    self._memory.set(key, cached, self._expires(params, cached))
+                return cached
+
+        data = await self._send(url, method, params, **kwargs)
+        if key is not None and (self._cache is not None or self._memory is not None):
+            expires = self._expires(params, data)
+            if self._cache is not None:
+                self._cache.set(key, data, expires)
+            if self._memory is not None:
+                self._memory.set(key, data, expires)
+        return data
 
-            if self._use_retry:
-                # Basic retry logic using httpx.AsyncRetrying style if needed, 
-                # but simple implementation for clarity
-                attempt = 0
-                while attempt <= self._max_retries:
+    def _expires(self, params: dict[str, Any], data: dict[str, Any]) -> float | None:
+        if self._cache is not None:
+            return self._cache.expires_for(params, data)
+        return expires_at(params, data=data)
+
+    async def _send(
+        self,
+        url: str,
+        method: str,
+        params: dict[str, Any],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request through the rate limiter, retrying if enabled.
+
+        Every attempt takes its own limiter token (and key); retries wait for the
+        policy's backoff in between.
+        """
+        # Retries only change the service key, so the rest of the query is joined once.
+        query = _query(params)
+        policy = self.retry
+        if policy is None:
+            return await self._attempt(url, method, params, query, **kwargs)
+
+        policy.record_request()
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(url, method, params, query, attempt, **kwargs)
+            except (httpx.RequestError, DataPortalError) as e:
+                if not self._is_retryable(e) or not policy.allow(attempt):
+                    raise
+                await asyncio.sleep(policy.delay(attempt, e))
+                attempt += 1
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if self.retry.is_retryable(error):
+            return True
+        # A key error only condemns that key; another pooled key may succeed.
+        return (
+            self.key_pool is not None
+            and (is_key_error(error) or is_quota_exceeded(error))
+            and bool(self.key_pool.available)
+        )
+
+    async def _attempt(
+        self,
+        url: str,
+        method: str,
+        params: dict[str, Any],
+        query: str,
+        attempt: int = 0,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send one request and feed the outcome to the breaker, limiter and key pool."""
+        with self._guard(url):
+            if metrics.hooks:
+                return await self._observed_attempt(url, method, params, query, attempt, **kwargs)
+            async with self._slot(params) as (service_key, limiter):
+                final_url = self._build_url(url, query, service_key)
+                start = time.perf_counter()
+                try:
+                    response = await self._client.request(method, final_url, **kwargs)
+                    data = self._handle_response(response)
+                except (httpx.RequestError, DataPortalError) as e:
+                    self._record_error(limiter, service_key, e)
+                    raise
+                if isinstance(limiter, AdaptiveLimiter):
+                    limiter.record_success(time.perf_counter() - start)
+                return data
+
+    async def _observed_attempt(
+        self,
+        url: str,
+        method: str,
+        params: dict[str, Any],
+        query: str,
+        attempt: int,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """``_attempt`` timing every stage and emitting a ``RequestEvent``."""
+        event = metrics.RequestEvent(metrics.endpoint_name(url), attempt)
+        tracer = metrics.ConnectTracer()
+        begin = time.perf_counter()
+        try:
+            async with self._slot(params) as (service_key, limiter):
+                final_url = self._build_url(url, query, service_key)
+                start = time.perf_counter()
+                event.limiter_wait = start - begin
+                try:
+                    extensions = {**kwargs.pop("extensions", {}), "trace": tracer}
+                    request = self._client.build_request(
+                        method, final_url, extensions=extensions, **kwargs
+                    )
+                    response = await self._client.send(request, stream=True)
+                    received = time.perf_counter()
+                    event.network, event.status = received - start, response.status_code
                     try:
-                        response = await self._client.request(method, final_url, **kwargs)
-                        return self._handle_response(response)
-                    except (httpx.RequestError, ServiceError) as e:
-                        attempt += 1
-                        if attempt > self._max_retries:
-                            raise e
-                        # Optional: Add small delay or exponential backoff
-            else:
-                response = await self._client.request(method, final_url, **kwargs)
-                return self._handle_response(response)
+                        await response.aread()
+                    finally:
+                        await response.aclose()
+                    read = time.perf_counter()
+                    event.body, event.bytes = read - received, len(response.content)
+                    data = self._handle_response(response)
+                    event.decode = time.perf_counter() - read
+                except (httpx.RequestError, DataPortalError) as e:
+                    self._record_error(limiter, service_key, e)
+                    raise
+                if isinstance(limiter, AdaptiveLimiter):
+                    limiter.record_success(time.perf_counter() - start)
+                return data
+        except Exception as e:
+            event.error_code = error_code(e) or type(e).__name__
+            raise
+        finally:
+            event.connect = tracer.connect
+            event.total = time.perf_counter() - begin
+            metrics.emit(event)
+
+    def _guard(self, url: str) -> AbstractContextManager[None]:
+        if self.breakers is None:
+            return nullcontext()
+        return self.breakers.get(url).guard()
+
+    def circuit_state(self, method: str | Callable[..., Any]) -> str:
+        """Circuit breaker state of an operation (or endpoint URL).
+
+        ``"closed"`` (healthy), ``"open"`` (failing fast) or ``"half_open"``
+        (probing). Always ``"closed"`` without ``breakers``.
+        """
+        if isinstance(method, str) and "://" in method:
+            url = method.replace("http://", "https://", 1)
+        else:
+            url = self._endpoint(method)[1].url.replace("http://", "https://", 1)
+        if self.breakers is None:
+            return CLOSED
+        return self.breakers.get(url).state
+
+    def _record_error(self, limiter: Any, service_key: str, error: Exception) -> None:
+        if isinstance(limiter, AdaptiveLimiter) and is_throttling(error):
+            limiter.record_throttle()
+        if self.key_pool is not None:
+            self.key_pool.report(service_key, error)
+
+    def _build_url(self, url: str, query: str, service_key: str) -> str:
+        """Build the request URL from a ``_query`` string, appending serviceKey unencoded."""
+        # Manual URL construction to prevent double-encoding of serviceKey; the key
+        # part is formatted once per key.
+        suffix = self._key_suffixes.get(service_key)
+        if suffix is None:
+            suffix = self._key_suffixes[service_key] = f"serviceKey={service_key}"
+        if query:
+            return f"{url}?{query}&{suffix}"
+        return f"{url}?{suffix}"
 
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Validate response and check for service-level errors."""
         if response.status_code != 200:
-            raise DataPortalError(f"HTTP {response.status_code}: {response.text}", response=response)
-
-        # Check for error messages in body even if 200 OK
-        content = response.text
-        
-        # Check for XML error messages (common in Korean Public Data Portal)
-        if "<returnAuthMsg>" in content or "<cmmMsgHeader>" in content:
-            # Simple extraction for common error patterns
-            import re
-            msg_match = re.search(r"<(returnAuthMsg|errMsg)>(.*?)</\1>", content)
-            code_match = re.search(r"<(returnReasonCode|returnCode)>(.*?)</\1>", content)
-            
-            msg = msg_match.group(2) if msg_match else "Unknown Service Error"
-            code = code_match.group(2) if code_match else "UNKNOWN"
-            
-            raise ServiceError(f"API Error ({code}): {msg}", code=code, response=response)
+            raise DataPortalError(
+                f"HTTP {response.status_code}: {response.text}", response=response
+            )
+
+        # Check for error messages in body even if 200 OK.
+        # The portal's XML error envelopes are the only bodies starting with "<", so
+        # only the first bytes are inspected and successful bodies are never decoded
+        # to str.
+        content = response.content
+        if content[:_SNIFF_BYTES].lstrip().startswith(b"<"):
+            text = response.text
+            # Check for XML error messages (common in Korean Public Data Portal)
+            if "<returnAuthMsg>" in text or "<cmmMsgHeader>" in text:
+                raise _xml_service_error(text, response)
+            raise _unrecognized_body_error(text, response)
 
         try:
-            data = response.json()
-            
-            # Check for JSON error patterns
-            # Standard response structure: {"response": {"header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE"}}}
-            if isinstance(data, dict) and "response" in data:
-                header = data["response"].get("header", {})
-                code = header.get("resultCode", "00")
-                msg = header.get("resultMsg", "")
-                
-                if code != "00":
-                    raise ServiceError(f"API Error ({code}): {msg}", code=code, response=response)
-            
-            return data
+            data = self._json_loads(content)
         except ValueError:
             # If not JSON, it might be an unhandled XML error or garbage
-            if "<errMsg>" in content or "SERVICE_TIMEOUT" in content:
-                raise ServiceError(f"Service Error Detected: {content}", response=response)
-            raise DataPortalError("Invalid JSON response and not recognized XML error", response=response)
+            raise _unrecognized_body_error(response.text, response) from None
+
+        # Check for JSON error patterns
+        # Standard response structure: {"response": {"header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE"}}}
+        if isinstance(data, dict) and "response" in data:
+            header = data["response"].get("header", {})
+            code = header.get("resultCode", "00")
+            msg = header.get("resultMsg", "")
+
+            if code != "00":
+                raise ServiceError(f"API Error ({code}): {msg}", code=code, response=response)
+
+        return data
+
+    async def iter_pages(
+        self,
+        method: Callable[..., Awaitable[DataPortalResponse[Any]]],
+        *,
+        numOfRows: int = 1000,
+        concurrency: int = 4,
+        ordered: bool = True,
+        **params: Any,
+    ) -> AsyncIterator[DataPortalResponse[Any]]:
+        """Fetch every page of a paginated operation.
+
+        The first page is requested on its own to learn ``totalCount``. The remaining
+        pages are then fetched concurrently, at most ``concurrency`` at a time, and each
+        request still goes through the client's rate limiter.
+
+        Args:
+            method: A bound operation of this client, e.g. ``client.getStockPriceInfo``.
+            numOfRows: Page size used for every request.
+            concurrency: Maximum number of page requests in flight at once.
+            ordered: Yield pages in ``pageNo`` order. If False, pages are yielded as
+                soon as they complete.
+            **params: Additional operation parameters (``basDt``, ``itmsNm``, ...).
+
+        Yields:
+            DataPortalResponse: One response per page.
+        """
+        first = await method(numOfRows=numOfRows, pageNo=1, **params)
+        yield first
+
+        total_pages = page_count(first, numOfRows)
+        if total_pages <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page_no: int) -> DataPortalResponse[Any]:
+            async with semaphore:
+                return await method(numOfRows=numOfRows, pageNo=page_no, **params)
+
+        tasks = [asyncio.create_task(fetch(p)) for p in range(2, total_pages + 1)]
+        try:
+            if ordered:
+                for task in tasks:
+                    yield await task
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def paginate(
+        self,
+        method: Callable[..., Awaitable[DataPortalResponse[Any]]],
+        *,
+        model_cls: type | None = None,
+        compact: bool = False,
+        numOfRows: int = 1000,
+        concurrency: int = 4,
+        ordered: bool = True,
+        **params: Any,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of every page of a paginated operation.
+
+        Example:
+            >>> async for item in client.paginate(client.getStockPriceInfo, basDt="20260205"):
+            ...     print(item.itmsNm, item.clpr)
+
+        Args:
+            method: A bound operation of this client, e.g. ``client.getStockPriceInfo``.
+            model_cls: Item model to validate into. Defaults to the response's item model.
+            compact: Yield unvalidated ``__slots__`` records (see
+                ``DataPortalResponse.records``) instead of Pydantic models.
+            numOfRows: Page size used for every request.
+            concurrency: Maximum number of page requests in flight at once.
+            ordered: Yield items in page order. If False, items are yielded page by page
+                as pages complete.
+            **params: Additional operation parameters (``basDt``, ``itmsNm``, ...).
+
+        Yields:
+            Validated items (or raw dicts for rows that fail validation), or compact
+            records if ``compact`` is True.
+        """
+        pages = self.iter_pages(
+            method, numOfRows=numOfRows, concurrency=concurrency, ordered=ordered, **params
+        )
+        try:
+            async for page in pages:
+                rows = page.records(model_cls) if compact else page.items(model_cls)
+                for item in rows:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    def _endpoint(self, method: str | Callable[..., Any]) -> tuple[str, Endpoint]:
+        name = method if isinstance(method, str) else getattr(method, "__name__", "")
+        try:
+            return name, self.endpoints[name]
+        except KeyError:
+            raise ValueError(f"{type(self).__name__} has no operation {name!r}") from None
+
+    async def stream_items(
+        self,
+        method: str | Callable[..., Awaitable[DataPortalResponse[Any]]],
+        *,
+        model_cls: type | None = None,
+        raw: bool = False,
+        numOfRows: int = 1000,
+        pageNo: int = 1,
+        **params: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of one (possibly very large) page as they arrive.
+
+        The body is parsed incrementally from the HTTP stream, so only the unparsed
+        tail and the current item are held in memory, however large ``numOfRows`` is.
+        The header ``resultCode`` is checked before the first item is yielded. Streamed
+        requests bypass the response caches and single-flight, but otherwise go through
+        the breaker, limiter, retry policy and metrics hooks like any request; a failure
+        is only retried before the first item has been yielded.
+
+        Example:
+            >>> async for item in client.stream_items(client.getStockPriceInfo, numOfRows=5000, basDt="20260205"):
+            ...     print(item.srtnCd)
+
+        Args:
+            method: An operation of this client or its name, e.g. ``"getStockPriceInfo"``.
+            model_cls: Item model. Defaults to the operation's item model.
+            raw: Yield raw dicts without validation.
+            numOfRows: Page size.
+            pageNo: Page number.
+            **params: Additional operation parameters (``basDt``, ``itmsNm``, ...).
+
+        Yields:
+            Validated items (raw dicts for rows that fail validation, or if ``raw``).
+        """
+        _, endpoint = self._endpoint(method)
+        model_cls = None if raw else (model_cls or endpoint.model)
+        params = {"resultType": "json", "numOfRows": numOfRows, "pageNo": pageNo, **params}
+        params = {k: v for k, v in params.items() if v is not None}
+
+        url = endpoint.url
+        if url.startswith("http://"):
+            url = url.replace("http://", "https://", 1)
+        query = _query(params)
+
+        policy = self.retry
+        if policy is not None:
+            policy.record_request()
+        attempt = 0
+        while True:
+            yielded = False
+            try:
+                async with aclosing(
+                    self._stream_attempt(url, params, query, attempt, model_cls)
+                ) as items:
+                    async for item in items:
+                        yielded = True
+                        yield item
+                return
+            except (httpx.RequestError, DataPortalError) as e:
+                # Items already yielded cannot be taken back, so only a failure before
+                # the first item is retried.
+                if (
+                    yielded
+                    or policy is None
+                    or not self._is_retryable(e)
+                    or not policy.allow(attempt)
+                ):
+                    raise
+                await asyncio.sleep(policy.delay(attempt, e))
+                attempt += 1
+
+    async def _stream_attempt(
+        self,
+        url: str,
+        params: dict[str, Any],
+        query: str,
+        attempt: int,
+        model_cls: type | None,
+    ) -> AsyncIterator[Any]:
+        """``_attempt`` for a streamed page: one request, its items as they are parsed.
+
+        The latency fed to the limiter and the event's ``network`` end at the response
+        headers; the event's ``body`` spans the rest of the stream, including the time
+        the caller spends between items, and ``decode`` is 0.
+        """
+        event = metrics.RequestEvent(metrics.endpoint_name(url), attempt) if metrics.hooks else None
+        tracer = metrics.ConnectTracer()
+        begin = received = time.perf_counter()
+        try:
+            with self._guard(url):
+                async with self._slot(params) as (service_key, limiter):
+                    final_url = self._build_url(url, query, service_key)
+                    start = time.perf_counter()
+                    extensions = {"trace": tracer} if event is not None else None
+                    try:
+                        async with self._client.stream(
+                            "GET", final_url, extensions=extensions
+                        ) as response:
+                            received = time.perf_counter()
+                            if event is not None:
+                                event.limiter_wait = start - begin
+                                event.network = received - start
+                                event.status = response.status_code
+                            if response.status_code != 200:
+                                await response.aread()
+                                raise DataPortalError(
+                                    f"HTTP {response.status_code}: {response.text}",
+                                    response=response,
+                                )
+                            parser = ItemStreamParser()
+                            checked = False
+                            async for chunk in response.aiter_bytes():
+                                if event is not None:
+                                    event.bytes += len(chunk)
+                                rows = parser.feed(chunk)
+                                if not checked and parser.header is not None:
+                                    _check_header(parser.header, response)
+                                    checked = True
+                                for row in rows:
+                                    yield validate_row(model_cls, row)
+                            try:
+                                rows = parser.close()
+                            except ValueError as e:
+                                raise DataPortalError(str(e), response=response) from e
+
+                            if parser.is_xml:
+                                raise _xml_service_error(parser.xml_text, response)
+                            if parser.header is None:
+                                raise DataPortalError("Response has no header", response=response)
+                            if not checked:
+                                _check_header(parser.header, response)
+                            for row in rows:
+                                yield validate_row(model_cls, row)
+                    except (httpx.RequestError, DataPortalError) as e:
+                        self._record_error(limiter, service_key, e)
+                        raise
+                    if isinstance(limiter, AdaptiveLimiter):
+                        limiter.record_success(received - start)
+        except Exception as e:
+            if event is not None:
+                event.error_code = error_code(e) or type(e).__name__
+            raise
+        finally:
+            if event is not None:
+                end = time.perf_counter()
+                event.connect = tracer.connect
+                event.body = end - received if event.status is not None else 0.0
+                event.total = end - begin
+                metrics.emit(event)
 
     async def close(self):
-        """Close the underlying HTTP client."""
-        await self._client.aclose()
+        """Close the underlying HTTP client (and its transport, unless injected)."""
+        if self.key_pool is not None:
+            self.key_pool.save()
+        if self._owns_transport:
+            await self._client.aclose()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
+
+
+def _copy_when_done(task: "asyncio.Future[Any]") -> "asyncio.Future[Any]":
+    """Future of a copy of ``task``'s result; cancelling it leaves ``task`` running."""
+    copied = asyncio.get_running_loop().create_future()
+
+    def done(task: "asyncio.Future[Any]") -> None:
+        if copied.cancelled():
+            return
+        if task.cancelled():
+            copied.cancel()
+        elif task.exception() is not None:
+            copied.set_exception(task.exception())
+        else:
+            copied.set_result(copy_response(task.result()))
+
+    task.add_done_callback(done)
+    return copied
+
+
+def _xml_service_error(content: str, response: httpx.Response | None) -> "ServiceError":
+    """Build a ServiceError from the portal's XML error envelope."""
+    # Simple extraction for common error patterns
+    msg_match = _XML_MSG.search(content)
+    code_match = _XML_CODE.search(content)
+
+    msg = msg_match.group(2) if msg_match else "Unknown Service Error"
+    code = code_match.group(2) if code_match else "UNKNOWN"
+
+    return ServiceError(f"API Error ({code}): {msg}", code=code, response=response)
+
+
+def _unrecognized_body_error(content: str, response: httpx.Response) -> DataPortalError:
+    if "<errMsg>" in content or "SERVICE_TIMEOUT" in content:
+        return ServiceError(f"Service Error Detected: {content}", response=response)
+    return DataPortalError("Invalid JSON response and not recognized XML error", response=response)
+
+
+def _check_header(header: dict[str, Any], response: httpx.Response) -> None:
+    code = header.get("resultCode", "00")
+    if code != "00":
+        msg = header.get("resultMsg", "")
+        raise ServiceError(f"API Error ({code}): {msg}", code=code, response=response)
+
+
+def _query(params: dict[str, Any]) -> str:
+    """Query string of ``params`` without ``serviceKey``, which ``_build_url`` adds."""
+    return "&".join([f"{k}={v}" for k, v in params.items() if k != "serviceKey"])
+
+
+def validate_row(model_cls: type | None, row: Any) -> Any:
+    """``row`` validated as ``model_cls``, or unchanged if it is not a valid dict."""
+    if model_cls is None or not isinstance(row, dict):
+        return row
+    try:
+        return model_cls.model_validate(row)
+    except ValidationError:
+        return row
+
+
+def total_count(response: DataPortalResponse[Any]) -> int:
+    """``totalCount`` of a response body (0 if missing)."""
+    body = response.response.body
+    if isinstance(body, dict):
+        return int(body.get("totalCount") or 0)
+    return int(getattr(body, "totalCount", 0) or 0)
+
+
+def page_count(response: DataPortalResponse[Any], numOfRows: int) -> int:
+    """Number of pages needed to cover ``totalCount`` with pages of ``numOfRows``."""
+    total = total_count(response)
+    if total <= 0 or numOfRows <= 0:
+        return 1
+    return -(-total // numOfRows)
@@ -0,0 +1,130 @@
+"""Result codes of the KR Public Data Portal and their classification.
+
+The gateway reports errors as ``returnReasonCode`` in an XML envelope and services
+report them as ``resultCode`` in the JSON header. Both use the same numbering,
+sometimes zero-padded (``"22"`` / ``"05"``).
+"""
+
+import httpx
+
+NORMAL_SERVICE = "0"
+APPLICATION_ERROR = "1"
+DB_ERROR = "2"
+NODATA_ERROR = "3"
+HTTP_ERROR = "4"
+SERVICE_TIMEOUT_ERROR = "5"
+INVALID_REQUEST_PARAMETER_ERROR = "10"
+NO_MANDATORY_REQUEST_PARAMETERS_ERROR = "11"
+NO_OPENAPI_SERVICE_ERROR = "12"
+SERVICE_ACCESS_DENIED_ERROR = "20"
+TEMPORARILY_DISABLE_THE_SERVICEKEY_ERROR = "21"
+LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR = "22"
+SERVICE_KEY_IS_NOT_REGISTERED_ERROR = "30"
+DEADLINE_HAS_EXPIRED_ERROR = "31"
+UNREGISTERED_IP_ERROR = "32"
+UNSIGNED_CALL_ERROR = "33"
+UNKNOWN_ERROR = "99"
+
+# Error names as they appear in messages, for errors that carry no numeric code.
+_NAMES = {
+    "SERVICE_TIMEOUT": SERVICE_TIMEOUT_ERROR,
+    "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS": LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR,
+    "SERVICE_KEY_IS_NOT_REGISTERED": SERVICE_KEY_IS_NOT_REGISTERED_ERROR,
+    "INVALID_SERVICE_KEY": SERVICE_KEY_IS_NOT_REGISTERED_ERROR,
+    "TEMPORARILY_DISABLE_THE_SERVICEKEY": TEMPORARILY_DISABLE_THE_SERVICEKEY_ERROR,
+    "DEADLINE_HAS_EXPIRED": DEADLINE_HAS_EXPIRED_ERROR,
+    "SERVICE_ACCESS_DENIED": SERVICE_ACCESS_DENIED_ERROR,
+    "UNREGISTERED_IP": UNREGISTERED_IP_ERROR,
+}
+
+# The portal is overloaded or the caller is over its traffic allowance.
+THROTTLING_CODES = frozenset(
+    [SERVICE_TIMEOUT_ERROR, LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR]
+)
+
+# The service key itself is unusable: unknown, expired, disabled or not allowed.
+KEY_ERROR_CODES = frozenset(
+    [
+        SERVICE_ACCESS_DENIED_ERROR,
+        TEMPORARILY_DISABLE_THE_SERVICEKEY_ERROR,
+        SERVICE_KEY_IS_NOT_REGISTERED_ERROR,
+        DEADLINE_HAS_EXPIRED_ERROR,
+        UNREGISTERED_IP_ERROR,
+    ]
+)
+
+# HTTP statuses that signal overload.
+THROTTLING_STATUSES = frozenset([429, 503])
+
+# Failures on the portal's side that usually clear up on their own.
+RETRYABLE_CODES = frozenset(
+    [APPLICATION_ERROR, DB_ERROR, HTTP_ERROR, SERVICE_TIMEOUT_ERROR, UNKNOWN_ERROR]
+)
+RETRYABLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Transport failures worth retrying; invalid URLs, proxies or redirect loops are not.
+RETRYABLE_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+def normalize_code(code: str | None) -> str | None:
+    """``"05"`` -> ``"5"``, ``"00"`` -> ``"0"``; non-numeric codes are returned as-is."""
+    if code is None:
+        return None
+    code = code.strip()
+    if code.isdigit():
+        return str(int(code))
+    return code
+
+
+def error_code(error: BaseException) -> str | None:
+    """Normalized portal code of an error, falling back to error names in its message."""
+    code = normalize_code(getattr(error, "code", None))
+    if code is not None and code != "UNKNOWN":
+        return code
+    message = str(error)
+    for name, value in _NAMES.items():
+        if name in message:
+            return value
+    return code
+
+
+def status_code(error: BaseException) -> int | None:
+    """HTTP status of the response attached to an error, if any."""
+    response = getattr(error, "response", None)
+    return response.status_code if isinstance(response, httpx.Response) else None
+
+
+def is_throttling(error: BaseException) -> bool:
+    """True if ``error`` means the portal wants callers to slow down.
+
+    Covers ``SERVICE_TIMEOUT`` and traffic-exceeded codes, HTTP 429/503 and client
+    timeouts.
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return True
+    if status_code(error) in THROTTLING_STATUSES:
+        return True
+    return error_code(error) in THROTTLING_CODES
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True if ``error`` is transient, so the same request may succeed when retried.
+
+    Parameter errors, missing data and key or quota errors are permanent.
+    """
+    if isinstance(error, RETRYABLE_EXCEPTIONS):
+        return True
+    status = status_code(error)
+    if status is not None and status != 200:
+        return status in RETRYABLE_STATUSES
+    return error_code(error) in RETRYABLE_CODES
+
+
+def is_key_error(error: BaseException) -> bool:
+    """True if ``error`` means the service key used cannot make requests."""
+    return error_code(error) in KEY_ERROR_CODES
+
+
+def is_quota_exceeded(error: BaseException) -> bool:
+    """True if ``error`` means the service key is out of its daily traffic quota."""
+    return error_code(error) == LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
@@ -0,0 +1,263 @@
+import sys
+from array import array
+from collections.abc import AsyncIterable, Iterable, Sequence
+from datetime import date
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from .models.compact import INTERNED_FIELDS
+
+if TYPE_CHECKING:
+    from .models.base import DataPortalResponse
+
+# Numeric fields shared by the price item models in models/financial_services.py.
+# The portal returns every value as a string; these are parsed into machine types.
+INT_FIELDS = frozenset(
+    ["clpr", "vs", "mkp", "hipr", "lopr", "trqu", "trPrc", "lstgStCnt", "mrktTotAmt"]
+)
+FLOAT_FIELDS = frozenset(["fltRt"])
+DATE_FIELDS = frozenset(["basDt"])
+
+# numpy's NaT is the minimum int64; storing it lets missing dates survive to_numpy().
+NAT = -(2**63)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def column_kind(field: str) -> str:
+    """Storage kind of a field: ``"int"``, ``"float"``, ``"date"`` or ``"str"``."""
+    if field in INT_FIELDS:
+        return "int"
+    if field in FLOAT_FIELDS:
+        return "float"
+    if field in DATE_FIELDS:
+        return "date"
+    return "str"
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+# array() fills from a list in one step but from an iterator item by item, so the
+# parsed values are collected into a list first.
+
+
+def _int_column(values: list[Any]) -> tuple[array, list[int]]:
+    """int64 column of ``values`` and the positions of missing ones (stored as 0)."""
+    try:
+        return array("q", list(map(int, values))), []
+    except (TypeError, ValueError):
+        parsed = list(map(_to_int, values))
+        missing = [i for i, value in enumerate(parsed) if value is None]
+        for i in missing:
+            parsed[i] = 0
+        return array("q", parsed), missing
+
+
+def _float_column(values: list[Any]) -> array:
+    try:
+        return array("d", list(map(float, values)))
+    except (TypeError, ValueError):
+        return array("d", list(map(_to_float, values)))
+
+
+def _date_column(values: list[Any]) -> array:
+    # A page almost always holds a handful of distinct dates, so parse each once.
+    days: dict[Any, int] = {}
+    for value in set(values):
+        try:
+            s = str(value)
+            days[value] = date(int(s[:4]), int(s[4:6]), int(s[6:8])).toordinal() - _EPOCH_ORDINAL
+        except (TypeError, ValueError):
+            days[value] = NAT
+    return array("q", list(map(days.__getitem__, values)))
+
+
+def _interned_column(values: list[Any]) -> list[Any]:
+    intern = sys.intern
+    try:
+        return list(map(intern, values))
+    except TypeError:
+        return [intern(v) if v.__class__ is str else v for v in values]
+
+
+_BUILDERS = {"float": _float_column, "date": _date_column, "str": list}
+
+
+def require(module: str, extra: str) -> Any:
+    """Import optional ``module``, or explain which extra installs it."""
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{module} is required for this conversion. "
+            f"Install it with: pip install 'kr-data-portal-client[{extra}]'"
+        ) from e
+
+
+class PriceFrame:
+    """Column-oriented price rows.
+
+    Numeric fields are stored as int64 (``clpr``, ``trqu``, ...) or float64 (``fltRt``)
+    arrays, ``basDt`` as int64 days since the epoch and text fields as lists of strings
+    (repeating codes and names interned).
+    Rows are read straight from the decoded JSON, so no per-row model objects are
+    created. Missing or unparsable floats become NaN and dates NaT. Missing integers
+    are stored as 0 and their positions kept in ``nulls``; ``to_arrow`` and
+    ``to_pandas`` turn them into nulls, as ``ParquetSink`` writes them.
+
+    Example:
+        >>> frame = await PriceFrame.from_pages(client.iter_pages(client.getStockPriceInfo, basDt="20260205"))
+        >>> arrays = frame.to_numpy()
+        >>> arrays["clpr"].dtype
+        dtype('int64')
+    """
+
+    def __init__(
+        self, columns: dict[str, array | list[Any]], nulls: dict[str, list[int]] | None = None
+    ):
+        self.columns = columns
+        # Row positions of missing values, per int column that has any.
+        self.nulls = nulls or {}
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], fields: Sequence[str] | None = None
+    ) -> "PriceFrame":
+        """Build a frame from raw item dicts."""
+        rows = [row for row in rows if isinstance(row, dict)]
+        if fields is None:
+            fields = list(rows[0]) if rows else []
+        columns = {}
+        nulls = {}
+        for field in fields:
+            try:
+                values = list(map(itemgetter(field), rows))
+            except KeyError:
+                values = [row.get(field) for row in rows]
+            kind = column_kind(field)
+            if kind == "int":
+                columns[field], missing = _int_column(values)
+                if missing:
+                    nulls[field] = missing
+            elif kind == "str" and field in INTERNED_FIELDS:
+                columns[field] = _interned_column(values)
+            else:
+                columns[field] = _BUILDERS[kind](values)
+        return cls(columns, nulls)
+
+    @classmethod
+    async def from_pages(
+        cls,
+        pages: AsyncIterable["DataPortalResponse[Any]"],
+        fields: Sequence[str] | None = None,
+    ) -> "PriceFrame":
+        """Build a frame from a stream of pages, e.g. ``client.iter_pages(...)``."""
+        frame = None
+        async for page in pages:
+            part = page.columns(fields)
+            if frame is None:
+                frame, fields = part, list(part.columns)
+            else:
+                frame.extend(part)
+        return frame or cls({})
+
+    @classmethod
+    def concat(cls, frames: Iterable["PriceFrame"]) -> "PriceFrame":
+        """Concatenate frames with the same columns."""
+        result = None
+        for frame in frames:
+            if result is None:
+                result = cls(
+                    {name: col[:] for name, col in frame.columns.items()},
+                    {name: rows[:] for name, rows in frame.nulls.items()},
+                )
+            else:
+                result.extend(frame)
+        return result or cls({})
+
+    def extend(self, other: "PriceFrame") -> None:
+        """Append the rows of ``other`` in place."""
+        offset = len(self)
+        for name, rows in other.nulls.items():
+            self.nulls.setdefault(name, []).extend(offset + i for i in rows)
+        for name, col in self.columns.items():
+            col.extend(other.columns[name])
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, field: str) -> array | list[Any]:
+        return self.columns[field]
+
+    def __repr__(self) -> str:
+        return f"PriceFrame(rows={len(self)}, columns={list(self.columns)})"
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Columns as numpy arrays.
+
+        Dates become ``datetime64[D]`` and text ``object`` arrays. Numeric and date
+        columns are zero-copy views of the frame's buffers, so the frame cannot be
+        extended while they are alive. int64 has no null, so missing integers are 0
+        here; see ``nulls``. Requires ``numpy``.
+        """
+        np = require("numpy", "numpy")
+        result = {}
+        for name, col in self.columns.items():
+            kind = column_kind(name)
+            if kind == "int":
+                result[name] = np.frombuffer(col, dtype=np.int64)
+            elif kind == "float":
+                result[name] = np.frombuffer(col, dtype=np.float64)
+            elif kind == "date":
+                result[name] = np.frombuffer(col, dtype=np.int64).view("datetime64[D]")
+            else:
+                result[name] = np.array(col, dtype=object)
+        return result
+
+    def _null_mask(self, name: str) -> Any:
+        np = require("numpy", "numpy")
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.nulls[name]] = True
+        return mask
+
+    def to_arrow(self) -> Any:
+        """Columns as a ``pyarrow.Table``, missing numbers and dates as nulls.
+
+        Requires ``pyarrow`` and ``numpy``.
+        """
+        pa = require("pyarrow", "arrow")
+        columns = {}
+        for name, arr in self.to_numpy().items():
+            if arr.dtype == object:
+                columns[name] = pa.array(arr, type=pa.string())
+            elif name in self.nulls:
+                columns[name] = pa.array(arr, mask=self._null_mask(name))
+            else:
+                # from_pandas turns NaN and NaT into nulls.
+                columns[name] = pa.array(arr, from_pandas=True)
+        return pa.table(columns)
+
+    def to_pandas(self) -> Any:
+        """Columns as a ``pandas.DataFrame``. Requires ``pandas``.
+
+        Int columns with missing values become nullable ``Int64`` columns.
+        """
+        pd = require("pandas", "pandas")
+        arrays = self.to_numpy()
+        for name in self.nulls:
+            arrays[name] = pd.arrays.IntegerArray(arrays[name], self._null_mask(name))
+        return pd.DataFrame(arrays, copy=False)
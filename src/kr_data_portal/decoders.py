@@ -0,0 +1,58 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+JsonLoads = Callable[[bytes], Any]
+
+
+def _stdlib_loads(content: bytes) -> Any:
+    return json.loads(content)
+
+
+def _orjson_loads() -> JsonLoads | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def _msgspec_loads() -> JsonLoads | None:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    decode = msgspec.json.decode
+
+    def loads(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            # Callers treat ValueError as "not JSON", like json and orjson raise.
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+def default_json_loads() -> JsonLoads:
+    """The fastest installed JSON decoder: orjson, then msgspec, then the stdlib."""
+    return _orjson_loads() or _msgspec_loads() or _stdlib_loads
+
+
+def get_json_loads(name: str) -> JsonLoads:
+    """Decoder by name: ``"orjson"``, ``"msgspec"`` or ``"json"``.
+
+    Raises:
+        ImportError: If the named decoder is not installed.
+    """
+    if name == "json":
+        return _stdlib_loads
+    factories = {"orjson": _orjson_loads, "msgspec": _msgspec_loads}
+    if name not in factories:
+        raise ValueError(f"Unknown JSON decoder {name!r}")
+    loads = factories[name]()
+    if loads is None:
+        raise ImportError(
+            f"{name} is not installed. Install it with: pip install 'kr-data-portal-client[fast]'"
+        )
+    return loads
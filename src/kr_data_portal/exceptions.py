@@ -0,0 +1,32 @@
+import httpx
+
+
+class DataPortalError(Exception):
+    """Base exception for KR Data Portal Client."""
+
+    def __init__(
+        self, message: str, code: str | None = None, response: httpx.Response | None = None
+    ):
+        self.message = message
+        self.code = code
+        self.response = response
+        super().__init__(self.message)
+
+
+class ServiceError(DataPortalError):
+    """Exception for API-level errors (e.g., SERVICE_TIMEOUT, INVALID_SERVICE_KEY)."""
+
+    pass
+
+
+class NoServiceKeyError(DataPortalError):
+    """Every key of a ``ServiceKeyPool`` is out of daily quota or out of rotation."""
+
+
+class CircuitOpenError(DataPortalError):
+    """An endpoint's circuit breaker is open, so the request was not sent."""
+
+    def __init__(self, message: str, url: str, retry_in: float):
+        super().__init__(message)
+        self.url = url
+        self.retry_in = retry_in
@@ -1,6 +1,7 @@
 from typing import Any
 
 from .client import DataPortalClient
+from .keys import ServiceKeyPool
 from .models.base import DataPortalResponse
 from .models.financial_services import (
     DerivativesPriceInfoItem,
@@ -8,6 +9,95 @@ from .models.financial_services import (
     EtnPriceInfoItem,
     StockPriceInfoItem,
 )
+from .plans import Param, RequestPlan
+
+# Response types are specialized once here rather than on every call.
+StockPriceInfoResponse = DataPortalResponse[StockPriceInfoItem]
+EtfPriceInfoResponse = DataPortalResponse[EtfPriceInfoItem]
+EtnPriceInfoResponse = DataPortalResponse[EtnPriceInfoItem]
+DerivativesPriceInfoResponse = DataPortalResponse[DerivativesPriceInfoItem]
+
+# Per-operation request plans (URL, parameters, validators), compiled at import.
+PLANS = {
+    "getStockPriceInfo": RequestPlan(
+        "getStockPriceInfo",
+        "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getStockPriceInfo",
+        StockPriceInfoItem,
+        params=(
+            Param("numOfRows", "int", 10),
+            Param("pageNo", "int", 1),
+            Param("basDt", "str"),
+            Param("itmsNm", "str"),
+            Param("crno", "str"),
+            Param("stckIssuItmsNm", "str"),
+            Param("beginBasDt", "str"),
+            Param("endBasDt", "str"),
+            Param("likeItmsNm", "str"),
+        ),
+        filters=(
+            ("beginBasDt", "basDt", "ge"),
+            ("endBasDt", "basDt", "lt"),
+            ("likeItmsNm", "itmsNm", "like"),
+        ),
+    ),
+    "getEtfPriceInfo": RequestPlan(
+        "getEtfPriceInfo",
+        "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getGetEtfPriceInfo",
+        EtfPriceInfoItem,
+        params=(
+            Param("numOfRows", "int", 10),
+            Param("pageNo", "int", 1),
+            Param("basDt", "str"),
+            Param("itmsNm", "str"),
+            Param("beginBasDt", "str"),
+            Param("endBasDt", "str"),
+            Param("likeItmsNm", "str"),
+        ),
+        filters=(
+            ("beginBasDt", "basDt", "ge"),
+            ("endBasDt", "basDt", "lt"),
+            ("likeItmsNm", "itmsNm", "like"),
+        ),
+    ),
+    "getEtnPriceInfo": RequestPlan(
+        "getEtnPriceInfo",
+        "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getGetEtnPriceInfo",
+        EtnPriceInfoItem,
+        params=(
+            Param("numOfRows", "int", 10),
+            Param("pageNo", "int", 1),
+            Param("basDt", "str"),
+            Param("itmsNm", "str"),
+            Param("beginBasDt", "str"),
+            Param("endBasDt", "str"),
+            Param("likeItmsNm", "str"),
+        ),
+        filters=(
+            ("beginBasDt", "basDt", "ge"),
+            ("endBasDt", "basDt", "lt"),
+            ("likeItmsNm", "itmsNm", "like"),
+        ),
+    ),
+    "getDerivativesPriceInfo": RequestPlan(
+        "getDerivativesPriceInfo",
+        "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getGetDerivativesPriceInfo",
+        DerivativesPriceInfoItem,
+        params=(
+            Param("numOfRows", "int", 10),
+            Param("pageNo", "int", 1),
+            Param("basDt", "str"),
+            Param("itmsNm", "str"),
+            Param("beginBasDt", "str"),
+            Param("endBasDt", "str"),
+            Param("likeItmsNm", "str"),
+        ),
+        filters=(
+            ("beginBasDt", "basDt", "ge"),
+            ("endBasDt", "basDt", "lt"),
+            ("likeItmsNm", "itmsNm", "like"),
+        ),
+    ),
+}
 
 
 class FinancialClient(DataPortalClient):
@@ -16,13 +106,16 @@ class FinancialClient(DataPortalClient):
     Base URL: https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService
     """
 
+    endpoints = {name: plan.endpoint for name, plan in PLANS.items()}
+
     def __init__(
         self,
-        service_key: str,
+        service_key: str | ServiceKeyPool,
         requests_per_second: float = 10.0,
         timeout: float = 30.0,
         use_retry: bool = False,
         max_retries: int = 3,
+        **kwargs: Any,
     ):
         super().__init__(
             service_key=service_key,
@@ -30,6 +123,7 @@ class FinancialClient(DataPortalClient):
             timeout=timeout,
             use_retry=use_retry,
             max_retries=max_retries,
+            **kwargs,
         )
 
     async def getStockPriceInfo(
@@ -40,8 +134,11 @@ class FinancialClient(DataPortalClient):
         itmsNm: str = None,
         crno: str = None,
         stckIssuItmsNm: str = None,
+        beginBasDt: str = None,
+        endBasDt: str = None,
+        likeItmsNm: str = None,
         **kwargs: Any,
-    ) -> DataPortalResponse[StockPriceInfoItem]:
+    ) -> StockPriceInfoResponse:
         """주식시세정보를 조회하는 서비스입니다.
 
         Data Update Policy:
@@ -55,27 +152,29 @@ class FinancialClient(DataPortalClient):
             itmsNm (str): 종목명
             crno (str): 법인등록번호
             stckIssuItmsNm (str): 주식발행종목명
+            beginBasDt (str): 기준일자가 검색값보다 크거나 같은 데이터를 검색 (YYYYMMDD)
+            endBasDt (str): 기준일자가 검색값보다 작은 데이터를 검색 (YYYYMMDD)
+            likeItmsNm (str): 종목명이 검색값을 포함하는 데이터를 검색
             **kwargs: Additional request parameters.
 
         Returns:
-            DataPortalResponse[StockPriceInfoItem]: The API response.
+            StockPriceInfoResponse: The API response.
         """
-        params = {
-            "resultType": "json",
-            "numOfRows": numOfRows,
-            "pageNo": pageNo,
-            "basDt": basDt,
-            "itmsNm": itmsNm,
-            "crno": crno,
-            "stckIssuItmsNm": stckIssuItmsNm,
-        }
-        params.update(kwargs)
-
-        data = await self._request(
-            "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getStockPriceInfo",
-            params={k: v for k, v in params.items() if v is not None},
+        return await self._call(
+            PLANS["getStockPriceInfo"],
+            {
+                "numOfRows": numOfRows,
+                "pageNo": pageNo,
+                "basDt": basDt,
+                "itmsNm": itmsNm,
+                "crno": crno,
+                "stckIssuItmsNm": stckIssuItmsNm,
+                "beginBasDt": beginBasDt,
+                "endBasDt": endBasDt,
+                "likeItmsNm": likeItmsNm,
+                **kwargs,
+            },
         )
-        return DataPortalResponse[StockPriceInfoItem].model_validate(data)
 
     async def getEtfPriceInfo(
         self,
@@ -83,34 +182,43 @@ class FinancialClient(DataPortalClient):
         pageNo: int = 1,
         basDt: str = None,
         itmsNm: str = None,
+        beginBasDt: str = None,
+        endBasDt: str = None,
+        likeItmsNm: str = None,
         **kwargs: Any,
-    ) -> DataPortalResponse[EtfPriceInfoItem]:
+    ) -> EtfPriceInfoResponse:
         """ETF시세정보를 조회하는 서비스입니다.
 
+        Data Update Policy:
+        - Cycle: Daily
+        - Timing: After market close (16:00 KST)
+
         Args:
             numOfRows (int): No description
             pageNo (int): No description
             basDt (str): No description
             itmsNm (str): No description
+            beginBasDt (str): basDt greater than or equal to the value
+            endBasDt (str): basDt less than the value
+            likeItmsNm (str): itmsNm containing the value
             **kwargs: Additional request parameters.
 
         Returns:
-            DataPortalResponse[EtfPriceInfoItem]: The API response.
+            EtfPriceInfoResponse: The API response.
         """
-        params = {
-            "resultType": "json",
-            "numOfRows": numOfRows,
-            "pageNo": pageNo,
-            "basDt": basDt,
-            "itmsNm": itmsNm,
-        }
-        params.update(kwargs)
-
-        data = await self._request(
-            "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getGetEtfPriceInfo",
-            params={k: v for k, v in params.items() if v is not None},
+        return await self._call(
+            PLANS["getEtfPriceInfo"],
+            {
+                "numOfRows": numOfRows,
+                "pageNo": pageNo,
+                "basDt": basDt,
+                "itmsNm": itmsNm,
+                "beginBasDt": beginBasDt,
+                "endBasDt": endBasDt,
+                "likeItmsNm": likeItmsNm,
+                **kwargs,
+            },
         )
-        return DataPortalResponse[EtfPriceInfoItem].model_validate(data)
 
     async def getEtnPriceInfo(
         self,
@@ -118,34 +226,43 @@ class FinancialClient(DataPortalClient):
         pageNo: int = 1,
         basDt: str = None,
         itmsNm: str = None,
+        beginBasDt: str = None,
+        endBasDt: str = None,
+        likeItmsNm: str = None,
         **kwargs: Any,
-    ) -> DataPortalResponse[EtnPriceInfoItem]:
+    ) -> EtnPriceInfoResponse:
         """ETN시세정보를 조회하는 서비스입니다.
 
+        Data Update Policy:
+        - Cycle: Daily
+        - Timing: After market close (16:00 KST)
+
         Args:
             numOfRows (int): No description
             pageNo (int): No description
             basDt (str): No description
             itmsNm (str): No description
+            beginBasDt (str): basDt greater than or equal to the value
+            endBasDt (str): basDt less than the value
+            likeItmsNm (str): itmsNm containing the value
             **kwargs: Additional request parameters.
 
         Returns:
-            DataPortalResponse[EtnPriceInfoItem]: The API response.
+            EtnPriceInfoResponse: The API response.
         """
-        params = {
-            "resultType": "json",
-            "numOfRows": numOfRows,
-            "pageNo": pageNo,
-            "basDt": basDt,
-            "itmsNm": itmsNm,
-        }
-        params.update(kwargs)
-
-        data = await self._request(
-            "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getGetEtnPriceInfo",
-            params={k: v for k, v in params.items() if v is not None},
+        return await self._call(
+            PLANS["getEtnPriceInfo"],
+            {
+                "numOfRows": numOfRows,
+                "pageNo": pageNo,
+                "basDt": basDt,
+                "itmsNm": itmsNm,
+                "beginBasDt": beginBasDt,
+                "endBasDt": endBasDt,
+                "likeItmsNm": likeItmsNm,
+                **kwargs,
+            },
         )
-        return DataPortalResponse[EtnPriceInfoItem].model_validate(data)
 
     async def getDerivativesPriceInfo(
         self,
@@ -153,31 +270,40 @@ class FinancialClient(DataPortalClient):
         pageNo: int = 1,
         basDt: str = None,
         itmsNm: str = None,
+        beginBasDt: str = None,
+        endBasDt: str = None,
+        likeItmsNm: str = None,
         **kwargs: Any,
-    ) -> DataPortalResponse[DerivativesPriceInfoItem]:
+    ) -> DerivativesPriceInfoResponse:
         """파생상품시세정보를 조회하는 서비스입니다.
 
+        Data Update Policy:
+        - Cycle: Daily
+        - Timing: After market close (16:00 KST)
+
         Args:
             numOfRows (int): No description
             pageNo (int): No description
             basDt (str): No description
             itmsNm (str): No description
+            beginBasDt (str): basDt greater than or equal to the value
+            endBasDt (str): basDt less than the value
+            likeItmsNm (str): itmsNm containing the value
             **kwargs: Additional request parameters.
 
         Returns:
-            DataPortalResponse[DerivativesPriceInfoItem]: The API response.
+            DerivativesPriceInfoResponse: The API response.
         """
-        params = {
-            "resultType": "json",
-            "numOfRows": numOfRows,
-            "pageNo": pageNo,
-            "basDt": basDt,
-            "itmsNm": itmsNm,
-        }
-        params.update(kwargs)
-
-        data = await self._request(
-            "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getGetDerivativesPriceInfo",
-            params={k: v for k, v in params.items() if v is not None},
+        return await self._call(
+            PLANS["getDerivativesPriceInfo"],
+            {
+                "numOfRows": numOfRows,
+                "pageNo": pageNo,
+                "basDt": basDt,
+                "itmsNm": itmsNm,
+                "beginBasDt": beginBasDt,
+                "endBasDt": endBasDt,
+                "likeItmsNm": likeItmsNm,
+                **kwargs,
+            },
         )
-        return DataPortalResponse[DerivativesPriceInfoItem].model_validate(data)
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aiolimiter import AsyncLimiter
+
+from .cache import KST
+from .codes import is_key_error, is_quota_exceeded
+from .exceptions import NoServiceKeyError
+from .ratelimit import AdaptiveLimiter
+
+# Development keys on data.go.kr are granted 10,000 calls per day for each operation.
+# The pool counts every call of a key against a single limit, whatever the operation,
+# which is conservative for keys used on several operations.
+DEFAULT_DAILY_LIMIT = 10_000
+
+
+def fingerprint(key: str) -> str:
+    """Short stable identifier of a key, safe to log and persist."""
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+class KeyState:
+    """Usage and limiter of one key in a ``ServiceKeyPool``."""
+
+    def __init__(self, key: str, limiter: AsyncLimiter | AdaptiveLimiter):
+        self.key = key
+        self.fingerprint = fingerprint(key)
+        self.limiter = limiter
+        self.used = 0
+        self.inflight = 0
+        self.disabled: str | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"KeyState({self.fingerprint}, used={self.used}, inflight={self.inflight}, "
+            f"disabled={self.disabled!r})"
+        )
+
+
+class ServiceKeyPool:
+    """Several service keys used in rotation, each with its own rate and daily quota.
+
+    Every key has its own limiter, so aggregate throughput grows with the number of
+    keys. Each request goes to the key with the fewest requests in flight (then the
+    fewest calls today) among those with quota left. Calls are counted per key and the
+    counts reset at midnight KST, the portal's day boundary.
+
+    Keys that fail with a key error (not registered, expired, disabled, unregistered
+    IP) are taken out of rotation; keys that report the traffic quota exceeded are
+    out until the next day.
+
+    Example:
+        >>> pool = ServiceKeyPool([key1, key2, key3], requests_per_second=10, path="~/.kr_data_portal/keys.json")
+        >>> client = FinancialClient(pool)
+
+    Args:
+        keys: The service keys.
+        requests_per_second: Rate of each key.
+        daily_limit: Calls allowed per key per day, across all operations.
+        path: JSON file the daily counts are persisted to, so they survive restarts.
+            Keys are stored as fingerprints, never in clear. None keeps counts in memory.
+        adaptive_rate: Give each key an ``AdaptiveLimiter`` instead of a fixed one.
+        min_requests_per_second: Lower bound of each adaptive rate.
+        max_requests_per_second: Upper bound of each adaptive rate.
+        save_interval: Minimum seconds between writes of ``path``.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        requests_per_second: float = 10.0,
+        daily_limit: int = DEFAULT_DAILY_LIMIT,
+        path: str | Path | None = None,
+        adaptive_rate: bool = False,
+        min_requests_per_second: float = 1.0,
+        max_requests_per_second: float | None = None,
+        save_interval: float = 5.0,
+    ):
+        if not keys:
+            raise ValueError("ServiceKeyPool needs at least one key")
+        self.daily_limit = daily_limit
+        self.path = Path(path).expanduser() if path is not None else None
+        self.save_interval = save_interval
+
+        def limiter() -> AsyncLimiter | AdaptiveLimiter:
+            if adaptive_rate:
+                return AdaptiveLimiter(
+                    requests_per_second,
+                    min_rate=min_requests_per_second,
+                    max_rate=max_requests_per_second,
+                )
+            return AsyncLimiter(requests_per_second, 1)
+
+        self._states = {key: KeyState(key, limiter()) for key in dict.fromkeys(keys)}
+        self._day = self._today()
+        self._saved = 0.0
+        self._load()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(KST).strftime("%Y%m%d")
+
+    @property
+    def states(self) -> list[KeyState]:
+        """State of every key, including those out of rotation."""
+        self._roll()
+        return list(self._states.values())
+
+    @property
+    def available(self) -> list[KeyState]:
+        """Keys in rotation with quota left today."""
+        self._roll()
+        return [s for s in self._states.values() if self._usable(s)]
+
+    @property
+    def remaining(self) -> int:
+        """Calls left today across all keys in rotation."""
+        return sum(self.daily_limit - s.used for s in self.available)
+
+    @property
+    def rate(self) -> float:
+        """Combined rate of the keys in rotation, in requests per second."""
+        return sum(_rate(s.limiter) for s in self.available)
+
+    def _usable(self, state: KeyState) -> bool:
+        return state.disabled is None and state.used < self.daily_limit
+
+    def _roll(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            for state in self._states.values():
+                state.used = 0
+                if state.disabled == "quota":
+                    state.disabled = None
+
+    def _select(self) -> KeyState:
+        candidates = self.available
+        if not candidates:
+            raise NoServiceKeyError(
+                f"No service key with quota left today ({len(self._states)} keys in pool)"
+            )
+        return min(candidates, key=lambda s: (s.inflight, s.used))
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[KeyState]:
+        """Reserve the least-loaded key and wait for its limiter.
+
+        The key counts as in flight until the block exits, so the request should be
+        sent inside it.
+
+        Raises:
+            NoServiceKeyError: If no key has quota left.
+        """
+        state = self._select()
+        state.inflight += 1
+        try:
+            async with state.limiter:
+                # The quota may have run out while waiting for the limiter.
+                if not self._usable(state):
+                    raise NoServiceKeyError(f"Service key {state.fingerprint} ran out of quota")
+                state.used += 1
+                self._maybe_save()
+            yield state
+        finally:
+            state.inflight -= 1
+
+    def report(self, key: str, error: BaseException) -> None:
+        """Take ``key`` out of rotation if ``error`` shows it is invalid or over quota."""
+        state = self._states.get(key)
+        if state is None:
+            return
+        if is_key_error(error):
+            state.disabled = "invalid"
+        elif is_quota_exceeded(error):
+            state.disabled = "quota"
+            state.used = max(state.used, self.daily_limit)
+            self.save()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("day") != self._day:
+            return
+        used: dict[str, int] = data.get("used", {})
+        for state in self._states.values():
+            state.used = int(used.get(state.fingerprint, 0))
+
+    def _maybe_save(self) -> None:
+        if self.path is not None and time.monotonic() - self._saved >= self.save_interval:
+            self.save()
+
+    def save(self) -> None:
+        """Write today's counts to ``path`` (atomically)."""
+        if self.path is None:
+            return
+        self._roll()
+        data: dict[str, Any] = {"day": self._day, "used": {}}
+        if self.path.exists():
+            # Keep the counts of keys used by other pools sharing the file.
+            try:
+                previous = json.loads(self.path.read_text())
+                if previous.get("day") == self._day:
+                    data["used"].update(previous.get("used", {}))
+            except (OSError, ValueError):
+                pass
+        data["used"].update({s.fingerprint: s.used for s in self._states.values()})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data))
+        tmp.replace(self.path)
+        self._saved = time.monotonic()
+
+
+def _rate(limiter: AsyncLimiter | AdaptiveLimiter) -> float:
+    if isinstance(limiter, AdaptiveLimiter):
+        return limiter.rate
+    return limiter.max_rate / limiter.time_period
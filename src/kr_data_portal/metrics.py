@@ -0,0 +1,275 @@
+"""Instrumentation hooks and a built-in metrics collector.
+
+Register a hook with ``add_hook``; it is called with a ``RequestEvent`` after every
+request attempt and a ``ValidationEvent`` after every batch of items is validated.
+While no hook is registered the client skips all timing, so instrumentation costs a
+single list check per request.
+
+Example:
+    >>> collector = MetricsCollector()
+    >>> add_hook(collector)
+    >>> ...
+    >>> print(collector.to_prometheus())
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+Hook = Callable[[Any], None]
+
+# Registered hooks. Checked for truthiness on the hot path.
+hooks: list[Hook] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """Call ``hook`` with every ``RequestEvent`` and ``ValidationEvent``."""
+    hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    hooks.remove(hook)
+
+
+def emit(event: Any) -> None:
+    for hook in list(hooks):
+        hook(event)
+
+
+def endpoint_name(url: str) -> str:
+    """Operation name of an endpoint URL: its last path segment."""
+    return url.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+
+
+@dataclass
+class RequestEvent:
+    """Timings and outcome of one request attempt. Durations are in seconds.
+
+    Attributes:
+        endpoint: Operation name, e.g. ``getStockPriceInfo``.
+        attempt: 0 for the first attempt, 1 for the first retry, ...
+        limiter_wait: Time waiting for the rate limiter (and service key).
+        connect: Time opening the TCP/TLS connection; 0 when a pooled connection
+            was reused.
+        network: Time from sending the request to receiving the response headers,
+            including ``connect``.
+        body: Time reading the response body.
+        decode: Time decoding the JSON and checking the header.
+        total: Time from the start of the attempt to the end of ``decode``.
+        bytes: Size of the (decompressed) response body.
+        status: HTTP status, or None if no response was received.
+        error_code: Portal result code, or the exception name, of a failed attempt.
+    """
+
+    endpoint: str
+    attempt: int = 0
+    limiter_wait: float = 0.0
+    connect: float = 0.0
+    network: float = 0.0
+    body: float = 0.0
+    decode: float = 0.0
+    total: float = 0.0
+    bytes: int = 0
+    status: int | None = None
+    error_code: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error_code is None
+
+
+@dataclass
+class ValidationEvent:
+    """Timing of validating one page of items into models."""
+
+    model: str
+    rows: int
+    errors: int
+    seconds: float
+
+
+class ConnectTracer:
+    """``trace`` extension callback measuring connection setup."""
+
+    __slots__ = ("connect", "_started")
+
+    def __init__(self):
+        self.connect = 0.0
+        self._started = 0.0
+
+    async def __call__(self, name: str, info: dict[str, Any]) -> None:
+        if not name.startswith("connection."):
+            return
+        if name.endswith(".started"):
+            self._started = time.perf_counter()
+        elif name.endswith((".complete", ".failed")):
+            self.connect += time.perf_counter() - self._started
+
+
+# Seconds; roughly logarithmic from 1 ms to 60 s.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)  # fmt: skip
+
+STAGES = ("limiter_wait", "connect", "network", "body", "decode", "total")
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile ``q``."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts, strict=False):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsCollector:
+    """Hook aggregating events into counters and per-stage latency histograms.
+
+    Everything is labelled by endpoint. Export with ``to_prometheus()`` (text
+    exposition format) or ``snapshot()`` (nested dict).
+
+    Args:
+        buckets: Histogram bucket bounds in seconds.
+        prefix: Prefix of the Prometheus metric names.
+    """
+
+    def __init__(
+        self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "kr_data_portal"
+    ):
+        self.buckets = buckets
+        self.prefix = prefix
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self.requests: dict[str, int] = {}
+        self.retries: dict[str, int] = {}
+        self.bytes: dict[str, int] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+        self.validated_rows: dict[str, int] = {}
+        self.validation_errors: dict[str, int] = {}
+
+    def __call__(self, event: Any) -> None:
+        if isinstance(event, RequestEvent):
+            self._request(event)
+        elif isinstance(event, ValidationEvent):
+            self._validation(event)
+
+    def _histogram(self, stage: str, label: str) -> Histogram:
+        key = (stage, label)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def _request(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        self.bytes[endpoint] = self.bytes.get(endpoint, 0) + event.bytes
+        if event.attempt:
+            self.retries[endpoint] = self.retries.get(endpoint, 0) + 1
+        if event.error_code is not None:
+            key = (endpoint, event.error_code)
+            self.errors[key] = self.errors.get(key, 0) + 1
+        for stage in STAGES:
+            self._histogram(stage, endpoint).observe(getattr(event, stage))
+
+    def _validation(self, event: ValidationEvent) -> None:
+        model = event.model
+        self.validated_rows[model] = self.validated_rows.get(model, 0) + event.rows
+        self.validation_errors[model] = self.validation_errors.get(model, 0) + event.errors
+        self._histogram("validate", model).observe(event.seconds)
+
+    def reset(self) -> None:
+        self.__init__(self.buckets, self.prefix)
+
+    def snapshot(self) -> dict[str, Any]:
+        """All metrics as plain dicts, with p50/p99 bucket bounds per stage."""
+        stages: dict[str, dict[str, Any]] = {}
+        for (stage, label), histogram in self.histograms.items():
+            stages.setdefault(stage, {})[label] = histogram.snapshot()
+        return {
+            "requests": dict(self.requests),
+            "retries": dict(self.retries),
+            "bytes": dict(self.bytes),
+            "errors": {f"{endpoint}:{code}": n for (endpoint, code), n in self.errors.items()},
+            "validated_rows": dict(self.validated_rows),
+            "validation_errors": dict(self.validation_errors),
+            "seconds": stages,
+        }
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        lines: list[str] = []
+
+        def counter(name: str, help_text: str, values: dict[Any, int], labels: tuple[str, ...]):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} counter")
+            for key, value in values.items():
+                key = key if isinstance(key, tuple) else (key,)
+                lines.append(f"{p}_{name}{{{_labels(zip(labels, key, strict=True))}}} {value}")
+
+        counter("requests_total", "Request attempts.", self.requests, ("endpoint",))
+        counter("retries_total", "Retried request attempts.", self.retries, ("endpoint",))
+        counter("response_bytes_total", "Response body bytes.", self.bytes, ("endpoint",))
+        counter("errors_total", "Failed attempts by code.", self.errors, ("endpoint", "code"))
+        counter("validated_rows_total", "Rows validated.", self.validated_rows, ("model",))
+        counter(
+            "validation_errors_total",
+            "Rows failing validation.",
+            self.validation_errors,
+            ("model",),
+        )
+
+        lines.append(f"# HELP {p}_stage_seconds Time spent per request stage.")
+        lines.append(f"# TYPE {p}_stage_seconds histogram")
+        for (stage, label), histogram in self.histograms.items():
+            kind = "model" if stage == "validate" else "endpoint"
+            base = _labels([("stage", stage), (kind, label)])
+            cumulative = 0
+            for bound, n in zip(histogram.buckets, histogram.counts, strict=False):
+                cumulative += n
+                lines.append(f'{p}_stage_seconds_bucket{{{base},le="{bound}"}} {cumulative}')
+            lines.append(f'{p}_stage_seconds_bucket{{{base},le="+Inf"}} {histogram.count}')
+            lines.append(f"{p}_stage_seconds_sum{{{base}}} {histogram.sum}")
+            lines.append(f"{p}_stage_seconds_count{{{base}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(pairs) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
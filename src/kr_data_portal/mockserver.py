@@ -0,0 +1,450 @@
+"""Local stand-in for the portal, built from the same spec as the generated client.
+
+``MockPortal`` serves every operation of a spec (``specs/financial_services.yaml``)
+with the portal's pagination semantics (``numOfRows``/``pageNo``/``totalCount``),
+the spec's filters (equality, or the ``filter`` of range and ``like`` parameters such as
+``beginBasDt``), synthetic or loaded rows, XML error
+envelopes and per-key throttling and daily quotas.
+
+Use it in-process through ``transport()``, or over HTTP with ``server()`` and point a
+client at it with ``LocalPortalTransport``:
+
+Example:
+    >>> portal = MockPortal.from_yaml("specs/financial_services.yaml", rate_limit=50)
+    >>> async with FinancialClient("any", transport=portal.transport()) as client:
+    ...     await client.getStockPriceInfo(basDt="20260205", numOfRows=100)
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, NamedTuple
+from xml.sax.saxutils import escape
+
+import httpx
+import yaml
+
+# Query parameters with protocol meaning; every other spec parameter is a filter.
+_CONTROL_PARAMS = frozenset(["serviceKey", "numOfRows", "pageNo", "resultType"])
+
+NORMAL_MSG = "NORMAL SERVICE."
+
+XML_ERROR = (
+    "<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+    "<returnAuthMsg>{name}</returnAuthMsg><returnReasonCode>{code}</returnReasonCode>"
+    "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+)
+
+ERROR_NAMES = {
+    "01": "APPLICATION_ERROR",
+    "02": "DB_ERROR",
+    "03": "NODATA_ERROR",
+    "04": "HTTP_ERROR",
+    "05": "SERVICE_TIMEOUT_ERROR",
+    "10": "INVALID_REQUEST_PARAMETER_ERROR",
+    "11": "NO_MANDATORY_REQUEST_PARAMETERS_ERROR",
+    "12": "NO_OPENAPI_SERVICE_ERROR",
+    "20": "SERVICE_ACCESS_DENIED_ERROR",
+    "22": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+    "30": "SERVICE_KEY_IS_NOT_REGISTERED_ERROR",
+    "31": "DEADLINE_HAS_EXPIRED_ERROR",
+    "32": "UNREGISTERED_IP_ERROR",
+    "99": "UNKNOWN_ERROR",
+}
+
+
+class Reply(NamedTuple):
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class Operation(NamedTuple):
+    """One spec service: its operation name, path and filter parameters.
+
+    ``comparisons`` maps each filter to the row field it tests and how (``eq``, ``ge``,
+    ``lt`` or ``like``).
+    """
+
+    name: str
+    path: str
+    required: frozenset[str]
+    filters: tuple[str, ...]
+    comparisons: dict[str, tuple[str, str]]
+
+
+_COMPARE: dict[str, Callable[[str, str], bool]] = {
+    "eq": lambda value, wanted: value == wanted,
+    "ge": lambda value, wanted: value >= wanted,
+    "lt": lambda value, wanted: value < wanted,
+    "like": lambda value, wanted: wanted in value,
+}
+
+DEFAULT_DAY = "20260205"
+
+
+def synthetic_row(i: int, basDt: str) -> dict[str, str]:
+    """Row ``i`` of a day, with a distinct ticker and prices that vary by day."""
+    seed = int(basDt) if basDt.isdigit() else 0
+    price = 1000 + (i * 37 + seed % 997 * 11) % 500_000
+    change = (i + seed) % 201 - 100
+    return {
+        "basDt": basDt,
+        "srtnCd": f"{i:06d}",
+        "isinCd": f"KR7{i:06d}003",
+        "itmsNm": f"종목{i}",
+        "mrktCtg": "KOSPI" if i % 3 else "KOSDAQ",
+        "clpr": str(price),
+        "vs": str(change),
+        "fltRt": f"{change / price * 100:.2f}",
+        "mkp": str(price - change),
+        "hipr": str(price + abs(change) + 300),
+        "lopr": str(price - abs(change) - 200),
+        "trqu": str(1000 + i * 13),
+        "trPrc": str((1000 + i * 13) * price),
+        "lstgStCnt": str(1_000_000 + i * 1000),
+        "mrktTotAmt": str((1_000_000 + i * 1000) * price),
+    }
+
+
+def load_rows(path: str | Path) -> list[dict[str, Any]]:
+    """Rows of a saved response (``response.body.items.item``) or a JSON list."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, list):
+        return data
+    items = data["response"]["body"]["items"]
+    if not items:
+        return []
+    item = items["item"]
+    return item if isinstance(item, list) else [item]
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.updated = time.monotonic()
+
+
+class MockPortal:
+    """Serves the operations of a spec like the portal does.
+
+    Operations without a dataset return ``total_count`` synthetic rows for any
+    ``basDt`` (each weekday of a ``basDt`` range); other filters narrow them down. Loaded datasets are
+    filtered on every spec parameter present in the request.
+
+    Args:
+        spec: Parsed spec (``info`` and ``services``), see ``from_yaml``.
+        datasets: Rows per operation name, served instead of synthetic rows.
+        total_count: Synthetic rows per ``basDt``.
+        keys: Registered service keys. ``None`` accepts any non-empty key.
+        rate_limit: Requests per second allowed per key (bursts up to one second's
+            worth); excess requests get ``throttle_code``. ``None`` disables it.
+        throttle_code: Portal code (XML envelope) or HTTP status (``"429"``)
+            returned to throttled requests.
+        daily_limit: Requests per key before answering code 22. ``None`` disables it.
+        latency: Seconds added to every response.
+        jitter: Extra uniformly random latency, in seconds.
+        error_rate: Fraction of requests answered with ``error_code``.
+        error_code: Portal code or HTTP status of injected errors.
+        seed: Seed of the error and jitter draws.
+        cache_pages: Encode each distinct page once and serve the same bytes again,
+            so serving costs no CPU (for benchmarks; ``datasets`` must not change).
+    """
+
+    def __init__(
+        self,
+        spec: dict[str, Any],
+        datasets: dict[str, list[dict[str, Any]]] | None = None,
+        total_count: int = 1000,
+        keys: Iterable[str] | None = None,
+        rate_limit: float | None = None,
+        throttle_code: str = "429",
+        daily_limit: int | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: str = "05",
+        seed: int = 0,
+        cache_pages: bool = False,
+    ):
+        self.operations: dict[str, Operation] = {}
+        for service in spec["services"]:
+            params = service.get("parameters", [])
+            filters = [p for p in params if p["name"] not in _CONTROL_PARAMS]
+            op = Operation(
+                service["name"],
+                service["path"],
+                frozenset(p["name"] for p in params if p.get("required")),
+                tuple(p["name"] for p in filters),
+                {p["name"]: (p.get("field", p["name"]), p.get("filter", "eq")) for p in filters},
+            )
+            self.operations[service["path"].strip("/")] = op
+        self.datasets = dict(datasets or {})
+        self.total_count = total_count
+        self.keys = None if keys is None else frozenset(keys)
+        self.rate_limit = rate_limit
+        self.throttle_code = throttle_code
+        self.daily_limit = daily_limit
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.used: dict[str, int] = {}
+        self._buckets: dict[str, _Bucket] = {}
+        self._injected: list[str] = []
+        self.cache_pages = cache_pages
+        self._pages: dict[tuple[Any, ...], Reply] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_yaml(cls, path: str | Path, **kwargs: Any) -> "MockPortal":
+        with open(path, encoding="utf-8") as f:
+            return cls(yaml.safe_load(f), **kwargs)
+
+    def inject(self, code: str, count: int = 1) -> None:
+        """Answer the next ``count`` requests with ``code`` (portal code or HTTP status)."""
+        with self._lock:
+            self._injected.extend([code] * count)
+
+    def delay(self) -> float:
+        """Latency of the next response."""
+        return self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def respond(self, path: str, params: dict[str, str]) -> Reply:
+        """Reply to a GET of ``path`` (full portal path or bare ``/operation``)."""
+        with self._lock:
+            self.requests += 1
+            op = self.operations.get(path.rstrip("/").rsplit("/", 1)[-1])
+            if op is None:
+                return Reply(404, {"Content-Type": "text/plain"}, b"Not Found")
+            key = params.get("serviceKey", "")
+            if not key or not self._registered(key):
+                return self._error("30")
+            missing = op.required - params.keys()
+            if missing:
+                return self._error("11")
+            if self._injected:
+                return self._error(self._injected.pop(0))
+            if not self._admit(key):
+                self.throttled += 1
+                return self._error(self.throttle_code)
+            if self.daily_limit is not None:
+                if self.used.get(key, 0) >= self.daily_limit:
+                    return self._error("22")
+                self.used[key] = self.used.get(key, 0) + 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._error(self.error_code)
+        page_key = None
+        if self.cache_pages:
+            page_key = (op.name, *sorted(i for i in params.items() if i[0] != "serviceKey"))
+            reply = self._pages.get(page_key)
+            if reply is not None:
+                return reply
+        try:
+            num_of_rows = int(params.get("numOfRows", 10))
+            page_no = int(params.get("pageNo", 1))
+            rows, total = self._page(op, params, num_of_rows, page_no)
+        except ValueError:
+            with self._lock:
+                return self._error("10")
+        if params.get("resultType", "xml").lower() == "json":
+            reply = Reply(
+                200, {"Content-Type": "application/json"}, _json(rows, num_of_rows, page_no, total)
+            )
+        else:
+            reply = Reply(
+                200, {"Content-Type": "application/xml"}, _xml(rows, num_of_rows, page_no, total)
+            )
+        if page_key is not None:
+            self._pages[page_key] = reply
+        return reply
+
+    def _registered(self, key: str) -> bool:
+        # An unencoded "+" in the key arrives decoded as a space.
+        return self.keys is None or key in self.keys or key.replace(" ", "+") in self.keys
+
+    def _admit(self, key: str) -> bool:
+        if self.rate_limit is None:
+            return True
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.rate_limit)
+        now = time.monotonic()
+        bucket.tokens = min(
+            self.rate_limit, bucket.tokens + (now - bucket.updated) * self.rate_limit
+        )
+        bucket.updated = now
+        if bucket.tokens < 1:
+            return False
+        bucket.tokens -= 1
+        return True
+
+    def _error(self, code: str) -> Reply:
+        self.errors += 1
+        if len(code) == 3:
+            headers = {"Retry-After": "1"} if code == "429" else {}
+            return Reply(int(code), headers, b"")
+        body = XML_ERROR.format(name=ERROR_NAMES.get(code, "UNKNOWN_ERROR"), code=code)
+        return Reply(200, {"Content-Type": "text/xml"}, body.encode())
+
+    def _page(
+        self, op: Operation, params: dict[str, str], num_of_rows: int, page_no: int
+    ) -> tuple[list[dict[str, Any]], int]:
+        start = max(page_no - 1, 0) * num_of_rows
+        filters = {name: params[name] for name in op.filters if params.get(name)}
+        dataset = self.datasets.get(op.name)
+        if dataset is None:
+            days = _synthetic_days(op, filters)
+            # The days already satisfy the basDt filters; only the others test rows.
+            filters = {
+                name: value for name, value in filters.items() if op.comparisons[name][0] != "basDt"
+            }
+            if not filters:
+                # Only the rows of the requested page are built.
+                total = len(days) * self.total_count
+                stop = min(start + num_of_rows, total)
+                return [
+                    synthetic_row(k % self.total_count, days[k // self.total_count])
+                    for k in range(start, stop)
+                ], total
+            dataset = (synthetic_row(i, day) for day in days for i in range(self.total_count))
+        tests = [(*op.comparisons[name], value) for name, value in filters.items()]
+        rows = [
+            row
+            for row in dataset
+            if all(_COMPARE[how](str(row.get(field) or ""), value) for field, how, value in tests)
+        ]
+        return rows[start : start + num_of_rows], len(rows)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """``httpx.MockTransport`` handler."""
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        reply = self.respond(request.url.path, dict(request.url.params))
+        return httpx.Response(reply.status, headers=reply.headers, content=reply.body)
+
+    def transport(self) -> httpx.MockTransport:
+        """In-process transport serving this portal, for ``transport=``."""
+        return httpx.MockTransport(self.handle)
+
+    def server(self, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+        """HTTP server for this portal; call ``serve_forever()`` to run it."""
+        portal = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                delay = portal.delay()
+                if delay:
+                    time.sleep(delay)
+                url = httpx.URL(self.path)
+                reply = portal.respond(url.path, dict(url.params))
+                self.send_response(reply.status)
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(reply.body)))
+                self.end_headers()
+                self.wfile.write(reply.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+class LocalPortalTransport(httpx.AsyncHTTPTransport):
+    """Transport sending every request to a local ``MockPortal`` server instead.
+
+    The scheme, host and port of each request are replaced with ``url``'s; path and
+    query are kept, so the generated clients work unchanged.
+
+    Args:
+        url: Server address, e.g. ``"http://127.0.0.1:8080"``.
+        **kwargs: Passed to ``httpx.AsyncHTTPTransport``.
+    """
+
+    def __init__(self, url: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.url = httpx.URL(url)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(
+            scheme=self.url.scheme, host=self.url.host, port=self.url.port
+        )
+        request.headers["Host"] = request.url.netloc.decode()
+        return await super().handle_async_request(request)
+
+
+def _synthetic_days(op: Operation, filters: dict[str, str]) -> list[str]:
+    """``basDt`` values of synthetic rows: the filtered day, or the weekdays of a
+    ``basDt`` range (a missing bound makes it one day wide)."""
+    begin = end = None
+    for name, value in filters.items():
+        field, how = op.comparisons[name]
+        if field != "basDt":
+            continue
+        if how == "eq":
+            return [value]
+        if how == "ge":
+            begin = _day(value)
+        elif how == "lt":
+            end = _day(value)
+    if begin is None and end is None:
+        return [DEFAULT_DAY]
+    begin = begin or end - timedelta(days=1)
+    end = end or begin + timedelta(days=1)
+    days = []
+    while begin < end:
+        if begin.weekday() < 5:
+            days.append(begin.strftime("%Y%m%d"))
+        begin += timedelta(days=1)
+    return days
+
+
+def _day(value: str) -> datetime:
+    return datetime.strptime(value, "%Y%m%d")  # noqa: DTZ007
+
+
+def _json(rows: list[dict[str, Any]], num_of_rows: int, page_no: int, total: int) -> bytes:
+    data = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": NORMAL_MSG},
+            "body": {
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": total,
+                # The portal sends an empty string rather than an empty list.
+                "items": {"item": rows} if rows else "",
+            },
+        }
+    }
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+def _xml(rows: list[dict[str, Any]], num_of_rows: int, page_no: int, total: int) -> bytes:
+    items = "".join(
+        "<item>" + "".join(f"<{k}>{escape(str(v))}</{k}>" for k, v in row.items()) + "</item>"
+        for row in rows
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?><response><header>'
+        f"<resultCode>00</resultCode><resultMsg>{NORMAL_MSG}</resultMsg></header><body>"
+        f"<numOfRows>{num_of_rows}</numOfRows><pageNo>{page_no}</pageNo>"
+        f"<totalCount>{total}</totalCount><items>{items}</items></body></response>"
+    ).encode()
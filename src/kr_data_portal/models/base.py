@@ -1,6 +1,13 @@
-from typing import Any, Generic, TypeVar
+import time
+from collections.abc import Sequence
+from functools import cache
+from typing import Any, Generic, NamedTuple, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from .. import metrics
+from ..columnar import PriceFrame
+from .compact import compact_model
 
 T = TypeVar("T")
 
@@ -27,7 +34,14 @@ class DataPortalResponse(BaseModel, Generic[T]):
 
     response: BaseResponse[T]
 
-    def items(self, model_cls: type[T]) -> list[T]:
+    @classmethod
+    def item_model(cls) -> type[T] | None:
+        """Item model this response was parameterized with, e.g. ``StockPriceInfoItem``."""
+        args = cls.__pydantic_generic_metadata__["args"]
+        return args[0] if args and isinstance(args[0], type) else None
+
+    def raw_items(self) -> list[Any]:
+        """The undecoded rows of ``response.body.items.item`` as a list."""
         body = self.response.body
         if not body:
             return []
@@ -55,18 +69,112 @@ class DataPortalResponse(BaseModel, Generic[T]):
                 raw_list = [item]
         elif isinstance(items_field, list):
             raw_list = items_field
-        
-        # 3. Final validation and conversion
-        result = []
-        for i in raw_list:
-            if isinstance(i, dict):
-                try:
-                    result.append(model_cls.model_validate(i))
-                except Exception:
-                    # If validation fails, keep as dict or skip? 
-                    # Prefer keeping raw dict if validation fails to avoid data loss
-                    result.append(i)
-            else:
-                result.append(i)
-        
-        return result
+        return raw_list
+
+    def columns(self, fields: Sequence[str] | None = None) -> PriceFrame:
+        """Convert this page straight into typed columns without per-row models.
+
+        Args:
+            fields: Columns to extract. Defaults to the item model's fields.
+        """
+        if fields is None and (model_cls := self.item_model()) is not None:
+            fields = list(model_cls.model_fields)
+        return PriceFrame.from_rows(self.raw_items(), fields)
+
+    def records(self, model_cls: type[T] | None = None) -> list[Any]:
+        """Rows of this page as compact ``__slots__`` records of ``model_cls``.
+
+        Records have the model's attributes but a fraction of its memory footprint and
+        repeating strings (``itmsNm``, ``isinCd``, ``basDt``, ...) are interned. They
+        are not validated; call ``record.to_model()`` for the full model.
+        """
+        if model_cls is None:
+            model_cls = self.item_model()
+        if model_cls is None:
+            return list(self.raw_items())
+        return compact_model(model_cls).from_rows(self.raw_items())
+
+    def items(self, model_cls: type[T] | None = None) -> list[T]:
+        """Rows of this page as ``model_cls`` instances.
+
+        Rows that fail validation are returned as raw dicts to avoid data loss; use
+        ``validate_items`` to also get the per-row errors. For ingestion that does not
+        need model objects at all, ``raw_items()`` and ``columns()`` skip them.
+
+        Args:
+            model_cls: Item model. Defaults to the model this response was
+                parameterized with.
+        """
+        return self.validate_items(model_cls).items
+
+    def validate_items(self, model_cls: type[T] | None = None) -> "ValidatedItems":
+        """Validate every row of this page in one batch.
+
+        The whole list goes through a cached ``TypeAdapter(list[model_cls])``. If some
+        rows fail, their errors are collected from the single ``ValidationError`` and
+        only the valid rows are validated again, so no exception is raised per row.
+
+        Args:
+            model_cls: Item model. Defaults to the response's item model.
+
+        Returns:
+            ValidatedItems: Items in page order (raw dicts for failed rows) and the
+            validation errors keyed by row index.
+        """
+        if model_cls is None:
+            model_cls = self.item_model()
+
+        raw_list = self.raw_items()
+        if model_cls is None or not raw_list:
+            return ValidatedItems(list(raw_list), {})
+
+        # Non-dict rows are passed through untouched.
+        positions = [i for i, row in enumerate(raw_list) if isinstance(row, dict)]
+        rows = raw_list if len(positions) == len(raw_list) else [raw_list[i] for i in positions]
+
+        if metrics.hooks:
+            start = time.perf_counter()
+            models, errors = _validate_rows(model_cls, rows)
+            metrics.emit(
+                metrics.ValidationEvent(
+                    model_cls.__name__, len(rows), len(errors), time.perf_counter() - start
+                )
+            )
+        else:
+            models, errors = _validate_rows(model_cls, rows)
+
+        if rows is raw_list:
+            return ValidatedItems(models, errors)
+        result = list(raw_list)
+        for i, model in zip(positions, models, strict=True):
+            result[i] = model
+        return ValidatedItems(result, {positions[i]: e for i, e in errors.items()})
+
+
+class ValidatedItems(NamedTuple):
+    """Result of ``DataPortalResponse.validate_items``."""
+
+    items: list[Any]
+    errors: dict[int, list[dict[str, Any]]]
+
+
+@cache
+def list_adapter(model_cls: type) -> TypeAdapter:
+    """Cached ``TypeAdapter(list[model_cls])`` used for batch validation."""
+    return TypeAdapter(list[model_cls])
+
+
+def _validate_rows(
+    model_cls: type, rows: list[dict[str, Any]]
+) -> tuple[list[Any], dict[int, list[dict[str, Any]]]]:
+    adapter = list_adapter(model_cls)
+    try:
+        return adapter.validate_python(rows), {}
+    except ValidationError as e:
+        errors: dict[int, list[dict[str, Any]]] = {}
+        for error in e.errors(include_url=False):
+            errors.setdefault(error["loc"][0], []).append(error)
+
+    # Keep failed rows as raw dicts and validate the rest in one more batch.
+    valid = iter(adapter.validate_python([r for i, r in enumerate(rows) if i not in errors]))
+    return [row if i in errors else next(valid) for i, row in enumerate(rows)], errors
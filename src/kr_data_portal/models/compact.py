@@ -0,0 +1,85 @@
+import sys
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+
+# Fields whose values repeat heavily across a result set (the same ticker on every
+# day, the same day for every ticker). Interning stores each distinct value once.
+INTERNED_FIELDS = frozenset(["basDt", "srtnCd", "isinCd", "itmsNm", "mrktCtg"])
+
+
+class CompactRecord:
+    """Base class of the ``__slots__`` records built by ``compact_model``.
+
+    A record has the same attributes as its Pydantic model but no per-instance
+    ``__dict__`` and no validation state. Values are taken from the raw rows as-is.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _interned: tuple[bool, ...] = ()
+    model: type[BaseModel]
+
+    def __init__(self, **values: Any):
+        for field in self._fields:
+            setattr(self, field, values.get(field))
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> "CompactRecord":
+        """Build a record from a raw item dict, interning repeating strings."""
+        record = cls.__new__(cls)
+        get = row.get
+        for field, interned in zip(cls._fields, cls._interned, strict=True):
+            value = get(field)
+            if interned and value.__class__ is str:
+                value = sys.intern(value)
+            setattr(record, field, value)
+        return record
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> list[Any]:
+        """Build records from raw rows; non-dict rows are passed through."""
+        from_row = cls.from_row
+        return [from_row(row) if isinstance(row, dict) else row for row in rows]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def to_model(self) -> BaseModel:
+        """Validate this record into its full Pydantic model."""
+        return self.model.model_validate(self.as_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    def __repr__(self) -> str:
+        values = " ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+@cache
+def compact_model(model_cls: type[BaseModel]) -> type[CompactRecord]:
+    """``__slots__`` record class with the fields of ``model_cls``.
+
+    Example:
+        >>> CompactStock = compact_model(StockPriceInfoItem)
+        >>> CompactStock.from_row({"itmsNm": "삼성전자", "clpr": "159300"}).clpr
+        '159300'
+    """
+    fields = tuple(model_cls.model_fields)
+    return type(
+        f"Compact{model_cls.__name__}",
+        (CompactRecord,),
+        {
+            "__slots__": fields,
+            "__module__": __name__,
+            "__doc__": f"Compact ``__slots__`` record of ``{model_cls.__name__}``.",
+            "_fields": fields,
+            "_interned": tuple(f in INTERNED_FIELDS for f in fields),
+            "model": model_cls,
+        },
+    )
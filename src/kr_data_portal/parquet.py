@@ -0,0 +1,307 @@
+"""Streaming, partitioned Parquet export of price rows.
+
+``ParquetSink`` turns pages into Arrow record batches as they arrive, so rows never
+pile up as dicts or models, and writes them to Hive-style partitions::
+
+    root/endpoint=getStockPriceInfo/basDt=2026-02-05/part-00000.parquet
+
+Columns follow the item model's fields and are typed like ``PriceFrame`` (int64
+prices and volumes, float64 ``fltRt``, strings elsewhere); unparsable numbers become
+nulls. The partition columns are encoded in the directory names only; read the tree
+back with ``read_dataset``. Requires ``pyarrow`` (``pip install
+'kr-data-portal-client[arrow]'``).
+"""
+
+from collections.abc import AsyncIterable, Iterable, Sequence
+from datetime import date
+from functools import cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .backfill import WorkUnit
+from .columnar import column_kind, require
+from .models.base import DataPortalResponse
+
+PARTITION_COLUMNS = ("endpoint", "basDt")
+
+_ARROW_TYPES = {"int": "int64", "float": "float64", "date": "date32", "str": "string"}
+
+
+def _arrow() -> tuple[Any, Any]:
+    pa = require("pyarrow", "arrow")
+    import pyarrow.compute as pc
+
+    return pa, pc
+
+
+def arrow_schema(model_cls: type | Sequence[str]) -> Any:
+    """Arrow schema of an item model's fields (or of field names), typed by
+    ``column_kind``."""
+    pa, _ = _arrow()
+    fields = list(getattr(model_cls, "model_fields", model_cls))
+    return pa.schema([(name, getattr(pa, _ARROW_TYPES[column_kind(name)])()) for name in fields])
+
+
+def partitioning() -> Any:
+    """``pyarrow.dataset`` partitioning of the directories written by ``ParquetSink``."""
+    pa, _ = _arrow()
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(
+        pa.schema([("endpoint", pa.string()), ("basDt", pa.date32())]), flavor="hive"
+    )
+
+
+def read_dataset(root: str | Path) -> Any:
+    """The exported tree as a ``pyarrow.dataset.Dataset``, partition columns included."""
+    _arrow()
+    import pyarrow.dataset as ds
+
+    return ds.dataset(root, format="parquet", partitioning=partitioning())
+
+
+def _parse_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def _parse_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _column(values: list[Any], type_: Any) -> Any:
+    """Arrow array of ``type_`` from raw string values, parsed in C where possible."""
+    pa, pc = _arrow()
+    try:
+        strings = pa.array(values, type=pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        strings = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+    if type_ == pa.string():
+        return strings
+    if type_ == pa.date32():
+        parsed = pc.strptime(strings, format="%Y%m%d", unit="s", error_is_null=True)
+        return parsed.cast(pa.date32())
+    try:
+        # Empty strings are the portal's missing values.
+        return pc.if_else(pc.equal(strings, ""), None, strings).cast(type_)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        parse = _parse_int if type_ == pa.int64() else _parse_float
+        return pa.array([parse(v) for v in values], type=type_)
+
+
+@cache
+def _data_schema(schema: Any) -> Any:
+    # Partition columns live in the directory names.
+    for name in PARTITION_COLUMNS:
+        index = schema.get_field_index(name)
+        if index >= 0:
+            schema = schema.remove(index)
+    return schema
+
+
+class _Partition:
+    __slots__ = ("directory", "batches", "nbytes", "writer", "rows")
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.batches: list[Any] = []
+        self.nbytes = 0
+        self.writer: Any = None
+        self.rows = 0
+
+
+class Written(NamedTuple):
+    """A file written by ``ParquetSink``."""
+
+    path: Path
+    rows: int
+
+
+class ParquetSink:
+    """Writes pages of any endpoint to partitioned Parquet files, incrementally.
+
+    Each partition (``endpoint``, ``basDt``) buffers record batches until they reach
+    ``row_group_bytes`` and then writes them as one row group. When all buffers
+    together exceed ``max_buffer_bytes`` the largest is flushed early, and at most
+    ``max_open_files`` files are kept open (the least recently used is closed; later
+    rows of its partition go to a new part file).
+
+    Example:
+        >>> async with ParquetSink("lake/prices") as sink:
+        ...     await sink.write_pages(client.iter_pages(client.getStockPriceInfo, basDt="20260205"))
+
+    Args:
+        root: Directory of the partition tree. Created if missing.
+        row_group_bytes: Target in-memory size of a row group.
+        max_buffer_bytes: Bound on rows buffered across all partitions.
+        max_open_files: Bound on concurrently open Parquet writers.
+        compression: Parquet codec.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        row_group_bytes: int = 32 * 1024 * 1024,
+        max_buffer_bytes: int = 256 * 1024 * 1024,
+        max_open_files: int = 64,
+        compression: str = "zstd",
+    ):
+        _arrow()
+        self.root = Path(root)
+        self.row_group_bytes = row_group_bytes
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_open_files = max(1, max_open_files)
+        self.compression = compression
+        self.files: list[Written] = []
+        self.rows = 0
+        self._schemas: dict[str, Any] = {}
+        # Insertion order doubles as least-recently-written order.
+        self._partitions: dict[tuple[str, str], _Partition] = {}
+        self._buffered = 0
+
+    def schema(self, endpoint: str) -> Any | None:
+        """Arrow schema of ``endpoint``'s rows, once known."""
+        return self._schemas.get(endpoint)
+
+    def write(
+        self,
+        endpoint: str,
+        rows: Iterable[dict[str, Any]],
+        model_cls: type | Sequence[str] | None = None,
+    ) -> int:
+        """Convert ``rows`` to typed columns and buffer them by ``basDt`` partition.
+
+        The schema of ``endpoint`` is taken from ``model_cls`` (an item model or field
+        names) on first use, or else from the first row.
+        """
+        pa, pc = _arrow()
+        rows = [row for row in rows if isinstance(row, dict)]
+        if not rows:
+            return 0
+        schema = self._schemas.get(endpoint)
+        if schema is None:
+            schema = self._schemas[endpoint] = arrow_schema(model_cls or list(rows[0]))
+        data_schema = _data_schema(schema)
+        batch = pa.RecordBatch.from_arrays(
+            [_column([row.get(f.name) for row in rows], f.type) for f in data_schema],
+            schema=data_schema,
+        )
+        days = [row.get("basDt") for row in rows]
+        first = days[0]
+        if all(day == first for day in days):
+            self._buffer(endpoint, first, batch)
+        else:
+            keys = pa.array([str(d) for d in days], type=pa.string())
+            for day in dict.fromkeys(days):
+                self._buffer(endpoint, day, batch.filter(pc.equal(keys, str(day))))
+        self.rows += len(rows)
+        return len(rows)
+
+    def write_page(self, endpoint: str, page: DataPortalResponse[Any]) -> int:
+        return self.write(endpoint, page.raw_items(), page.item_model())
+
+    async def write_pages(
+        self, pages: AsyncIterable[DataPortalResponse[Any]], endpoint: str | None = None
+    ) -> int:
+        """Write a stream of pages, e.g. ``client.iter_pages(...)``.
+
+        ``endpoint`` defaults to the name of each page's item model's operation
+        (``StockPriceInfoItem`` -> ``getStockPriceInfo``).
+        """
+        rows = 0
+        async for page in pages:
+            rows += self.write_page(endpoint or _endpoint_of(page), page)
+        return rows
+
+    def sink(self, unit: WorkUnit, response: DataPortalResponse[Any]) -> None:
+        """``Backfill`` sink exporting every fetched page."""
+        self.write_page(unit.endpoint, response)
+
+    def _buffer(self, endpoint: str, day: Any, batch: Any) -> None:
+        key = (endpoint, str(day))
+        partition = self._partitions.pop(key, None)
+        if partition is None:
+            directory = self.root / f"endpoint={endpoint}" / f"basDt={_partition_day(day)}"
+            partition = _Partition(directory)
+        self._partitions[key] = partition
+        partition.batches.append(batch)
+        partition.nbytes += batch.nbytes
+        self._buffered += batch.nbytes
+        if partition.nbytes >= self.row_group_bytes:
+            self._flush(endpoint, partition)
+        while self._buffered > self.max_buffer_bytes:
+            name, largest = max(
+                ((k[0], p) for k, p in self._partitions.items()), key=lambda kp: kp[1].nbytes
+            )
+            self._flush(name, largest)
+
+    def _flush(self, endpoint: str, partition: _Partition) -> None:
+        if not partition.batches:
+            return
+        pa, _ = _arrow()
+        import pyarrow.parquet as pq
+
+        if partition.writer is None:
+            open_writers = [p for p in self._partitions.values() if p.writer is not None]
+            if len(open_writers) >= self.max_open_files:
+                self._close(open_writers[0])
+            partition.directory.mkdir(parents=True, exist_ok=True)
+            path = _next_part(partition.directory)
+            partition.writer = pq.ParquetWriter(
+                path, _data_schema(self._schemas[endpoint]), compression=self.compression
+            )
+        table = pa.Table.from_batches(partition.batches)
+        partition.writer.write_table(table, row_group_size=table.num_rows)
+        partition.rows += table.num_rows
+        self._buffered -= partition.nbytes
+        partition.batches, partition.nbytes = [], 0
+
+    def _close(self, partition: _Partition) -> None:
+        if partition.writer is None:
+            return
+        self.files.append(Written(Path(partition.writer.where), partition.rows))
+        partition.writer.close()
+        partition.writer, partition.rows = None, 0
+
+    def close(self) -> list[Written]:
+        """Flush every buffer, close every file and return the files written."""
+        for (endpoint, _), partition in self._partitions.items():
+            self._flush(endpoint, partition)
+            self._close(partition)
+        self._partitions.clear()
+        return self.files
+
+    async def __aenter__(self) -> "ParquetSink":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _endpoint_of(page: DataPortalResponse[Any]) -> str:
+    model = page.item_model()
+    if model is None:
+        raise ValueError("Pass endpoint= for pages without an item model")
+    return "get" + model.__name__.removesuffix("Item")
+
+
+def _partition_day(day: Any) -> str:
+    s = str(day)
+    if len(s) == 8 and s.isdigit():
+        return date(int(s[:4]), int(s[4:6]), int(s[6:8])).isoformat()
+    return s
+
+
+def _next_part(directory: Path) -> Path:
+    n = 0
+    while (directory / f"part-{n:05d}.parquet").exists():
+        n += 1
+    return directory / f"part-{n:05d}.parquet"
@@ -0,0 +1,210 @@
+"""Fetching many symbols for one day with the fewer requests.
+
+Fetching 300 symbols one ``itmsNm`` request at a time costs 300 requests, while the
+whole market is a few pages of ``numOfRows``. ``plan_prices`` probes the day's
+``totalCount`` and ``plan_query`` costs both strategies at the client's rate;
+``get_prices`` then runs the cheaper one.
+
+Example:
+    >>> rows = await get_prices(client, ["삼성전자", "SK하이닉스"], "20260205")
+    >>> rows["삼성전자"].clpr
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, NamedTuple
+
+from .client import DataPortalClient, total_count, validate_row
+from .models.base import DataPortalResponse
+
+FANOUT = "fanout"
+SCAN = "scan"
+
+DEFAULT_ENDPOINT = "getStockPriceInfo"
+
+
+class QueryPlan(NamedTuple):
+    """Estimated cost of fetching a set of symbols for one day, and the cheaper way.
+
+    ``fanout`` is one filtered request per symbol, ``scan`` the paginated full market
+    filtered locally. Costs exclude the probe that measured ``total_count``.
+    """
+
+    strategy: str
+    total_count: int
+    fanout_requests: int | None
+    scan_requests: int
+    fanout_seconds: float | None
+    scan_seconds: float
+
+    @property
+    def requests(self) -> int:
+        return self.scan_requests if self.strategy == SCAN else self.fanout_requests
+
+    @property
+    def seconds(self) -> float:
+        return self.scan_seconds if self.strategy == SCAN else self.fanout_seconds
+
+
+def plan_query(
+    symbols: int,
+    total_count: int,
+    rate: float,
+    *,
+    numOfRows: int = 1000,
+    concurrency: int = 4,
+    latency: float = 0.0,
+    scan_latency: float | None = None,
+    fanout: bool = True,
+) -> QueryPlan:
+    """Cost per-symbol fan-out against a full scan of ``total_count`` rows.
+
+    Every request spends one quota unit and one limiter token, so a strategy takes at
+    least ``requests / rate`` seconds, and at least its round trip per wave of
+    ``concurrency`` requests: ``latency`` for a filtered request, ``scan_latency`` for
+    a page of ``numOfRows`` rows. Without ``scan_latency`` pages are costed at
+    ``latency``, so ``scan_seconds`` is a lower bound. Ties go to fan-out, which
+    transfers less.
+    """
+    per_second = max(rate, 1e-9)
+    parallel = max(1, concurrency)
+
+    def seconds(requests: int, latency: float) -> float:
+        return max(requests / per_second, -(-requests // parallel) * latency)
+
+    scan_requests = -(-total_count // max(1, numOfRows)) if total_count > 0 else 0
+    fanout_requests = symbols if fanout else None
+    fanout_seconds = seconds(symbols, latency) if fanout else None
+    scan_seconds = seconds(scan_requests, latency if scan_latency is None else scan_latency)
+    if fanout and (fanout_seconds, symbols) <= (scan_seconds, scan_requests):
+        strategy = FANOUT
+    else:
+        strategy = SCAN
+    return QueryPlan(
+        strategy, total_count, fanout_requests, scan_requests, fanout_seconds, scan_seconds
+    )
+
+
+async def plan_prices(
+    client: DataPortalClient,
+    symbols: Iterable[str],
+    basDt: str,
+    method: str | Callable[..., Awaitable[DataPortalResponse[Any]]] = DEFAULT_ENDPOINT,
+    *,
+    key: str = "itmsNm",
+    numOfRows: int = 1000,
+    concurrency: int = 4,
+    scan_latency: float | None = None,
+) -> QueryPlan:
+    """Choose between per-symbol requests and a full-market scan for ``symbols``.
+
+    A one-row request of the unfiltered day measures ``totalCount`` and the round
+    trip; ``plan_query`` then costs both strategies at the client's current ``rate``.
+    A page of ``numOfRows`` rows takes longer than the one-row probe, so pass its
+    round trip as ``scan_latency`` where it is known; without it the scan's time is
+    a lower bound.
+    """
+    name, _ = client._endpoint(method)
+    wanted = list(dict.fromkeys(symbols))
+    operation = getattr(client, name)
+    start = time.perf_counter()
+    probe = await operation(numOfRows=1, pageNo=1, basDt=basDt)
+    return plan_query(
+        len(wanted),
+        total_count(probe),
+        client.rate,
+        numOfRows=numOfRows,
+        concurrency=concurrency,
+        latency=time.perf_counter() - start,
+        scan_latency=scan_latency,
+        fanout=key in inspect.signature(operation).parameters,
+    )
+
+
+async def get_prices(
+    client: DataPortalClient,
+    symbols: Iterable[str],
+    basDt: str,
+    method: str | Callable[..., Awaitable[DataPortalResponse[Any]]] = DEFAULT_ENDPOINT,
+    *,
+    key: str = "itmsNm",
+    numOfRows: int = 1000,
+    concurrency: int = 4,
+    strategy: str | None = None,
+) -> dict[str, Any]:
+    """Rows of many symbols on one ``basDt``, fetched the cheaper way.
+
+    ``plan_prices`` compares filtered requests with every page of the day filtered
+    locally on ``key``, and the cheaper one runs.
+
+    Args:
+        client: Client to fetch with.
+        symbols: Values of ``key`` to fetch.
+        basDt: Trading day (YYYYMMDD).
+        method: An operation of ``client`` or its name.
+        key: Row field the symbols are matched on. Fan-out needs it to be a
+            parameter of the operation; other fields (``srtnCd``, ``isinCd``) are
+            always scanned.
+        numOfRows: Page size of a full scan.
+        concurrency: Maximum number of requests in flight at once.
+        strategy: ``FANOUT`` or ``SCAN`` to skip planning.
+
+    Returns:
+        dict: Validated item (raw dict if validation fails) per symbol found.
+    """
+    name, endpoint = client._endpoint(method)
+    operation = getattr(client, name)
+    wanted = list(dict.fromkeys(symbols))
+    if not wanted:
+        return {}
+    can_fanout = key in inspect.signature(operation).parameters
+    if strategy is None:
+        if len(wanted) == 1 and can_fanout:
+            # One filtered request never costs more than the probe alone.
+            strategy = FANOUT
+        else:
+            plan = await plan_prices(
+                client,
+                wanted,
+                basDt,
+                name,
+                key=key,
+                numOfRows=numOfRows,
+                concurrency=concurrency,
+            )
+            if plan.total_count == 0:
+                return {}
+            strategy = plan.strategy
+    elif strategy not in (FANOUT, SCAN):
+        raise ValueError(f"Unknown strategy {strategy!r}")
+    elif strategy == FANOUT and not can_fanout:
+        raise ValueError(f"{name} cannot filter on {key!r}")
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    found: dict[str, Any] = {}
+    targets = set(wanted)
+
+    def collect(page: DataPortalResponse[Any]) -> None:
+        for row in page.raw_items():
+            if isinstance(row, dict) and row.get(key) in targets:
+                found.setdefault(row[key], validate_row(endpoint.model, row))
+
+    if strategy == FANOUT:
+
+        async def fetch_symbol(symbol: str) -> None:
+            async with semaphore:
+                pages = client.iter_pages(
+                    operation, numOfRows=100, concurrency=1, basDt=basDt, **{key: symbol}
+                )
+                async for page in pages:
+                    collect(page)
+
+        await asyncio.gather(*(fetch_symbol(symbol) for symbol in wanted))
+    else:
+        async for page in client.iter_pages(
+            operation, numOfRows=numOfRows, concurrency=concurrency, basDt=basDt
+        ):
+            collect(page)
+    return {symbol: found[symbol] for symbol in wanted if symbol in found}
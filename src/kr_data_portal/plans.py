@@ -0,0 +1,240 @@
+"""Precompiled request plans and the dynamic, spec-driven client.
+
+A ``RequestPlan`` holds everything about an operation that does not change between
+calls: the normalized (``https``) URL, the response type, the parameter order,
+defaults and validators. Generated clients build their plans once at import;
+``SpecClient.from_yaml`` builds them from a spec at runtime and caches them per file.
+
+Example:
+    >>> Portal = SpecClient.from_yaml("specs/financial_services.yaml")
+    >>> async with Portal(service_key) as client:
+    ...     response = await client.getStockPriceInfo(basDt="20260205", numOfRows=100)
+"""
+
+import inspect
+import numbers
+from collections.abc import Callable, Iterable
+from datetime import date
+from functools import cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import yaml
+
+from .client import DataPortalClient, Endpoint
+from .models.base import DataPortalResponse
+
+# Parameters set by the client rather than by callers.
+_CLIENT_PARAMS = frozenset(["serviceKey", "resultType"])
+
+
+class Param(NamedTuple):
+    """One query parameter of an operation, as declared in the spec."""
+
+    name: str
+    type: str = "str"
+    default: Any = None
+    required: bool = False
+    description: str = ""
+
+
+def _check_int(op: str, name: str, value: Any) -> int:
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+        # int() also unwraps integer types of other libraries (numpy.int64, ...).
+        return int(value)
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    raise ValueError(f"{op}: {name} must be an integer, got {value!r}")
+
+
+def _check_str(op: str, name: str, value: Any) -> Any:
+    # Dates are accepted wherever the portal wants YYYYMMDD.
+    if isinstance(value, date):
+        return value.strftime("%Y%m%d")
+    return value
+
+
+_VALIDATORS: dict[str, Callable[[str, str, Any], Any]] = {"int": _check_int, "str": _check_str}
+
+
+class RequestPlan:
+    """Precompiled request of one operation.
+
+    Args:
+        name: Operation name, e.g. ``getStockPriceInfo``.
+        url: Operation URL. ``http://`` is upgraded to ``https://`` here, once.
+        model: Item model, or None to leave rows as dicts.
+        params: The operation's parameters, in query order.
+        filters: Non-equality filters, see ``Endpoint.filters``.
+        description: Docstring of the operation.
+    """
+
+    __slots__ = (
+        "name",
+        "url",
+        "model",
+        "response",
+        "params",
+        "filters",
+        "description",
+        "_validators",
+        "_required",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        model: type | None,
+        params: Iterable[Param] = (),
+        filters: tuple[tuple[str, str, str], ...] = (),
+        description: str = "",
+    ):
+        self.name = name
+        self.url = "https://" + url.removeprefix("http://") if url.startswith("http://") else url
+        self.model = model
+        self.response = DataPortalResponse[model] if model is not None else DataPortalResponse
+        self.params = tuple(p for p in params if p.name not in _CLIENT_PARAMS)
+        self.filters = filters
+        self.description = description
+        self._validators = {
+            p.name: _VALIDATORS[p.type] for p in self.params if p.type in _VALIDATORS
+        }
+        self._required = frozenset(p.name for p in self.params if p.required)
+
+    def __repr__(self) -> str:
+        return f"RequestPlan({self.name!r}, {self.url!r})"
+
+    @property
+    def endpoint(self) -> Endpoint:
+        return Endpoint(self.url, self.model, self.filters)
+
+    def query(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Validated query parameters of one call, without ``None`` values.
+
+        ``values`` are the call's arguments in parameter order, followed by any extra
+        keyword arguments (which are passed through unchecked).
+
+        Raises:
+            ValueError: A required parameter is missing or a value has the wrong type.
+        """
+        params: dict[str, Any] = {"resultType": "json"}
+        validators = self._validators
+        for name, value in values.items():
+            if value is None:
+                continue
+            check = validators.get(name)
+            params[name] = value if check is None else check(self.name, name, value)
+        if self._required and not self._required <= params.keys():
+            missing = ", ".join(sorted(self._required - params.keys()))
+            raise ValueError(f"{self.name}: missing required parameters: {missing}")
+        return params
+
+    def signature(self) -> inspect.Signature:
+        """Keyword signature of the operation, for introspection of dynamic methods."""
+        parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        parameters += [
+            inspect.Parameter(p.name, inspect.Parameter.KEYWORD_ONLY, default=p.default)
+            for p in self.params
+        ]
+        parameters.append(inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD))
+        return inspect.Signature(parameters)
+
+    @classmethod
+    def from_service(
+        cls, base_url: str, service: dict[str, Any], model: type | None = None
+    ) -> "RequestPlan":
+        """Plan of a spec service entry (``services[i]`` of a spec file)."""
+        params = [
+            Param(
+                p["name"],
+                p.get("type", "str"),
+                p.get("default"),
+                bool(p.get("required")),
+                p.get("description", ""),
+            )
+            for p in service.get("parameters", [])
+        ]
+        filters = tuple(
+            (p["name"], p["field"], p["filter"])
+            for p in service.get("parameters", [])
+            if "filter" in p
+        )
+        return cls(
+            service["name"],
+            base_url + service["path"],
+            model,
+            params,
+            filters,
+            service.get("description", ""),
+        )
+
+
+def _operation(plan: RequestPlan) -> Callable[..., Any]:
+    async def operation(self: DataPortalClient, **params: Any) -> DataPortalResponse[Any]:
+        for p in plan.params:
+            params.setdefault(p.name, p.default)
+        return await self._call(plan, params)
+
+    operation.__name__ = operation.__qualname__ = plan.name
+    operation.__doc__ = plan.description
+    operation.__signature__ = plan.signature()
+    return operation
+
+
+class SpecClient(DataPortalClient):
+    """Client for any spec, with operations built at runtime from its request plans.
+
+    ``from_yaml`` returns a ``SpecClient`` subclass for a spec file, with one method
+    per operation, so the helpers that take an operation (``paginate``,
+    ``planner.get_prices``, ``fetch_range``, ...) work as with generated clients. Rows are
+    left as dicts unless ``models`` maps operation names to item models.
+    """
+
+    plans: dict[str, RequestPlan] = {}
+
+    @classmethod
+    def from_yaml(
+        cls, path: str | Path, models: dict[str, type] | None = None
+    ) -> type["SpecClient"]:
+        """Client class for the spec at ``path``, compiled once per file version."""
+        path = Path(path).resolve()
+        return _compile(path, path.stat().st_mtime_ns, tuple(sorted((models or {}).items())))
+
+    @classmethod
+    def from_spec(
+        cls, spec: dict[str, Any], models: dict[str, type] | None = None
+    ) -> type["SpecClient"]:
+        """Client class for a parsed spec (``info`` and ``services``)."""
+        models = models or {}
+        base_url = spec["info"]["base_url"]
+        plans = {
+            service["name"]: RequestPlan.from_service(
+                base_url, service, models.get(service["name"])
+            )
+            for service in spec["services"]
+        }
+        namespace: dict[str, Any] = {
+            "__doc__": spec["info"].get("description") or cls.__doc__,
+            "plans": plans,
+            "endpoints": {name: plan.endpoint for name, plan in plans.items()},
+        }
+        namespace.update({name: _operation(plan) for name, plan in plans.items()})
+        title = spec["info"].get("title", "")
+        new = type(cls.__name__, (cls,), namespace)
+        new.__qualname__ = f"{cls.__name__}[{title}]" if title else cls.__name__
+        return new
+
+    async def call(self, operation: str, **params: Any) -> DataPortalResponse[Any]:
+        """Call an operation by name."""
+        plan = self.plans.get(operation)
+        if plan is None:
+            raise ValueError(f"{type(self).__qualname__} has no operation {operation!r}")
+        return await getattr(self, operation)(**params)
+
+
+@cache
+def _compile(path: Path, mtime_ns: int, models: tuple[tuple[str, type], ...]) -> type[SpecClient]:
+    with open(path, encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    return SpecClient.from_spec(spec, dict(models))
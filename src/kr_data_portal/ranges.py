@@ -0,0 +1,115 @@
+"""Date-range queries split into parallel, page-sized shards.
+
+Operations with ``basDt`` range filters (``beginBasDt``/``endBasDt`` in the spec)
+answer a whole interval in one query, so a year of one ticker is a single page rather
+than one request per trading day. ``fetch_range`` sizes the shards from the
+interval's ``totalCount`` so that each fits one page of ``numOfRows``, fetches them
+concurrently and merges the rows in ``basDt`` order.
+
+Example:
+    >>> rows = await fetch_range(
+    ...     client, client.getStockPriceInfo, "20250101", "20251231", itmsNm="삼성전자"
+    ... )
+"""
+
+import asyncio
+import math
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from typing import Any
+
+from .backfill import as_date
+from .client import DataPortalClient, total_count, validate_row
+from .models.base import DataPortalResponse
+
+
+def shard_range(start: str | date, end: str | date, days: int) -> list[tuple[str, str]]:
+    """Split ``start``..``end`` (inclusive) into consecutive ``(first, last)`` shards of
+    at most ``days`` calendar days, as ``YYYYMMDD`` strings."""
+    first, last = as_date(start), as_date(end)
+    step = timedelta(days=max(1, days))
+    shards = []
+    while first <= last:
+        stop = min(first + step - timedelta(days=1), last)
+        shards.append((first.strftime("%Y%m%d"), stop.strftime("%Y%m%d")))
+        first = stop + timedelta(days=1)
+    return shards
+
+
+def _next_day(day: str) -> str:
+    return (as_date(day) + timedelta(days=1)).strftime("%Y%m%d")
+
+
+async def fetch_range(
+    client: DataPortalClient,
+    method: str | Callable[..., Awaitable[DataPortalResponse[Any]]],
+    start: str | date,
+    end: str | date,
+    *,
+    numOfRows: int = 1000,
+    concurrency: int = 4,
+    shard_days: int | None = None,
+    model_cls: type | None = None,
+    raw: bool = False,
+    **params: Any,
+) -> list[Any]:
+    """Rows of ``method`` from ``start`` to ``end`` (inclusive), in ``basDt`` order.
+
+    Unless ``shard_days`` is given, a one-row query of the whole interval measures
+    ``totalCount`` and the interval is cut into shards expected to fit one page each.
+    Shards that turn out larger are paginated, so uneven days only cost extra pages.
+
+    Args:
+        client: Client to fetch with.
+        method: An operation of ``client`` with ``basDt`` range filters, or its name.
+        start: First day.
+        end: Last day.
+        numOfRows: Page size.
+        concurrency: Maximum number of shards in flight at once.
+        shard_days: Calendar days per shard, skipping the probe.
+        model_cls: Item model. Defaults to the operation's item model.
+        raw: Return raw dicts without validation.
+        **params: Other filters (``itmsNm``, ``likeItmsNm``, ...).
+
+    Returns:
+        list: Validated items (raw dicts for rows that fail validation, or if ``raw``).
+    """
+    name, endpoint = client._endpoint(method)
+    begin_param = endpoint.filter_param("basDt", "ge")
+    end_param = endpoint.filter_param("basDt", "lt")
+    if begin_param is None or end_param is None:
+        raise ValueError(f"{name} has no basDt range filters")
+    operation = getattr(client, name)
+    first, last = as_date(start), as_date(end)
+    if first > last:
+        return []
+
+    def bounds(shard: tuple[str, str]) -> dict[str, str]:
+        # The end bound is exclusive.
+        return {begin_param: shard[0], end_param: _next_day(shard[1])}
+
+    span = (last - first).days + 1
+    if shard_days is None:
+        whole = (first.strftime("%Y%m%d"), last.strftime("%Y%m%d"))
+        probe = await operation(numOfRows=1, pageNo=1, **bounds(whole), **params)
+        total = total_count(probe)
+        if total == 0:
+            return []
+        shard_days = max(1, math.floor(numOfRows * span / total))
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(shard: tuple[str, str]) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        async with semaphore:
+            async for page in client.iter_pages(
+                operation, numOfRows=numOfRows, concurrency=1, **bounds(shard), **params
+            ):
+                rows.extend(row for row in page.raw_items() if isinstance(row, dict))
+        # Shards do not overlap, so a stable sort within each keeps the merge ordered.
+        rows.sort(key=lambda row: str(row.get("basDt") or ""))
+        return rows
+
+    shards = await asyncio.gather(*(fetch(s) for s in shard_range(first, last, shard_days)))
+    model_cls = None if raw else (model_cls or endpoint.model)
+    return [validate_row(model_cls, row) for rows in shards for row in rows]
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease (AIMD) rate limiter.
+
+    Requests are paced evenly at the current rate. Every successful request raises the
+    rate so that it grows by about ``increase`` requests/s per second of successful
+    traffic; every throttling signal multiplies it by ``decrease``. Throttling signals
+    arriving within ``cooldown`` seconds of the last decrease are treated as the same
+    event, so a burst of in-flight failures only backs off once.
+
+    Used as an async context manager, like ``aiolimiter.AsyncLimiter``.
+
+    Args:
+        rate: Initial rate in requests per second.
+        min_rate: Lower bound of the rate.
+        max_rate: Upper bound of the rate. None means unbounded.
+        increase: Requests/s added per second of successful traffic.
+        decrease: Factor applied to the rate on throttling.
+        cooldown: Seconds after a decrease during which further signals are ignored.
+        latency_spike: A response slower than this multiple of the average latency
+            counts as a throttling signal, and enters the average capped at that
+            multiple. None disables latency tracking.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 1.0,
+        max_rate: float | None = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        latency_spike: float | None = 3.0,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.latency_spike = latency_spike
+        self.throttle_events = 0
+        self._rate = self._clamp(rate)
+        self._next = 0.0
+        self._last_decrease = float("-inf")
+        self._latency: float | None = None
+        self._samples = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second."""
+        return self._rate
+
+    @property
+    def average_latency(self) -> float | None:
+        """Moving average of successful request latency in seconds."""
+        return self._latency
+
+    def _clamp(self, rate: float) -> float:
+        rate = max(self.min_rate, rate)
+        return min(self.max_rate, rate) if self.max_rate is not None else rate
+
+    async def acquire(self) -> None:
+        """Wait until the next request may be sent at the current rate."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = time.monotonic()
+            self._next = max(self._next, now) + 1.0 / self._rate
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def record_success(self, latency: float | None = None) -> None:
+        """Report a successful request and its latency in seconds."""
+        if latency is not None and self.latency_spike is not None:
+            spike = (
+                self._latency is not None
+                and self._samples >= 10
+                and latency > self.latency_spike * self._latency
+            )
+            if spike:
+                # Fold the spike in at its threshold so a lasting step up in latency
+                # moves the baseline within a few samples instead of throttling forever.
+                latency = self.latency_spike * self._latency
+            self._samples += 1
+            self._latency = (
+                latency if self._latency is None else 0.9 * self._latency + 0.1 * latency
+            )
+            if spike:
+                self.record_throttle()
+                return
+        self._rate = self._clamp(self._rate + self.increase / self._rate)
+
+    def record_throttle(self) -> None:
+        """Report a throttling signal and back off."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.throttle_events += 1
+        self._rate = self._clamp(self._rate * self.decrease)
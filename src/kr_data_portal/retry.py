@@ -0,0 +1,148 @@
+import random
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from .codes import is_retryable
+
+
+class RetryBudget:
+    """Caps retries to a fraction of requests, so an outage does not multiply traffic.
+
+    Every request deposits ``ratio`` of a retry and every retry withdraws a whole one,
+    so in steady state at most ``ratio`` extra requests are sent per request. On top of
+    that ``min_per_second`` retries are always allowed, so a client sending few
+    requests can still retry. The balance starts with ten seconds' worth of those and
+    is capped at ``capacity``.
+
+    Share one budget (through one ``RetryPolicy``) between clients to bound retries
+    across a whole job.
+
+    Args:
+        ratio: Retries earned per request.
+        min_per_second: Retries always allowed per second.
+        capacity: Maximum retries that can be saved up.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, capacity: float = 100.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._balance = min(capacity, 10 * min_per_second)
+        self._updated = time.monotonic()
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        self._refill()
+        return self._balance
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(
+            self.capacity, self._balance + (now - self._updated) * self.min_per_second
+        )
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a request."""
+        self._refill()
+        self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take one retry from the budget; False if there is none left."""
+        self._refill()
+        if self._balance < 1.0:
+            return False
+        self._balance -= 1.0
+        return True
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Only transient failures are retried: timeouts and connection errors, HTTP 429/5xx
+    and the portal's application, DB, HTTP and ``SERVICE_TIMEOUT`` errors. Parameter,
+    no-data and key errors fail immediately. Delays grow exponentially with "full
+    jitter" (a random delay up to the exponential bound), which spreads the retries of
+    concurrent workers; a ``Retry-After`` header is honoured as a lower bound.
+
+    Example:
+        >>> policy = RetryPolicy(max_retries=5, base_delay=1.0, budget=RetryBudget(ratio=0.2))
+        >>> client = FinancialClient(service_key, retry=policy)
+
+    Args:
+        max_retries: Retries per request after the first attempt.
+        base_delay: Upper bound of the first delay in seconds.
+        max_delay: Upper bound of any delay in seconds.
+        multiplier: Growth of the bound per retry.
+        jitter: Randomize delays. Without it the bound itself is used.
+        budget: Retry budget shared by every request using this policy. Defaults to
+            a new ``RetryBudget()``.
+        retryable: Classifier deciding which errors are transient.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        budget: RetryBudget | None = None,
+        retryable: Callable[[BaseException], bool] = is_retryable,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.budget = budget or RetryBudget()
+        self.is_retryable = retryable
+        self.retries = 0
+        self.denied = 0
+
+    def record_request(self) -> None:
+        """Record a first attempt, earning retry budget."""
+        self.budget.deposit()
+
+    def allow(self, attempt: int) -> bool:
+        """Whether attempt number ``attempt`` (0 for the first) may be followed by a retry.
+
+        Spends from the budget when it returns True.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if not self.budget.withdraw():
+            self.denied += 1
+            return False
+        self.retries += 1
+        return True
+
+    def delay(self, attempt: int, error: BaseException | None = None) -> float:
+        """Seconds to wait before retrying after attempt number ``attempt`` failed."""
+        bound = min(self.max_delay, self.base_delay * self.multiplier**attempt)
+        delay = random.uniform(0, bound) if self.jitter else bound
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+def _retry_after(error: BaseException | None) -> float | None:
+    response = getattr(error, "response", None)
+    if not isinstance(response, httpx.Response):
+        return None
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
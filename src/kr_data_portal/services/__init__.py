@@ -0,0 +1,47 @@
+"""Lazy registry of the generated service clients.
+
+Each spec in ``specs/`` generates a client module. This package imports one (and its
+models) only when it is first accessed, by module or client class name, so importing
+the registry costs nothing however many services are generated:
+
+    >>> from kr_data_portal.services import FinancialClient
+    >>> from kr_data_portal import services
+    >>> services.financial_services.FinancialClient
+
+Generated by ``scripts/generate_client.py``.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Generated module name -> client class name.
+SERVICES = {
+    "financial_services": "FinancialClient",
+}
+
+_MODULES = {client: module for module, client in SERVICES.items()}
+
+__all__ = [
+    "FinancialClient",
+    "financial_services",
+]
+
+if TYPE_CHECKING:
+    from .. import financial_services
+    from ..financial_services import FinancialClient
+
+
+def __getattr__(name: str) -> Any:
+    if name in SERVICES:
+        value = importlib.import_module(f"..{name}", __name__)
+    elif name in _MODULES:
+        value = getattr(importlib.import_module(f"..{_MODULES[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the module global and skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from .backfill import WorkUnit, date_range
+from .cache import expires_at
+from .client import DataPortalClient, validate_row
+from .models.base import DataPortalResponse
+
+DEFAULT_ENDPOINT = "getStockPriceInfo"
+
+
+class PriceStore:
+    """Local SQLite store of price rows, filled from the API only for missing days.
+
+    Rows are kept per ``(endpoint, basDt)`` as JSON, with the columns queried most
+    often (``srtnCd``, ``isinCd``, ``itmsNm``) indexed alongside ``basDt``. A day is
+    marked complete once all of its pages have been stored and it can no longer change
+    (``basDt`` before today, KST); ``prices()`` then answers it from disk and only
+    fetches days that are not complete yet.
+
+    Example:
+        >>> store = PriceStore("prices.db", client)
+        >>> rows = await store.prices(srtnCd="005930", start="20250101", end="20251231")
+
+    Args:
+        path: SQLite database file. Created if missing.
+        client: Client used to fetch missing days. Without one the store is read-only
+            apart from ``write()``.
+        endpoint: Default operation name.
+        numOfRows: Page size of fetches.
+        concurrency: Days fetched at once.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        client: DataPortalClient | None = None,
+        endpoint: str = DEFAULT_ENDPOINT,
+        numOfRows: int = 1000,
+        concurrency: int = 4,
+    ):
+        self.path = Path(path).expanduser()
+        self.client = client
+        self.endpoint = endpoint
+        self.numOfRows = numOfRows
+        self.concurrency = max(1, concurrency)
+        self.fetched_days = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS prices ("
+            " endpoint TEXT NOT NULL,"
+            " basDt TEXT NOT NULL,"
+            " srtnCd TEXT,"
+            " isinCd TEXT,"
+            " itmsNm TEXT,"
+            " row TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS prices_srtnCd ON prices (srtnCd, basDt);"
+            "CREATE INDEX IF NOT EXISTS prices_isinCd ON prices (isinCd, basDt);"
+            "CREATE INDEX IF NOT EXISTS prices_itmsNm ON prices (itmsNm);"
+            "CREATE INDEX IF NOT EXISTS prices_day ON prices (endpoint, basDt);"
+            "CREATE TABLE IF NOT EXISTS days ("
+            " endpoint TEXT NOT NULL,"
+            " basDt TEXT NOT NULL,"
+            " rows INTEGER NOT NULL,"
+            " fetched REAL NOT NULL,"
+            " PRIMARY KEY (endpoint, basDt));"
+        )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+
+    def complete_days(self, endpoint: str | None = None) -> set[str]:
+        """``basDt`` values of ``endpoint`` whose rows are all stored."""
+        cursor = self._db.execute(
+            "SELECT basDt FROM days WHERE endpoint = ?", (endpoint or self.endpoint,)
+        )
+        return {row[0] for row in cursor}
+
+    def missing_days(
+        self, start: str | date, end: str | date, endpoint: str | None = None
+    ) -> list[str]:
+        """Trading days (weekdays) from ``start`` to ``end`` not complete in the store."""
+        done = self.complete_days(endpoint)
+        return [day for day in date_range(start, end) if day not in done]
+
+    def write(self, endpoint: str, rows: Iterable[dict[str, Any]]) -> int:
+        """Store rows of ``endpoint``, replacing stored rows of the same day and symbol.
+
+        Days written this way are not marked complete, since the rows may be a single
+        page; use ``fill()`` for that.
+        """
+        records = [_record(endpoint, row) for row in rows]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "DELETE FROM prices WHERE endpoint = ? AND basDt = ?"
+                    " AND srtnCd IS ? AND isinCd IS ?",
+                    [r[:4] for r in records],
+                )
+                self._db.executemany("INSERT INTO prices VALUES (?, ?, ?, ?, ?, ?)", records)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(records)
+
+    def sink(self, unit: WorkUnit, response: DataPortalResponse[Any]) -> None:
+        """``Backfill`` sink writing every fetched page through to the store."""
+        self.write(unit.endpoint, response.raw_items())
+
+    def _replace_day(
+        self, endpoint: str, basDt: str, rows: list[dict[str, Any]], complete: bool
+    ) -> None:
+        records = [_record(endpoint, row, basDt) for row in rows]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute(
+                    "DELETE FROM prices WHERE endpoint = ? AND basDt = ?", (endpoint, basDt)
+                )
+                self._db.executemany("INSERT INTO prices VALUES (?, ?, ?, ?, ?, ?)", records)
+                if complete:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO days VALUES (?, ?, ?, ?)",
+                        (endpoint, basDt, len(records), time.time()),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    async def fill(self, start: str | date, end: str | date, endpoint: str | None = None) -> int:
+        """Fetch and store every missing day from ``start`` to ``end``.
+
+        The first failing day cancels the others; days stored before that stay.
+
+        Returns:
+            int: The number of days fetched.
+        """
+        endpoint = endpoint or self.endpoint
+        missing = self.missing_days(start, end, endpoint)
+        if not missing:
+            return 0
+        if self.client is None:
+            raise ValueError(f"{len(missing)} days missing from the store and no client set")
+        method = getattr(self.client, endpoint)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(day: str) -> None:
+            async with semaphore:
+                rows: list[dict[str, Any]] = []
+                async for page in self.client.iter_pages(
+                    method, numOfRows=self.numOfRows, basDt=day
+                ):
+                    rows.extend(page.raw_items())
+            # Today's data may still be published (or corrected) later.
+            self._replace_day(endpoint, day, rows, complete=expires_at({"basDt": day}) is None)
+
+        tasks = [asyncio.create_task(fetch(day)) for day in missing]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # On the first failure, stop the other days before they spend more quota.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.fetched_days += len(missing)
+        return len(missing)
+
+    def query(
+        self,
+        srtnCd: str | None = None,
+        isinCd: str | None = None,
+        itmsNm: str | None = None,
+        start: str | date | None = None,
+        end: str | date | None = None,
+        endpoint: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Stored rows matching every given filter, ordered by ``basDt``. Never fetches."""
+        where: list[str] = []
+        args: list[Any] = []
+        for column, value in (("srtnCd", srtnCd), ("isinCd", isinCd), ("itmsNm", itmsNm)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        # With a symbol filter, "+" keeps SQLite off the (endpoint, basDt) index, which
+        # would scan every row of the range instead of one per day.
+        where.append("+endpoint = ?" if where else "endpoint = ?")
+        args.append(endpoint or self.endpoint)
+        if start is not None:
+            where.append("basDt >= ?")
+            args.append(_day(start))
+        if end is not None:
+            where.append("basDt <= ?")
+            args.append(_day(end))
+        sql = f"SELECT row FROM prices WHERE {' AND '.join(where)} ORDER BY basDt, srtnCd"
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    async def prices(
+        self,
+        srtnCd: str | None = None,
+        isinCd: str | None = None,
+        itmsNm: str | None = None,
+        start: str | date | None = None,
+        end: str | date | None = None,
+        endpoint: str | None = None,
+        model_cls: type | None = None,
+    ) -> list[Any]:
+        """Rows matching the filters, fetching missing days of ``start``..``end`` first.
+
+        Without both ``start`` and ``end`` only stored rows are returned.
+
+        Args:
+            model_cls: Item model to validate into. Defaults to the client's model for
+                ``endpoint``; raw dicts if there is none. Rows failing validation are
+                returned as raw dicts.
+        """
+        endpoint = endpoint or self.endpoint
+        if start is not None and end is not None and self.client is not None:
+            await self.fill(start, end, endpoint)
+        rows = self.query(srtnCd, isinCd, itmsNm, start, end, endpoint)
+        if model_cls is None and self.client is not None:
+            spec = getattr(self.client, "endpoints", {}).get(endpoint)
+            model_cls = spec.model if spec is not None else None
+        if model_cls is None:
+            return rows
+        return [validate_row(model_cls, row) for row in rows]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _record(endpoint: str, row: dict[str, Any], basDt: str | None = None) -> tuple[Any, ...]:
+    return (
+        endpoint,
+        row.get("basDt") or basDt,
+        row.get("srtnCd"),
+        row.get("isinCd"),
+        row.get("itmsNm"),
+        json.dumps(row, ensure_ascii=False),
+    )
+
+
+def _day(value: str | date) -> str:
+    return value.strftime("%Y%m%d") if isinstance(value, date) else value
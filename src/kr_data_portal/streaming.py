@@ -0,0 +1,166 @@
+import codecs
+import json
+import re
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WS = " \t\r\n"
+
+# Only ``"item"`` with its closing quote, so ``"items"`` does not match.
+_ITEM_KEY = re.compile(r'"item"\s*:\s*([\[{])')
+_HEADER_KEY = re.compile(r'"header"\s*:\s*')
+_BODY_FIELD = re.compile(r'"(numOfRows|pageNo|totalCount)"\s*:\s*"?(\d+)')
+
+# Text kept from the end of the buffer while searching for a key, so a key split
+# across two chunks is still found.
+_KEY_OVERLAP = 32
+
+
+class ItemStreamParser:
+    """Incremental parser for ``response.body.items.item`` of a portal JSON response.
+
+    Feed it chunks of the body as they arrive; it returns the rows of the item array
+    as soon as each one is complete. Only the unparsed tail of the stream is buffered;
+    a chunk boundary inside a key or an item is carried over to the next ``feed``.
+
+    The ``header`` (checked for ``resultCode``) and the body counters (``totalCount``,
+    ``numOfRows``, ``pageNo``) are captured on the way.
+
+    Example:
+        >>> parser = ItemStreamParser()
+        >>> for chunk in chunks:
+        ...     for row in parser.feed(chunk):
+        ...         handle(row)
+        >>> parser.close()
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self.header: dict[str, Any] | None = None
+        self.body: dict[str, int] = {}
+        self.is_xml = False
+        self.xml_text = ""
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Consume a chunk of the body and return the rows it completed."""
+        return self._feed_text(self._decoder.decode(chunk))
+
+    def _feed_text(self, text: str) -> list[dict[str, Any]]:
+        if self.is_xml:
+            self.xml_text += text
+            return []
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Signal the end of the body and return any remaining rows.
+
+        Raises:
+            ValueError: If the body ended in the middle of the item array.
+        """
+        rows = self._feed_text(self._decoder.decode(b"", final=True))
+        if self._state in ("header_value", "array", "object"):
+            raise ValueError("Response body ended inside the item list")
+        self._scan_body_fields(self._buf[self._pos :])
+        return rows
+
+    @property
+    def done(self) -> bool:
+        """True once the item array has been fully read."""
+        return self._state == "done"
+
+    def _parse(self) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        while True:
+            if self._state == "start":
+                stripped = self._buf.lstrip(_WS)
+                if not stripped:
+                    return rows
+                if stripped[0] == "<":
+                    # XML error envelope: keep the (small) body for error extraction.
+                    self.is_xml = True
+                    self.xml_text, self._buf = stripped, ""
+                    return rows
+                self._state = "header"
+            elif self._state == "header":
+                match = _HEADER_KEY.search(self._buf, self._pos)
+                if match is None:
+                    if _ITEM_KEY.search(self._buf, self._pos):
+                        # No header before the items; go straight to them.
+                        self._state = "items"
+                        continue
+                    self._keep_tail()
+                    return rows
+                self._pos = match.end()
+                self._state = "header_value"
+            elif self._state == "header_value":
+                value = self._decode_at(self._pos)
+                if value is None:
+                    return rows
+                self.header, self._pos = value
+                self._state = "items"
+            elif self._state == "items":
+                match = _ITEM_KEY.search(self._buf, self._pos)
+                if match is None:
+                    self._scan_body_fields(self._buf[self._pos :])
+                    self._keep_tail()
+                    return rows
+                self._scan_body_fields(self._buf[self._pos : match.start()])
+                if match.group(1) == "[":
+                    self._pos = match.end()
+                    self._state = "array"
+                else:
+                    self._pos = match.start(1)
+                    self._state = "object"
+            elif self._state == "object":
+                value = self._decode_at(self._pos)
+                if value is None:
+                    return rows
+                row, self._pos = value
+                rows.append(row)
+                self._state = "done"
+            elif self._state == "array":
+                pos = self._skip(self._pos, _WS + ",")
+                if pos >= len(self._buf):
+                    self._pos = pos
+                    return rows
+                if self._buf[pos] == "]":
+                    self._pos = pos + 1
+                    self._state = "done"
+                    continue
+                value = self._decode_at(pos)
+                if value is None:
+                    self._pos = pos
+                    return rows
+                row, self._pos = value
+                rows.append(row)
+            else:  # done
+                self._scan_body_fields(self._buf[self._pos :])
+                self._keep_tail()
+                return rows
+
+    def _decode_at(self, pos: int) -> tuple[Any, int] | None:
+        pos = self._skip(pos, _WS)
+        try:
+            return _DECODER.raw_decode(self._buf, pos)
+        except json.JSONDecodeError:
+            # Incomplete value; wait for the next chunk.
+            self._pos = pos
+            return None
+
+    def _skip(self, pos: int, chars: str) -> int:
+        buf = self._buf
+        while pos < len(buf) and buf[pos] in chars:
+            pos += 1
+        return pos
+
+    def _keep_tail(self) -> None:
+        self._pos = max(self._pos, len(self._buf) - _KEY_OVERLAP)
+
+    def _scan_body_fields(self, text: str) -> None:
+        for name, value in _BODY_FIELD.findall(text):
+            self.body[name] = int(value)
@@ -0,0 +1,344 @@
+"""Symbol index resolving names, short codes, ISINs and corporate registration numbers.
+
+``SymbolIndex`` is built from one full-market snapshot (every row of a trading day)
+and answers exact, prefix and fuzzy Korean-name lookups without any API call. The
+index lives in a single flat buffer (string blob, offsets and one sorted permutation
+per key), which is written as is and memory-mapped on load, so opening a saved index
+costs no parsing.
+
+Example:
+    >>> index = await SymbolIndex.load_or_build("symbols.idx", client)
+    >>> index.get("005930").itmsNm
+    '삼성전자'
+    >>> [s.itmsNm for s in index.prefix("ㅅㅅㅈ")]
+    ['삼성전자', ...]
+"""
+
+import difflib
+import heapq
+import mmap
+import struct
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .cache import KST
+from .client import DataPortalClient
+
+MAGIC = b"KRSYMIDX"
+VERSION = 1
+
+# Stored per symbol: the public fields, then the two lookup keys derived from the name.
+FIELDS = ("srtnCd", "isinCd", "itmsNm", "mrktCtg", "crno")
+_NORM, _CHO = len(FIELDS), len(FIELDS) + 1
+_NFIELDS = len(FIELDS) + 2
+# Keys with a sorted permutation, in file order.
+_SORTED = (0, 1, 4, _NORM, _CHO)
+
+# magic, version, little-endian flag, count, basDt, blob length
+_HEADER = struct.Struct("<8sIIi8sI")
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+
+class Symbol(NamedTuple):
+    """One listed security. ``crno`` is empty when the snapshot does not carry it."""
+
+    srtnCd: str
+    isinCd: str
+    itmsNm: str
+    mrktCtg: str
+    crno: str
+
+
+def normalize(text: str) -> str:
+    """Lookup form of a name: NFC, case-folded, without whitespace."""
+    return "".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def choseong(text: str) -> str:
+    """Initial consonants of the Hangul syllables in ``text`` (삼성전자 -> ㅅㅅㅈㅈ).
+
+    Other characters are kept as they are.
+    """
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        out.append(_CHOSEONG[code // 588] if 0 <= code < 11172 else ch)
+    return "".join(out)
+
+
+def _is_choseong(text: str) -> bool:
+    return bool(text) and all(ch in _CHOSEONG_SET for ch in text)
+
+
+def _jamo(text: str) -> str:
+    # NFD splits each Hangul syllable into its jamo, so near-miss spellings share most
+    # characters.
+    return unicodedata.normalize("NFD", text)
+
+
+def _encode(rows: Iterable[dict[str, Any]], basDt: str) -> bytes:
+    symbols: dict[str, tuple[str, ...]] = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        values = tuple(str(row.get(f) or "") for f in FIELDS)
+        key = values[1] or values[0]
+        if key:
+            name = normalize(values[2])
+            symbols[key] = (*values, name, choseong(name))
+    records = list(symbols.values())
+
+    blob = bytearray()
+    offsets = array("I", [0])
+    for record in records:
+        for value in record:
+            blob += value.encode()
+            offsets.append(len(blob))
+    orders = [
+        array("I", sorted(range(len(records)), key=lambda i, f=f: records[i][f])) for f in _SORTED
+    ]
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        sys.byteorder == "little",
+        len(records),
+        basDt.encode().ljust(8),
+        len(blob),
+    )
+    return b"".join([header, offsets.tobytes(), *(order.tobytes() for order in orders), blob])
+
+
+class _Keys:
+    """Sequence view of one field in sorted order, for ``bisect``."""
+
+    __slots__ = ("index", "order", "field")
+
+    def __init__(self, index: "SymbolIndex", order: memoryview, field: int):
+        self.index, self.order, self.field = index, order, field
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, i: int) -> str:
+        return self.index._value(self.order[i], self.field)
+
+
+class SymbolIndex:
+    """Compact, read-only index of the symbols in one full-market snapshot.
+
+    Build it with ``from_rows`` (or ``build``/``load_or_build`` from a client), save
+    it with ``save`` and reopen it with ``open``.
+    """
+
+    def __init__(self, buffer: Any):
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError("Not a symbol index file")
+        magic, version, little, count, bas_dt, blob_len = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a symbol index file")
+        if bool(little) != (sys.byteorder == "little"):
+            raise ValueError("Symbol index was written on a machine of another byte order")
+        self._buffer = buffer
+        self.basDt = bas_dt.decode().strip()
+        self.count = count
+        pos = _HEADER.size
+        n_offsets = count * _NFIELDS + 1
+        self._offsets = view[pos : pos + n_offsets * 4].cast("I")
+        pos += n_offsets * 4
+        self._orders = {}
+        for field in _SORTED:
+            self._orders[field] = view[pos : pos + count * 4].cast("I")
+            pos += count * 4
+        self._blob = view[pos : pos + blob_len]
+        self._fuzzy: list[tuple[str, str, int]] | None = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]], basDt: str = "") -> "SymbolIndex":
+        """Index the rows of a full-market snapshot (e.g. ``raw_items()`` of every page)."""
+        return cls(_encode(rows, basDt))
+
+    @classmethod
+    def open(cls, path: str | Path) -> "SymbolIndex":
+        """Memory-map a saved index."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def save(self, path: str | Path) -> None:
+        """Write the index atomically."""
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(self._buffer)
+        tmp.replace(path)
+
+    @classmethod
+    async def build(
+        cls,
+        client: DataPortalClient,
+        basDt: str | None = None,
+        endpoint: str = "getStockPriceInfo",
+        numOfRows: int = 1000,
+        lookback: int = 10,
+    ) -> "SymbolIndex":
+        """Index a full-market snapshot fetched with ``client``.
+
+        Without ``basDt`` the latest day with data is used, looking back up to
+        ``lookback`` weekdays from yesterday (KST).
+        """
+        method = getattr(client, endpoint)
+        days = [basDt] if basDt else _recent_weekdays(lookback)
+        for day in days:
+            rows: list[dict[str, Any]] = []
+            async for page in client.iter_pages(method, numOfRows=numOfRows, basDt=day):
+                rows.extend(page.raw_items())
+            if rows:
+                return cls.from_rows(rows, day)
+        raise ValueError(f"No {endpoint} rows for {', '.join(days)}")
+
+    @classmethod
+    async def load_or_build(
+        cls, path: str | Path, client: DataPortalClient, **kwargs: Any
+    ) -> "SymbolIndex":
+        """Open the index at ``path``, rebuilding it with ``build`` if it was not built
+        today (KST) or cannot be read."""
+        path = Path(path)
+        if path.exists():
+            built = datetime.fromtimestamp(path.stat().st_mtime, KST).date()
+            if built == datetime.now(KST).date():
+                try:
+                    return cls.open(path)
+                except ValueError:
+                    pass
+        index = await cls.build(client, **kwargs)
+        index.save(path)
+        return cls.open(path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Symbol]:
+        return (self._symbol(i) for i in range(self.count))
+
+    def __repr__(self) -> str:
+        return f"SymbolIndex(basDt={self.basDt!r}, symbols={self.count})"
+
+    def _value(self, i: int, field: int) -> str:
+        start = i * _NFIELDS + field
+        return bytes(self._blob[self._offsets[start] : self._offsets[start + 1]]).decode()
+
+    def _symbol(self, i: int) -> Symbol:
+        start = self._offsets[i * _NFIELDS]
+        values = []
+        for end in self._offsets[i * _NFIELDS + 1 : i * _NFIELDS + len(FIELDS) + 1]:
+            values.append(bytes(self._blob[start:end]).decode())
+            start = end
+        return Symbol(*values)
+
+    def _find(self, field: int, key: str) -> list[Symbol]:
+        order = self._orders[field]
+        keys = _Keys(self, order, field)
+        i = bisect_left(keys, key)
+        found = []
+        while i < len(keys) and keys[i] == key:
+            found.append(self._symbol(order[i]))
+            i += 1
+        return found
+
+    def by_srtnCd(self, srtnCd: str) -> Symbol | None:
+        found = self._find(0, srtnCd.removeprefix("A"))
+        return found[0] if found else None
+
+    def by_isinCd(self, isinCd: str) -> Symbol | None:
+        found = self._find(1, isinCd)
+        return found[0] if found else None
+
+    def by_crno(self, crno: str) -> list[Symbol]:
+        """Securities of a corporation (common and preferred shares share a ``crno``)."""
+        crno = crno.replace("-", "")
+        return self._find(4, crno) if crno else []
+
+    def by_name(self, itmsNm: str) -> list[Symbol]:
+        return self._find(_NORM, normalize(itmsNm))
+
+    def get(self, key: str) -> Symbol | None:
+        """Resolve a short code, ISIN, corporate registration number or exact name."""
+        key = key.strip()
+        found = self.by_srtnCd(key) or self.by_isinCd(key)
+        if found is None:
+            matches = self.by_crno(key) or self.by_name(key)
+            found = matches[0] if matches else None
+        return found
+
+    def prefix(self, text: str, limit: int = 10) -> list[Symbol]:
+        """Symbols whose name starts with ``text``, in name order.
+
+        Initial consonants only (``"ㅅㅅㅈ"``) match the names' choseong.
+        """
+        query = normalize(text)
+        field = _CHO if _is_choseong(query) else _NORM
+        order = self._orders[field]
+        keys = _Keys(self, order, field)
+        found = []
+        i = bisect_left(keys, query)
+        while i < len(keys) and len(found) < limit and keys[i].startswith(query):
+            found.append(self._symbol(order[i]))
+            i += 1
+        return found
+
+    def search(self, text: str, limit: int = 10, cutoff: float = 0.6) -> list[tuple[Symbol, float]]:
+        """Fuzzy name lookup, best first, as ``(symbol, score)`` with scores in [0, 1].
+
+        Names are compared jamo by jamo, so a misspelt syllable costs one or two jamo
+        rather than the whole syllable. Names containing the query score at least 0.9.
+        """
+        query = normalize(text)
+        if not query:
+            return []
+        if self._fuzzy is None:
+            names = (self._value(i, _NORM) for i in range(self.count))
+            self._fuzzy = [(name, _jamo(name), i) for i, name in enumerate(names)]
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        matcher.set_seq2(_jamo(query))
+        scored = []
+        for name, jamo, i in self._fuzzy:
+            if query in name:
+                scored.append((0.9 + 0.1 * len(query) / len(name), i))
+                continue
+            # Cheap upper bounds first, as in difflib.get_close_matches.
+            matcher.set_seq1(jamo)
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                scored.append((matcher.ratio(), i))
+        return [(self._symbol(i), score) for score, i in heapq.nlargest(limit, scored)]
+
+    def close(self) -> None:
+        """Release the memory map of an opened index."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._offsets.release()
+            for order in self._orders.values():
+                order.release()
+            self._blob.release()
+            self._fuzzy = None
+            self._buffer.close()
+
+
+def _recent_weekdays(count: int) -> list[str]:
+    """The last ``count`` weekdays before today (KST), newest first."""
+    day = datetime.now(KST).date()
+    days: list[str] = []
+    while len(days) < count:
+        day -= timedelta(days=1)
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+    return days
@@ -0,0 +1,36 @@
+"""Shared fixtures: the spec, a ``MockPortal`` serving it and a client of that portal.
+
+``@pytest.mark.portal(**kwargs)`` passes options to ``MockPortal.from_yaml`` (e.g.
+``total_count``) and ``@pytest.mark.client(**kwargs)`` to ``FinancialClient``, on a
+test or a whole module (``pytestmark``).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.mockserver import MockPortal
+
+SPEC = Path(__file__).parent.parent / "specs" / "financial_services.yaml"
+
+
+def _marker_kwargs(request: pytest.FixtureRequest, name: str) -> dict:
+    marker = request.node.get_closest_marker(name)
+    return dict(marker.kwargs) if marker else {}
+
+
+@pytest.fixture
+def spec() -> Path:
+    return SPEC
+
+
+@pytest.fixture
+def portal(request, spec) -> MockPortal:
+    return MockPortal.from_yaml(spec, **_marker_kwargs(request, "portal"))
+
+
+@pytest.fixture
+def client(request, portal) -> FinancialClient:
+    options = {"requests_per_second": 1000, **_marker_kwargs(request, "client")}
+    return FinancialClient("test_key", transport=portal.transport(), **options)
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+from kr_data_portal.backfill import Backfill, Checkpoint, WorkUnit, date_range
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+
+class FakeFinancialClient(FinancialClient):
+    """Serves ``rows_per_day`` synthetic rows for every ``basDt``."""
+
+    def __init__(self, rows_per_day: int, fail_on: set | None = None):
+        super().__init__(service_key="test_key")
+        self.rows_per_day = rows_per_day
+        self.fail_on = fail_on or set()
+        self.calls: list[tuple[str, int]] = []
+
+    async def getStockPriceInfo(self, numOfRows=10, pageNo=1, basDt=None, **kwargs):
+        if (basDt, pageNo) in self.fail_on:
+            raise RuntimeError(f"boom {basDt} {pageNo}")
+        self.calls.append((basDt, pageNo))
+        start = (pageNo - 1) * numOfRows
+        stop = min(start + numOfRows, self.rows_per_day)
+        data = {
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+                "body": {
+                    "items": {
+                        "item": [{"basDt": basDt, "srtnCd": str(i)} for i in range(start, stop)]
+                    },
+                    "numOfRows": numOfRows,
+                    "pageNo": pageNo,
+                    "totalCount": self.rows_per_day,
+                },
+            }
+        }
+        return DataPortalResponse[StockPriceInfoItem].model_validate(data)
+
+
+def test_date_range_skips_weekends():
+    # 2026-02-06 is a Friday
+    assert list(date_range("20260205", "20260210")) == [
+        "20260205",
+        "20260206",
+        "20260209",
+        "20260210",
+    ]
+    assert len(list(date_range("20260205", "20260210", skip_weekends=False))) == 6
+
+
+async def test_backfill_fetches_every_page(tmp_path):
+    client = FakeFinancialClient(rows_per_day=25)
+    received = []
+
+    job = Backfill(
+        client,
+        ["getStockPriceInfo"],
+        "20260205",
+        "20260206",
+        tmp_path / "ckpt.jsonl",
+        sink=lambda unit, page: received.append(unit),
+        numOfRows=10,
+    )
+    stats = await job.run()
+
+    assert sorted(client.calls) == [(d, p) for d in ("20260205", "20260206") for p in (1, 2, 3)]
+    assert stats.requests == 6
+    assert stats.rows == 50
+    assert stats.rows_per_second > 0
+    assert len(received) == 6
+
+
+async def test_backfill_resumes_from_checkpoint(tmp_path):
+    path = tmp_path / "ckpt.jsonl"
+    client = FakeFinancialClient(rows_per_day=25, fail_on={("20260206", 3)})
+
+    job = Backfill(client, ["getStockPriceInfo"], "20260205", "20260206", path, numOfRows=10)
+    with pytest.raises(RuntimeError, match="boom"):
+        await job.run()
+
+    first_run = set(client.calls)
+    client.fail_on = set()
+    client.calls = []
+    job = Backfill(client, ["getStockPriceInfo"], "20260205", "20260206", path, numOfRows=10)
+    stats = await job.run()
+
+    assert ("20260206", 3) in client.calls
+    assert first_run.isdisjoint(client.calls)
+    assert stats.skipped == len(first_run)
+
+
+def test_checkpoint_ignores_torn_line(tmp_path):
+    path = tmp_path / "ckpt.jsonl"
+    entry = {"endpoint": "getStockPriceInfo", "basDt": "20260205", "page": 1, "pages": 3}
+    path.write_text(json.dumps(entry) + "\n" + '{"endpoint": "getSt', encoding="utf-8")
+
+    checkpoint = Checkpoint(path)
+
+    assert checkpoint.is_done(WorkUnit("getStockPriceInfo", "20260205", 1))
+    assert checkpoint.pages_for("getStockPriceInfo", "20260205") == 3
+
+    checkpoint.record(WorkUnit("getStockPriceInfo", "20260205", 2), rows=10)
+    reloaded = Checkpoint(path)
+
+    assert reloaded.is_done(WorkUnit("getStockPriceInfo", "20260205", 1))
+    assert reloaded.is_done(WorkUnit("getStockPriceInfo", "20260205", 2))
+    assert reloaded.pages_for("getStockPriceInfo", "20260205") == 3
+
+
+def test_backfill_rejects_unknown_endpoint(tmp_path):
+    client = FakeFinancialClient(rows_per_day=1)
+    with pytest.raises(ValueError, match="getNothing"):
+        Backfill(client, ["getNothing"], "20260205", "20260205", tmp_path / "c.jsonl")
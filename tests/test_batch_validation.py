@@ -0,0 +1,51 @@
+from pydantic import BaseModel
+
+from kr_data_portal.models.base import DataPortalResponse, list_adapter
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+
+class StrictItem(BaseModel):
+    name: str
+    value: int
+
+
+def make_response(items) -> DataPortalResponse[StrictItem]:
+    data = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body": {"items": {"item": items}, "numOfRows": 10, "pageNo": 1, "totalCount": 3},
+        }
+    }
+    return DataPortalResponse[StrictItem].model_validate(data)
+
+
+def test_validate_items_reports_failures_per_row():
+    response = make_response(
+        [
+            {"name": "Samsung", "value": 55400},
+            {"name": "Broken", "value": "not a number"},
+            {"name": "SK Hynix", "value": 180000},
+        ]
+    )
+
+    result = response.validate_items()
+
+    assert [type(item) for item in result.items] == [StrictItem, dict, StrictItem]
+    assert result.items[1] == {"name": "Broken", "value": "not a number"}
+    assert list(result.errors) == [1]
+    assert result.errors[1][0]["loc"] == (1, "value")
+
+
+def test_items_keeps_non_dict_rows_in_place():
+    response = make_response(["raw", {"name": "A", "value": "x"}, {"name": "B", "value": 2}])
+
+    result = response.validate_items()
+
+    assert result.items[0] == "raw"
+    assert result.items[1] == {"name": "A", "value": "x"}
+    assert result.items[2] == StrictItem(name="B", value=2)
+    assert list(result.errors) == [1]
+
+
+def test_list_adapter_is_cached():
+    assert list_adapter(StockPriceInfoItem) is list_adapter(StockPriceInfoItem)
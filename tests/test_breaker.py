@@ -0,0 +1,177 @@
+import httpx
+import pytest
+
+from kr_data_portal.breaker import CircuitBreaker, CircuitBreakers
+from kr_data_portal.exceptions import CircuitOpenError, DataPortalError, ServiceError
+from kr_data_portal.financial_services import FinancialClient
+
+OK_BODY = b'{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL SERVICE"},"body":{}}}'
+NODATA_BODY = b'{"response":{"header":{"resultCode":"03","resultMsg":"NODATA_ERROR"}}}'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("kr_data_portal.breaker.time.monotonic", clock)
+    return clock
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        with pytest.raises(httpx.ConnectError), breaker.guard():
+            raise httpx.ConnectError("refused")
+
+
+def succeed(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        with breaker.guard():
+            pass
+
+
+def test_opens_at_failure_rate(clock):
+    breaker = CircuitBreaker("u", failure_rate=0.5, min_requests=4)
+
+    succeed(breaker, 2)
+    fail(breaker)
+    assert breaker.state == "closed"
+    fail(breaker)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as excinfo, breaker.guard():
+        pass
+    assert excinfo.value.url == "u"
+
+
+def test_old_outcomes_leave_the_window(clock):
+    breaker = CircuitBreaker("u", failure_rate=0.5, min_requests=4, window=10.0)
+
+    fail(breaker, 3)
+    clock.now += 11
+    succeed(breaker, 3)
+    fail(breaker)
+
+    assert breaker.state == "closed"
+    assert breaker.failure_rate == 0.25
+
+
+def test_permanent_errors_do_not_count(clock):
+    breaker = CircuitBreaker("u", min_requests=2)
+
+    for _ in range(5):
+        with pytest.raises(ServiceError), breaker.guard():
+            raise ServiceError("no data", code="03")
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_probe_closes_or_reopens(clock):
+    breaker = CircuitBreaker("u", min_requests=1, reset_timeout=30.0, half_open_requests=1)
+    fail(breaker)
+    assert breaker.retry_in == 30.0
+
+    clock.now += 30
+    assert breaker.state == "half_open"
+    fail(breaker)
+    assert breaker.state == "open"
+
+    clock.now += 30
+    # Only one probe at a time: a second one fails while the first is in flight.
+    with breaker.guard(), pytest.raises(CircuitOpenError), breaker.guard():
+        pass
+    assert breaker.state == "closed"
+
+
+def test_request_admitted_closed_is_not_a_probe(clock):
+    breaker = CircuitBreaker("u", min_requests=1, half_open_requests=1)
+
+    with breaker.guard():
+        fail(breaker)
+        clock.now += 30
+        assert breaker.state == "half_open"
+    # The slow request finished half-open but neither closed it nor freed a slot.
+    assert breaker.state == "half_open"
+
+    with breaker.guard(), pytest.raises(CircuitOpenError), breaker.guard():
+        pass
+    assert breaker.state == "closed"
+
+    late = breaker.guard()
+    late.__enter__()
+    fail(breaker)
+    clock.now += 30
+    assert breaker.state == "half_open"
+    error = httpx.ConnectError("refused")
+    late.__exit__(type(error), error, None)
+    # Its late failure does not reopen the breaker either.
+    assert breaker.state == "half_open"
+
+
+def test_cancelled_probe_frees_its_slot(clock):
+    breaker = CircuitBreaker("u", min_requests=1)
+    fail(breaker)
+    clock.now += 30
+
+    with pytest.raises(KeyboardInterrupt), breaker.guard():
+        raise KeyboardInterrupt
+
+    assert breaker.state == "half_open"
+    succeed(breaker)
+    assert breaker.state == "closed"
+
+
+async def test_client_fails_fast_per_endpoint(clock):
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        if "Derivatives" in request.url.path:
+            return httpx.Response(503)
+        return httpx.Response(200, content=OK_BODY)
+
+    client = FinancialClient(
+        "test_key",
+        requests_per_second=1000,
+        coalesce=False,
+        breakers=CircuitBreakers(min_requests=2, failure_rate=0.5),
+        transport=httpx.MockTransport(handler),
+    )
+
+    for _ in range(2):
+        with pytest.raises(DataPortalError, match="HTTP 503"):
+            await client.getDerivativesPriceInfo(basDt="20260205")
+    with pytest.raises(CircuitOpenError):
+        await client.getDerivativesPriceInfo(basDt="20260205")
+    await client.getStockPriceInfo(basDt="20260205")
+
+    assert len(sent) == 3
+    assert client.circuit_state("getDerivativesPriceInfo") == "open"
+    assert client.circuit_state(client.getStockPriceInfo) == "closed"
+    assert set(client.breakers.states().values()) == {"open", "closed"}
+
+
+async def test_no_data_keeps_circuit_closed(clock):
+    client = FinancialClient(
+        "test_key",
+        requests_per_second=1000,
+        coalesce=False,
+        breakers=CircuitBreakers(min_requests=1),
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=NODATA_BODY)),
+    )
+
+    for _ in range(3):
+        with pytest.raises(ServiceError):
+            await client.getStockPriceInfo(basDt="20260205")
+
+    assert client.circuit_state("getStockPriceInfo") == "closed"
+
+
+def test_circuit_state_without_breakers():
+    assert FinancialClient("test_key").circuit_state("getStockPriceInfo") == "closed"
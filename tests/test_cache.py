@@ -0,0 +1,245 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+
+from kr_data_portal import client as client_module
+from kr_data_portal.cache import KST, MemoryCache, ResponseCache, cache_key, expires_at
+from kr_data_portal.financial_services import FinancialClient
+
+PAGE = {
+    "response": {
+        "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+        "body": {
+            "items": {"item": [{"itmsNm": "삼성전자", "clpr": "159300", "basDt": "20260205"}]},
+            "numOfRows": 1,
+            "pageNo": 1,
+            "totalCount": 1,
+        },
+    }
+}
+
+
+def test_cache_key_ignores_param_order_and_service_key():
+    url = "https://apis.data.go.kr/x/getStockPriceInfo"
+    a = cache_key(url, {"basDt": "20260205", "itmsNm": "삼성전자", "serviceKey": "k1"})
+    b = cache_key(url, {"itmsNm": "삼성전자", "serviceKey": "k2", "basDt": "20260205"})
+    assert a == b
+    assert a == cache_key(
+        url.replace("https://", "http://"), {"basDt": "20260205", "itmsNm": "삼성전자"}
+    )
+    assert a != cache_key(url, {"basDt": "20260206", "itmsNm": "삼성전자"})
+
+
+def test_expires_at_past_dates_never_expire():
+    now = datetime(2026, 2, 6, 10, 0, tzinfo=KST)
+    assert expires_at({"basDt": "20260205"}, now=now) is None
+
+
+def test_expires_at_empty_past_day_expires():
+    now = datetime(2026, 2, 6, 10, 0, tzinfo=KST)
+    publish = datetime(2026, 2, 6, 16, 0, tzinfo=KST).timestamp()
+    empty = {"response": {"body": {"totalCount": 0, "items": ""}}}
+    full = {"response": {"body": {"totalCount": 1, "items": {"item": [{}]}}}}
+
+    assert expires_at({"basDt": "20260205"}, now=now, data=empty) == publish
+    assert expires_at({"basDt": "20260205"}, now=now, data=full) is None
+
+
+def test_expires_at_open_ended_range_expires():
+    now = datetime(2026, 2, 6, 10, 0, tzinfo=KST)
+    publish = datetime(2026, 2, 6, 16, 0, tzinfo=KST).timestamp()
+
+    assert expires_at({"beginBasDt": "20200101"}, now=now) == publish
+    assert expires_at({"beginBasDt": "20200101", "endBasDt": "20200201"}, now=now) is None
+    assert expires_at({"beginBasDt": "20200101", "endBasDt": "20260207"}, now=now) == publish
+
+
+def test_expires_at_same_day_expires_at_next_publish_time():
+    before = datetime(2026, 2, 6, 10, 0, tzinfo=KST)
+    after = datetime(2026, 2, 6, 17, 0, tzinfo=KST)
+
+    assert (
+        expires_at({"basDt": "20260206"}, now=before)
+        == datetime(2026, 2, 6, 16, 0, tzinfo=KST).timestamp()
+    )
+    assert (
+        expires_at({"basDt": "20260206"}, now=after)
+        == datetime(2026, 2, 7, 16, 0, tzinfo=KST).timestamp()
+    )
+    assert expires_at({}, now=before) == datetime(2026, 2, 6, 16, 0, tzinfo=KST).timestamp()
+
+
+def test_response_cache_roundtrip_and_expiry(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db")
+
+    cache.set("forever", PAGE, None)
+    cache.set("expired", PAGE, 1.0)
+
+    assert cache.get("forever") == PAGE
+    assert cache.get("expired") is None
+    assert cache.get("missing") is None
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db")
+    cache.set("a", PAGE, None)
+    entry_size = cache.size
+    cache.max_bytes = entry_size * 2
+
+    cache.set("b", PAGE, None)
+    cache.get("a")
+    cache.set("c", PAGE, None)
+
+    assert cache.get("a") == PAGE
+    assert cache.get("b") is None
+    assert cache.get("c") == PAGE
+    assert cache.size <= cache.max_bytes
+
+
+def test_response_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.db"
+    ResponseCache(path).set("a", PAGE, None)
+
+    reopened = ResponseCache(path)
+
+    assert reopened.get("a") == PAGE
+    assert reopened.size > 0
+
+
+async def test_client_serves_past_dates_from_cache(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json=PAGE)
+
+    client = FinancialClient(service_key="test_key", cache=ResponseCache(tmp_path / "cache.db"))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async with client:
+        first = await client.getStockPriceInfo(itmsNm="삼성전자", basDt="20260205")
+        second = await client.getStockPriceInfo(basDt="20260205", itmsNm="삼성전자")
+
+    assert len(calls) == 1
+    assert first.items()[0].clpr == second.items()[0].clpr == "159300"
+
+
+def test_memory_cache_is_bounded_lru():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", PAGE, None)
+    cache.set("b", PAGE, None)
+    cache.get("a")
+    cache.set("c", PAGE, None)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == PAGE
+    assert cache.get("a") is not PAGE
+    assert len(cache) == 2
+
+    cache.set("old", PAGE, 1.0)
+    assert cache.get("old") is None
+
+
+def make_counting_client(**kwargs):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=PAGE)
+
+    client = FinancialClient(service_key="test_key", **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, calls
+
+
+async def test_identical_in_flight_requests_are_coalesced():
+    client, calls = make_counting_client()
+
+    async with client:
+        responses = await asyncio.gather(
+            *(client.getStockPriceInfo(basDt="20260205", itmsNm="삼성전자") for _ in range(10)),
+            client.getStockPriceInfo(basDt="20260205", itmsNm="SK하이닉스"),
+        )
+
+    assert len(calls) == 2
+    assert all(r.items()[0].clpr == "159300" for r in responses)
+    assert client._inflight == {}
+
+
+async def test_coalescing_can_be_disabled():
+    client, calls = make_counting_client(coalesce=False)
+
+    async with client:
+        await asyncio.gather(*(client.getStockPriceInfo(basDt="20260205") for _ in range(3)))
+
+    assert len(calls) == 3
+
+
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    client, calls = make_counting_client()
+
+    async with client:
+        first = asyncio.ensure_future(client.getStockPriceInfo(basDt="20260205"))
+        second = asyncio.ensure_future(client.getStockPriceInfo(basDt="20260205"))
+        await asyncio.sleep(0)
+        first.cancel()
+        response = await second
+
+    assert response.items()[0].clpr == "159300"
+    assert len(calls) == 1
+
+
+async def test_memory_cache_serves_repeated_calls():
+    client, calls = make_counting_client(memory_cache_size=8)
+
+    async with client:
+        await client.getStockPriceInfo(basDt="20260205")
+        await client.getStockPriceInfo(basDt="20260205")
+
+    assert len(calls) == 1
+
+
+async def test_shared_results_are_independent_copies():
+    client, calls = make_counting_client(memory_cache_size=8)
+
+    async with client:
+        first, second = await asyncio.gather(
+            client.getStockPriceInfo(basDt="20260205"), client.getStockPriceInfo(basDt="20260205")
+        )
+        first.raw_items()[0]["clpr"] = "0"
+        first.raw_items().clear()
+        cached = await client.getStockPriceInfo(basDt="20260205")
+        cached.raw_items()[0]["clpr"] = "1"
+        again = await client.getStockPriceInfo(basDt="20260205")
+
+    assert len(calls) == 1
+    assert second.raw_items()[0]["clpr"] == "159300"
+    assert again.raw_items()[0]["clpr"] == "159300"
+
+
+async def test_only_joined_callers_are_copied(monkeypatch):
+    copies = []
+    copy_response = client_module.copy_response
+    monkeypatch.setattr(
+        client_module, "copy_response", lambda data: copies.append(data) or copy_response(data)
+    )
+    client, calls = make_counting_client()
+
+    async def fetch_and_mutate():
+        response = await client.getStockPriceInfo(basDt="20260205")
+        response.raw_items()[0]["clpr"] = "0"
+        return response
+
+    async with client:
+        await client.getStockPriceInfo(basDt="20260206")
+        assert copies == []
+        _, joined = await asyncio.gather(
+            fetch_and_mutate(), client.getStockPriceInfo(basDt="20260205")
+        )
+
+    assert len(calls) == 2
+    assert len(copies) == 1
+    # The copy is taken before the caller that started the request can mutate it.
+    assert joined.raw_items()[0]["clpr"] == "159300"
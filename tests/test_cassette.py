@@ -0,0 +1,98 @@
+import httpx
+import pytest
+
+from kr_data_portal.cassette import REDACTED, CassetteMiss, CassetteStore, CassetteTransport
+from kr_data_portal.financial_services import FinancialClient
+
+# Keys are issued in an encoded and a decoded form; clients usually send the encoded one.
+KEY = "abc%2Bdef%2Fghi%3D%3D"
+DECODED_KEY = "abc+def/ghi=="
+BODY = (
+    '{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL SERVICE."},'
+    '"body":{"numOfRows":1,"pageNo":1,"totalCount":1,"items":{"item":[{"basDt":"20260205",'
+    '"srtnCd":"005930","itmsNm":"삼성전자","clpr":"100","key":"%s"}]}}}}'
+)
+
+
+def portal():
+    calls = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        key = request.url.params["serviceKey"]
+        return httpx.Response(200, content=(BODY % key).encode(), headers={"X-Test": "1"})
+
+    return httpx.MockTransport(handle), calls
+
+
+async def test_record_then_replay_offline(tmp_path):
+    path = tmp_path / "cassette.db"
+    inner, calls = portal()
+    recorder = CassetteTransport(path, mode="record", transport=inner)
+    async with FinancialClient(KEY, transport=recorder) as client:
+        recorded = await client.getStockPriceInfo(basDt="20260205", numOfRows=1)
+    assert len(calls) == 1
+    assert recorded.raw_items()[0]["key"] == DECODED_KEY
+
+    replayer = CassetteTransport(path, mode="replay")
+    async with FinancialClient("another_key", transport=replayer) as client:
+        replayed = await client.getStockPriceInfo(numOfRows=1, basDt="20260205")
+    assert len(calls) == 1
+    assert replayer.hits == 1
+    assert replayed.raw_items()[0]["itmsNm"] == "삼성전자"
+    assert replayed.raw_items()[0]["key"] == REDACTED
+
+
+async def test_service_key_is_not_stored(tmp_path):
+    path = tmp_path / "cassette.db"
+    inner, _ = portal()
+    async with FinancialClient(
+        KEY, transport=CassetteTransport(path, mode="record", transport=inner)
+    ) as client:
+        await client.getStockPriceInfo(basDt="20260205")
+
+    store = CassetteStore(path)
+    assert len(store) == 1
+    assert "serviceKey" not in store.urls()[0]
+    store.close()
+    assert KEY.encode() not in path.read_bytes()
+    assert DECODED_KEY.encode() not in path.read_bytes()
+
+
+async def test_replay_miss_raises(tmp_path):
+    transport = CassetteTransport(tmp_path / "cassette.db", mode="replay")
+    async with FinancialClient(KEY, transport=transport, use_retry=False) as client:
+        with pytest.raises(CassetteMiss, match="getStockPriceInfo"):
+            await client.getStockPriceInfo(basDt="20260205")
+
+
+async def test_auto_records_only_misses(tmp_path):
+    inner, calls = portal()
+    transport = CassetteTransport(tmp_path / "cassette.db", mode="auto", transport=inner)
+    async with FinancialClient(KEY, transport=transport, coalesce=False) as client:
+        await client.getStockPriceInfo(basDt="20260205")
+        await client.getStockPriceInfo(basDt="20260205")
+        await client.getStockPriceInfo(basDt="20260206")
+    assert len(calls) == 2
+    assert (transport.hits, transport.recorded) == (1, 2)
+
+
+async def test_replayed_latency(tmp_path, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    store = CassetteStore(tmp_path / "cassette.db")
+    inner, _ = portal()
+    async with FinancialClient(
+        KEY, transport=CassetteTransport(store, mode="record", transport=inner)
+    ) as client:
+        await client.getStockPriceInfo(basDt="20260205")
+    monkeypatch.setattr("kr_data_portal.cassette.asyncio.sleep", fake_sleep)
+    async with FinancialClient(
+        KEY, transport=CassetteTransport(store, mode="replay", latency=2.0)
+    ) as client:
+        await client.getStockPriceInfo(basDt="20260205")
+    (elapsed,) = [i.elapsed for i in store._memory.values()]
+    assert delays == [elapsed * 2.0]
@@ -0,0 +1,114 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from kr_data_portal.columnar import NAT, PriceFrame
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+RAW = json.loads((Path(__file__).parent.parent / "response_raw.json").read_text(encoding="utf-8"))
+
+
+def make_response(items: list[dict]) -> DataPortalResponse[StockPriceInfoItem]:
+    data = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body": {
+                "items": {"item": items},
+                "numOfRows": 10,
+                "pageNo": 1,
+                "totalCount": len(items),
+            },
+        }
+    }
+    return DataPortalResponse[StockPriceInfoItem].model_validate(data)
+
+
+def test_columns_types_numeric_fields():
+    response = DataPortalResponse[StockPriceInfoItem].model_validate(RAW)
+
+    frame = response.columns()
+
+    assert len(frame) == 1
+    assert list(frame.columns) == list(StockPriceInfoItem.model_fields)
+    assert frame["clpr"].typecode == "q"
+    assert frame["clpr"][0] == 159300
+    assert frame["vs"][0] == -9800
+    assert frame["mrktTotAmt"][0] == 942998320974600
+    assert frame["fltRt"][0] == pytest.approx(-5.8)
+    assert frame["itmsNm"] == ["삼성전자"]
+
+
+def test_columns_tolerate_missing_and_malformed_values():
+    frame = make_response(
+        [
+            {"basDt": "20260205", "clpr": "100", "fltRt": "1.5"},
+            {"basDt": None, "clpr": "", "fltRt": "-"},
+            {"basDt": "bad", "clpr": "12.0"},
+        ]
+    ).columns(["basDt", "clpr", "fltRt"])
+
+    assert list(frame["clpr"]) == [100, 0, 12]
+    assert frame.nulls == {"clpr": [1]}
+    assert frame["fltRt"][0] == 1.5
+    assert frame["fltRt"][1] != frame["fltRt"][1]  # NaN
+    assert frame["basDt"][1] == NAT
+    assert frame["basDt"][2] == NAT
+
+
+async def test_from_pages_concatenates_stream():
+    async def pages():
+        yield make_response([{"srtnCd": "000001", "clpr": "1"}])
+        yield make_response([{"srtnCd": "000002", "clpr": "2"}, {"srtnCd": "000003", "clpr": "3"}])
+
+    frame = await PriceFrame.from_pages(pages(), fields=["srtnCd", "clpr"])
+
+    assert len(frame) == 3
+    assert list(frame["clpr"]) == [1, 2, 3]
+    assert frame["srtnCd"] == ["000001", "000002", "000003"]
+
+
+def test_to_numpy_dtypes():
+    np = pytest.importorskip("numpy")
+    frame = DataPortalResponse[StockPriceInfoItem].model_validate(RAW).columns()
+
+    arrays = frame.to_numpy()
+
+    assert arrays["clpr"].dtype == np.int64
+    assert arrays["fltRt"].dtype == np.float64
+    assert arrays["basDt"][0] == np.datetime64("2026-02-05")
+
+
+def test_to_arrow_schema():
+    pa = pytest.importorskip("pyarrow")
+    frame = DataPortalResponse[StockPriceInfoItem].model_validate(RAW).columns()
+
+    table = frame.to_arrow()
+
+    assert table.schema.field("clpr").type == pa.int64()
+    assert table.schema.field("basDt").type == pa.date32()
+    assert table.column("itmsNm").to_pylist() == ["삼성전자"]
+
+
+def test_missing_values_are_nulls_like_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    from kr_data_portal.parquet import ParquetSink, read_dataset
+
+    rows = [
+        {"basDt": "20260205", "srtnCd": "000001", "clpr": "100", "fltRt": "1.5"},
+        {"basDt": "20260205", "srtnCd": "000002", "clpr": "", "fltRt": "-"},
+    ]
+    frame = PriceFrame.from_rows(rows[:1])
+    frame.extend(PriceFrame.from_rows(rows[1:]))
+    sink = ParquetSink(tmp_path)
+    sink.write("getStockPriceInfo", rows)
+    sink.close()
+
+    written = read_dataset(tmp_path).to_table()
+    table = frame.to_arrow()
+    for name in ("clpr", "fltRt"):
+        assert table.column(name).to_pylist() == written.column(name).to_pylist()
+    assert table.column("clpr").to_pylist() == [100, None]
+    assert frame.to_pandas()["clpr"].dtype == pd.Int64Dtype()
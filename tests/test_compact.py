@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.compact import CompactRecord, compact_model
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+RAW = json.loads((Path(__file__).parent.parent / "response_raw.json").read_text(encoding="utf-8"))
+
+
+def test_compact_model_mirrors_model_fields():
+    record_cls = compact_model(StockPriceInfoItem)
+
+    assert issubclass(record_cls, CompactRecord)
+    assert record_cls.__slots__ == tuple(StockPriceInfoItem.model_fields)
+    assert compact_model(StockPriceInfoItem) is record_cls
+
+
+def test_records_match_validated_items():
+    response = DataPortalResponse[StockPriceInfoItem].model_validate(RAW)
+
+    record = response.records()[0]
+    item = response.items()[0]
+
+    assert not hasattr(record, "__dict__")
+    assert record.as_dict() == item.model_dump()
+    assert record.to_model() == item
+
+
+def test_records_intern_repeating_strings():
+    record_cls = compact_model(StockPriceInfoItem)
+    a = record_cls.from_row({"itmsNm": "".join(["삼성", "전자"]), "clpr": "1"})
+    b = record_cls.from_row({"itmsNm": "".join(["삼성전", "자"]), "clpr": "2"})
+
+    assert a.itmsNm is b.itmsNm
+    assert a != b
+    assert a == record_cls(itmsNm="삼성전자", clpr="1")
+
+
+async def test_paginate_yields_compact_records():
+    client = FinancialClient(service_key="test_key")
+
+    async def operation(**kwargs):
+        return DataPortalResponse[StockPriceInfoItem].model_validate(RAW)
+
+    records = [r async for r in client.paginate(operation, compact=True)]
+
+    assert len(records) == 1
+    assert records[0].itmsNm == "삼성전자"
+    assert isinstance(records[0], compact_model(StockPriceInfoItem))
@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+import httpx
+
+from kr_data_portal.financial_services import FinancialClient
+
+RAW = json.loads((Path(__file__).parent.parent / "response_raw.json").read_text(encoding="utf-8"))
+
+
+class RecordingTransport(httpx.MockTransport):
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+        super().__init__(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=RAW)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def test_shared_transport_is_used_and_left_open():
+    transport = RecordingTransport()
+
+    async with FinancialClient(service_key="a", transport=transport) as first:
+        await first.getStockPriceInfo(basDt="20260205")
+    async with FinancialClient(service_key="b", transport=transport) as second:
+        await second.getEtfPriceInfo(basDt="20260205")
+
+    assert len(transport.requests) == 2
+    assert not transport.closed
+
+
+async def test_accept_encoding_header():
+    transport = RecordingTransport()
+
+    async with FinancialClient(service_key="a", transport=transport, accept_encoding="gzip") as c:
+        await c.getStockPriceInfo(basDt="20260205")
+
+    assert transport.requests[0].headers["Accept-Encoding"] == "gzip"
+
+
+async def test_pool_limits_reach_httpx():
+    client = FinancialClient(service_key="a", max_connections=7, max_keepalive_connections=3)
+
+    pool = client._client._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    await client.close()
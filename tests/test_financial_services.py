@@ -31,7 +31,7 @@ async def test_get_stock_price_info(mock_client):
         }
     }
 
-    with patch.object(mock_client, "_request", new_callable=AsyncMock) as mock_req:
+    with patch.object(mock_client, "_get", new_callable=AsyncMock) as mock_req:
         mock_req.return_value = mock_response
 
         response = await mock_client.getStockPriceInfo(itmsNm="삼성전자")
@@ -59,7 +59,7 @@ async def test_get_stock_price_info_samsung_20260205(mock_client):
         }
     }
 
-    with patch.object(mock_client, "_request", new_callable=AsyncMock) as mock_req:
+    with patch.object(mock_client, "_get", new_callable=AsyncMock) as mock_req:
         mock_req.return_value = mock_response
 
         response = await mock_client.getStockPriceInfo(itmsNm="삼성전자", basDt="20260205")
@@ -86,7 +86,7 @@ async def test_get_etf_price_info(mock_client):
         }
     }
 
-    with patch.object(mock_client, "_request", new_callable=AsyncMock) as mock_req:
+    with patch.object(mock_client, "_get", new_callable=AsyncMock) as mock_req:
         mock_req.return_value = mock_response
 
         response = await mock_client.getEtfPriceInfo(itmsNm="KODEX 200")
@@ -110,7 +110,7 @@ async def test_get_etn_price_info(mock_client):
         }
     }
 
-    with patch.object(mock_client, "_request", new_callable=AsyncMock) as mock_req:
+    with patch.object(mock_client, "_get", new_callable=AsyncMock) as mock_req:
         mock_req.return_value = mock_response
 
         response = await mock_client.getEtnPriceInfo(itmsNm="ETN ITEM")
@@ -134,7 +134,7 @@ async def test_get_derivatives_price_info(mock_client):
         }
     }
 
-    with patch.object(mock_client, "_request", new_callable=AsyncMock) as mock_req:
+    with patch.object(mock_client, "_get", new_callable=AsyncMock) as mock_req:
         mock_req.return_value = mock_response
 
         response = await mock_client.getDerivativesPriceInfo(itmsNm="FUTURES")
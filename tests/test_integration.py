@@ -1,38 +1,46 @@
-import os
-import pytest
+"""Checks against real portal data.
+
+With ``DATA_PORTAL_SERVICE_KEY`` set the requests go to the portal; add
+``DATA_PORTAL_RECORD=1`` to re-record ``cassettes/integration.db`` from the live
+responses. Without a key the recorded responses are replayed.
+"""
+
 import asyncio
+import os
+from pathlib import Path
+
+from kr_data_portal.cassette import CassetteTransport
 from kr_data_portal.financial_services import FinancialClient
 from kr_data_portal.models.financial_services import StockPriceInfoItem
 
-@pytest.mark.asyncio
-async def test_real_data_validation():
+CASSETTE = Path(__file__).parent / "cassettes" / "integration.db"
+
+
+def real_client() -> FinancialClient:
     service_key = os.getenv("DATA_PORTAL_SERVICE_KEY")
     if not service_key:
-        pytest.skip("DATA_PORTAL_SERVICE_KEY not set, skipping real data validation")
-    
-    client = FinancialClient(service_key=service_key)
-    
-    # 삼성전자 (005930) 2026-02-05 데이터 검증
-    # 실제 환경에서 2026년 데이터가 없을 수 있으므로 (미래 날짜), 
-    # 테스트 요청은 하되 결과가 00 (정상) 인지 확인
-    try:
-        response = await client.getStockPriceInfo(itmsNm="삼성전자", basDt="20260205")
-        
-        # API 응답 자체가 성공했는지 확인 (인증키 유효성 등)
-        assert response.response.header.resultCode == "00", f"API Error: {response.response.header.resultMsg}"
-        
-        # 데이터가 있다면 값 검증 (미래 데이터라 없을 가능성 높음)
-        items = response.items(StockPriceInfoItem)
-        if items:
-            assert items[0].itmsNm == "삼성전자"
-            # 실제 값이 159300인지는 당일에 따라 다를 수 있으나, 여기선 형식 검증 위주
-            assert items[0].clpr is not None
-    except Exception as e:
-        pytest.fail(f"Real data validation failed: {e}")
+        return FinancialClient("replay", transport=CassetteTransport(CASSETTE, mode="replay"))
+    if os.getenv("DATA_PORTAL_RECORD"):
+        return FinancialClient(service_key, transport=CassetteTransport(CASSETTE, mode="record"))
+    return FinancialClient(service_key)
+
+
+async def test_real_data_validation():
+    # 삼성전자 (005930) 2026-02-05
+    async with real_client() as client:
+        response = await client.getStockPriceInfo(itmsNm="삼성전자", basDt="20260205", numOfRows=1)
+
+    # API 응답 자체가 성공했는지 확인 (인증키 유효성 등)
+    header = response.response.header
+    assert header.resultCode == "00", f"API Error: {header.resultMsg}"
+
+    # 데이터가 있다면 값 검증 (형식 검증 위주)
+    items = response.items(StockPriceInfoItem)
+    if items:
+        assert items[0].itmsNm == "삼성전자"
+        assert items[0].clpr is not None
+
 
 if __name__ == "__main__":
     # For manual testing
-    if os.getenv("DATA_PORTAL_SERVICE_KEY"):
-        asyncio.run(test_real_data_validation())
-    else:
-        print("Skipping real data validation (no API key)")
+    asyncio.run(test_real_data_validation())
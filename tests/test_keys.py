@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from kr_data_portal.exceptions import NoServiceKeyError, ServiceError
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.keys import ServiceKeyPool, fingerprint
+
+OK_BODY = b'{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL SERVICE"},"body":{}}}'
+
+
+def xml_error(code: str, name: str) -> bytes:
+    return (
+        f"<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+        f"<returnAuthMsg>{name}</returnAuthMsg><returnReasonCode>{code}</returnReasonCode>"
+        f"</cmmMsgHeader></OpenAPI_ServiceResponse>"
+    ).encode()
+
+
+def key_client(pool: ServiceKeyPool, bodies: dict[str, bytes] | None = None):
+    """Client answering OK, or with ``bodies[key]`` for the given keys."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.params["serviceKey"]
+        seen.append(key)
+        return httpx.Response(200, content=(bodies or {}).get(key, OK_BODY))
+
+    client = FinancialClient(pool, coalesce=False, transport=httpx.MockTransport(handler))
+    return client, seen
+
+
+async def test_requests_spread_over_keys():
+    pool = ServiceKeyPool(["a", "b", "c"], requests_per_second=1000)
+    client, seen = key_client(pool)
+
+    await asyncio.gather(
+        *(client._request("https://example.com/op", params={"pageNo": i}) for i in range(30))
+    )
+
+    assert sorted(seen.count(k) for k in "abc") == [10, 10, 10]
+    assert [s.used for s in pool.states] == [10, 10, 10]
+    assert pool.rate == 3000
+    assert client.rate == 3000
+
+
+async def test_least_used_key_is_preferred():
+    pool = ServiceKeyPool(["a", "b"], daily_limit=100)
+    pool.states[0].used = 50
+
+    async with pool.acquire() as state:
+        assert state.key == "b"
+
+
+async def test_invalid_key_is_taken_out_of_rotation():
+    pool = ServiceKeyPool(["bad", "good"], requests_per_second=1000)
+    client, seen = key_client(pool, {"bad": xml_error("30", "SERVICE_KEY_IS_NOT_REGISTERED_ERROR")})
+
+    with pytest.raises(ServiceError):
+        await client._request("https://example.com/op", params={"pageNo": 1})
+    for i in range(3):
+        await client._request("https://example.com/op", params={"pageNo": i})
+
+    assert seen == ["bad", "good", "good", "good"]
+    assert [s.key for s in pool.available] == ["good"]
+    assert pool.states[0].disabled == "invalid"
+
+
+async def test_exhausted_pool_raises():
+    pool = ServiceKeyPool(["a"], daily_limit=2, requests_per_second=1000)
+    client, _ = key_client(pool)
+
+    for i in range(2):
+        await client._request("https://example.com/op", params={"pageNo": i})
+
+    with pytest.raises(NoServiceKeyError):
+        await client._request("https://example.com/op", params={"pageNo": 3})
+    assert pool.remaining == 0
+
+
+async def test_quota_error_disables_key_until_next_day(monkeypatch):
+    pool = ServiceKeyPool(["a", "b"], requests_per_second=1000)
+    monkeypatch.setattr(pool, "_today", lambda: "20260205")
+    pool._day = "20260205"
+    client, _ = key_client(
+        pool, {"a": xml_error("22", "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR")}
+    )
+
+    with pytest.raises(ServiceError):
+        await client._request("https://example.com/op", params={"pageNo": 1})
+    assert [s.key for s in pool.available] == ["b"]
+
+    monkeypatch.setattr(pool, "_today", lambda: "20260206")
+    assert [s.key for s in pool.available] == ["a", "b"]
+    assert [s.used for s in pool.states] == [0, 0]
+
+
+async def test_counts_persist_per_day_without_raw_keys(tmp_path, monkeypatch):
+    path = tmp_path / "keys.json"
+    pool = ServiceKeyPool(["secret-a", "secret-b"], path=path, save_interval=0)
+    for _ in range(3):
+        async with pool.acquire():
+            pass
+
+    text = path.read_text()
+    assert "secret" not in text
+    assert sum(json.loads(text)["used"].values()) == 3
+
+    restored = ServiceKeyPool(["secret-a", "secret-b"], path=path)
+    assert sum(s.used for s in restored.states) == 3
+    assert {s.fingerprint for s in restored.states} == {
+        fingerprint("secret-a"),
+        fingerprint("secret-b"),
+    }
+
+    monkeypatch.setattr(ServiceKeyPool, "_today", staticmethod(lambda: "29991231"))
+    tomorrow = ServiceKeyPool(["secret-a", "secret-b"], path=path)
+    assert sum(s.used for s in tomorrow.states) == 0
+
+
+def test_pool_needs_keys():
+    with pytest.raises(ValueError, match="at least one key"):
+        ServiceKeyPool([])
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from kr_data_portal import metrics
+from kr_data_portal.exceptions import ServiceError
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.metrics import MetricsCollector, RequestEvent, ValidationEvent
+from kr_data_portal.retry import RetryPolicy
+
+RAW_BYTES = (Path(__file__).parent.parent / "response_raw.json").read_bytes()
+TIMEOUT_BODY = b'{"response":{"header":{"resultCode":"05","resultMsg":"SERVICE_TIMEOUT"}}}'
+
+
+@pytest.fixture
+def events():
+    seen: list = []
+    metrics.add_hook(seen.append)
+    yield seen
+    metrics.remove_hook(seen.append)
+
+
+def client_for(*bodies: bytes, **kwargs) -> FinancialClient:
+    responses = iter(bodies)
+    return FinancialClient(
+        "test_key",
+        requests_per_second=1000,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=next(responses))),
+        **kwargs,
+    )
+
+
+async def test_request_event_has_stage_timings(events):
+    client = client_for(RAW_BYTES)
+
+    response = await client.getStockPriceInfo(basDt="20260205")
+    response.items()
+
+    request, validation = events
+    assert isinstance(request, RequestEvent)
+    assert request.endpoint == "getStockPriceInfo"
+    assert request.ok
+    assert request.status == 200
+    assert request.attempt == 0
+    assert request.bytes == len(RAW_BYTES)
+    stages = request.limiter_wait + request.network + request.body + request.decode
+    assert 0 < stages <= request.total
+    assert isinstance(validation, ValidationEvent)
+    assert validation.model == "StockPriceInfoItem"
+    assert validation.rows == len(response.raw_items())
+
+
+async def test_failed_attempts_carry_error_codes(events, monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("kr_data_portal.client.asyncio.sleep", no_sleep)
+    client = client_for(TIMEOUT_BODY, RAW_BYTES, retry=RetryPolicy())
+
+    await client.getStockPriceInfo(basDt="20260205")
+
+    assert [(e.attempt, e.error_code) for e in events] == [(0, "5"), (1, None)]
+
+
+async def test_no_events_without_hooks(monkeypatch):
+    def fail(event):
+        raise AssertionError("emitted without hooks")
+
+    monkeypatch.setattr(metrics, "emit", fail)
+    client = client_for(RAW_BYTES)
+
+    (await client.getStockPriceInfo(basDt="20260205")).items()
+
+
+def test_collector_aggregates_and_exports():
+    collector = MetricsCollector()
+    collector(RequestEvent("getStockPriceInfo", network=0.03, total=0.04, bytes=100, status=200))
+    collector(RequestEvent("getStockPriceInfo", attempt=1, total=2.0, error_code="5"))
+    collector(ValidationEvent("StockPriceInfoItem", rows=10, errors=1, seconds=0.002))
+
+    snapshot = collector.snapshot()
+    assert snapshot["requests"] == {"getStockPriceInfo": 2}
+    assert snapshot["retries"] == {"getStockPriceInfo": 1}
+    assert snapshot["errors"] == {"getStockPriceInfo:5": 1}
+    assert snapshot["seconds"]["total"]["getStockPriceInfo"]["p50"] == 0.05
+    assert snapshot["seconds"]["total"]["getStockPriceInfo"]["p99"] == 2.5
+
+    text = collector.to_prometheus()
+    assert 'kr_data_portal_requests_total{endpoint="getStockPriceInfo"} 2' in text
+    assert 'kr_data_portal_errors_total{endpoint="getStockPriceInfo",code="5"} 1' in text
+    assert (
+        'kr_data_portal_stage_seconds_bucket{stage="network",endpoint="getStockPriceInfo",le="0.05"} 2'
+        in text
+    )
+    assert (
+        'kr_data_portal_stage_seconds_count{stage="validate",model="StockPriceInfoItem"} 1' in text
+    )
+
+
+async def test_service_errors_still_raise_with_hooks(events):
+    client = client_for(b'{"response":{"header":{"resultCode":"03","resultMsg":"NODATA"}}}')
+
+    with pytest.raises(ServiceError):
+        await client.getStockPriceInfo(basDt="20260205")
+
+    assert events[0].error_code == "3"
+
+
+async def test_streamed_items_are_retried_and_reported(events):
+    client = client_for(
+        TIMEOUT_BODY, RAW_BYTES, retry=RetryPolicy(base_delay=0.0), adaptive_rate=True
+    )
+
+    items = [item async for item in client.stream_items(client.getStockPriceInfo)]
+
+    assert [item.itmsNm for item in items] == ["삼성전자"]
+    failed, ok = events
+    assert (failed.attempt, failed.error_code) == (0, "5")
+    assert (ok.attempt, ok.error_code, ok.bytes) == (1, None, len(RAW_BYTES))
+    assert client._limiter.average_latency is not None
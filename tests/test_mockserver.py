@@ -0,0 +1,125 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from kr_data_portal.client import page_count
+from kr_data_portal.exceptions import DataPortalError, ServiceError
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.mockserver import LocalPortalTransport, load_rows
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_operations_come_from_the_spec(portal):
+    names = {op.name for op in portal.operations.values()}
+    assert names == set(FinancialClient.endpoints)
+    assert portal.operations["getGetEtfPriceInfo"].filters == (
+        "basDt",
+        "itmsNm",
+        "beginBasDt",
+        "endBasDt",
+        "likeItmsNm",
+    )
+    assert portal.operations["getGetEtfPriceInfo"].comparisons["beginBasDt"] == ("basDt", "ge")
+
+
+@pytest.mark.portal(total_count=25)
+async def test_pagination_semantics(client):
+    last = await client.getStockPriceInfo(basDt="20260205", numOfRows=10, pageNo=3)
+    assert page_count(last, 10) == 3
+    assert [row["srtnCd"] for row in last.raw_items()] == [f"{i:06d}" for i in range(20, 25)]
+
+    rows = [item async for item in client.paginate(client.getEtfPriceInfo, numOfRows=10)]
+    assert len(rows) == 25
+
+    past_end = await client.getStockPriceInfo(basDt="20260205", numOfRows=10, pageNo=4)
+    assert past_end.raw_items() == []
+
+
+@pytest.mark.portal(total_count=25)
+async def test_range_pages_span_days(client):
+    days = {"beginBasDt": "20260202", "endBasDt": "20260207"}
+    page = await client.getStockPriceInfo(numOfRows=10, pageNo=3, **days)
+    rows = page.raw_items()
+
+    assert page_count(page, 10) == 13
+    assert [row["basDt"] for row in rows] == ["20260202"] * 5 + ["20260203"] * 5
+    assert [row["srtnCd"] for row in rows[4:6]] == ["000024", "000000"]
+
+    named = await client.getStockPriceInfo(likeItmsNm="종목1", numOfRows=100, **days)
+    assert page_count(named, 100) == 1
+    assert len(named.raw_items()) == 5 * 11
+
+
+@pytest.mark.portal(datasets={"getStockPriceInfo": load_rows(ROOT / "response_raw.json")})
+async def test_loaded_dataset_is_filtered(client):
+    hit = await client.getStockPriceInfo(basDt="20260205", itmsNm="삼성전자")
+    miss = await client.getStockPriceInfo(basDt="20260206", itmsNm="삼성전자")
+
+    assert [item.clpr for item in hit.items()] == ["159300"]
+    assert miss.raw_items() == []
+
+
+async def test_injected_errors_use_xml_envelopes(portal, client):
+    portal.inject("03")
+
+    with pytest.raises(ServiceError) as exc:
+        await client.getStockPriceInfo(basDt="20260205")
+
+    assert exc.value.code == "03"
+    assert (await client.getStockPriceInfo(basDt="20260205")).raw_items()
+
+
+@pytest.mark.portal(keys=["good"], daily_limit=1)
+async def test_unregistered_key_and_daily_limit(portal, client):
+    with pytest.raises(ServiceError) as exc:
+        await client.getStockPriceInfo(basDt="20260205")
+    assert exc.value.code == "30"
+
+    good = FinancialClient("good", transport=portal.transport())
+    await good.getStockPriceInfo(basDt="20260205")
+    with pytest.raises(ServiceError) as exc:
+        await good.getStockPriceInfo(basDt="20260205", pageNo=2)
+    assert exc.value.code == "22"
+
+
+@pytest.mark.portal(rate_limit=2)
+@pytest.mark.client(coalesce=False)
+async def test_rate_limit_throttles_per_key(portal, client):
+    await client.getStockPriceInfo(basDt="20260205")
+    await client.getStockPriceInfo(basDt="20260206")
+    with pytest.raises(DataPortalError, match="HTTP 429"):
+        await client.getStockPriceInfo(basDt="20260207")
+
+    assert portal.throttled == 1
+
+
+@pytest.mark.portal(total_count=5, cache_pages=True)
+def test_cached_pages_are_served_again(portal):
+    params = {"serviceKey": "k", "resultType": "json", "numOfRows": "2", "basDt": "20260205"}
+
+    first = portal.respond("/getStockPriceInfo", params)
+    again = portal.respond("/getStockPriceInfo", {**params, "serviceKey": "other"})
+    portal.inject("22")
+    failed = portal.respond("/getStockPriceInfo", params)
+
+    assert again.body is first.body
+    assert b"<returnReasonCode>22" in failed.body
+    assert portal.requests == 3
+
+
+@pytest.mark.portal(total_count=3)
+async def test_http_server_with_local_transport(portal):
+    server = portal.server(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        async with FinancialClient("test_key", transport=LocalPortalTransport(url)) as client:
+            response = await client.getEtnPriceInfo(basDt="20260205")
+        assert len(response.raw_items()) == 3
+        assert portal.requests == 1
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+
+def make_page(page_no: int, num_of_rows: int, total_count: int) -> dict:
+    start = (page_no - 1) * num_of_rows
+    stop = min(start + num_of_rows, total_count)
+    return {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body": {
+                "items": {
+                    "item": [{"srtnCd": f"{i:06d}", "clpr": str(i)} for i in range(start, stop)]
+                },
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": total_count,
+            },
+        }
+    }
+
+
+def page_no(page: DataPortalResponse) -> int:
+    body = page.response.body
+    return body["pageNo"] if isinstance(body, dict) else body.pageNo
+
+
+class FakeOperation:
+    """Stands in for a generated operation such as ``getStockPriceInfo``."""
+
+    def __init__(self, total_count: int, delays: dict[int, float] | None = None):
+        self.total_count = total_count
+        self.delays = delays or {}
+        self.calls: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, numOfRows: int = 10, pageNo: int = 1, **kwargs):
+        self.calls.append(pageNo)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(pageNo, 0.001))
+        finally:
+            self.in_flight -= 1
+        data = make_page(pageNo, numOfRows, self.total_count)
+        return DataPortalResponse[StockPriceInfoItem].model_validate(data)
+
+
+@pytest.fixture
+def client():
+    return FinancialClient(service_key="test_key")
+
+
+async def test_paginate_fetches_all_pages_in_order(client):
+    op = FakeOperation(total_count=25)
+
+    items = [item async for item in client.paginate(op, numOfRows=10, basDt="20260205")]
+
+    assert sorted(op.calls) == [1, 2, 3]
+    assert [item.srtnCd for item in items] == [f"{i:06d}" for i in range(25)]
+    assert all(isinstance(item, StockPriceInfoItem) for item in items)
+
+
+async def test_paginate_single_page_makes_one_call(client):
+    op = FakeOperation(total_count=3)
+
+    items = [item async for item in client.paginate(op, numOfRows=10)]
+
+    assert op.calls == [1]
+    assert len(items) == 3
+
+
+async def test_iter_pages_bounds_concurrency(client):
+    op = FakeOperation(total_count=100)
+
+    pages = [page async for page in client.iter_pages(op, numOfRows=5, concurrency=3)]
+
+    assert len(pages) == 20
+    assert op.max_in_flight == 3
+    assert [page_no(page) for page in pages] == list(range(1, 21))
+
+
+async def test_iter_pages_unordered_yields_as_completed(client):
+    op = FakeOperation(total_count=30, delays={2: 0.05})
+
+    pages = [page async for page in client.iter_pages(op, numOfRows=10, ordered=False)]
+
+    assert [page_no(page) for page in pages] == [1, 3, 2]
+
+
+async def test_iter_pages_cancels_pending_pages_on_early_exit(client):
+    op = FakeOperation(total_count=100, delays=dict.fromkeys(range(2, 11), 0.05))
+
+    pages = client.iter_pages(op, numOfRows=10, concurrency=2)
+    async for _ in pages:
+        break
+    await pages.aclose()
+
+    assert op.in_flight == 0
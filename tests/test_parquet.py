@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+
+from kr_data_portal.mockserver import synthetic_row
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+pc = pytest.importorskip("pyarrow.compute")
+
+from kr_data_portal.parquet import ParquetSink, arrow_schema, read_dataset  # noqa: E402
+
+
+def test_schema_from_model():
+    schema = arrow_schema(StockPriceInfoItem)
+
+    assert schema.names == list(StockPriceInfoItem.model_fields)
+    assert schema.field("clpr").type == pa.int64()
+    assert schema.field("fltRt").type == pa.float64()
+    assert schema.field("basDt").type == pa.date32()
+    assert schema.field("itmsNm").type == pa.string()
+
+
+@pytest.mark.portal(total_count=25)
+async def test_pages_are_partitioned_by_endpoint_and_day(tmp_path, client):
+    async with ParquetSink(tmp_path) as sink:
+        for day in ("20260205", "20260206"):
+            await sink.write_pages(
+                client.iter_pages(client.getStockPriceInfo, numOfRows=10, basDt=day)
+            )
+        await sink.write_pages(
+            client.iter_pages(client.getEtfPriceInfo, numOfRows=10, basDt="20260205")
+        )
+
+    assert sorted(str(f.path.relative_to(tmp_path)) for f in sink.files) == [
+        "endpoint=getEtfPriceInfo/basDt=2026-02-05/part-00000.parquet",
+        "endpoint=getStockPriceInfo/basDt=2026-02-05/part-00000.parquet",
+        "endpoint=getStockPriceInfo/basDt=2026-02-06/part-00000.parquet",
+    ]
+    table = read_dataset(tmp_path).to_table(filter=pc.field("basDt") == date(2026, 2, 6))
+    assert table.num_rows == 25
+    assert table.schema.field("clpr").type == pa.int64()
+    assert set(table.column("endpoint").to_pylist()) == {"getStockPriceInfo"}
+
+
+def test_row_groups_flush_at_target_size(tmp_path):
+    sink = ParquetSink(tmp_path, row_group_bytes=1)
+    for start in range(0, 30, 10):
+        sink.write(
+            "getStockPriceInfo",
+            [synthetic_row(i, "20260205") for i in range(start, start + 10)],
+            StockPriceInfoItem,
+        )
+    (written,) = sink.close()
+
+    metadata = pq.ParquetFile(written.path).metadata
+    assert (written.rows, metadata.num_row_groups) == (30, 3)
+
+
+def test_open_files_and_buffers_stay_bounded(tmp_path):
+    sink = ParquetSink(tmp_path, max_buffer_bytes=1, max_open_files=2)
+    for day in ("20260202", "20260203", "20260204", "20260202"):
+        sink.write("getStockPriceInfo", [synthetic_row(0, day)], StockPriceInfoItem)
+        assert sink._buffered == 0
+        assert sum(p.writer is not None for p in sink._partitions.values()) <= 2
+    files = sink.close()
+
+    assert len(files) == 4
+    assert read_dataset(tmp_path).count_rows() == 4
+
+
+def test_unparsable_numbers_become_nulls(tmp_path):
+    row = {**synthetic_row(0, "20260205"), "clpr": "", "fltRt": "-", "trqu": "1,000"}
+    sink = ParquetSink(tmp_path)
+    sink.write("getStockPriceInfo", [row, synthetic_row(1, "20260205")], StockPriceInfoItem)
+    (written,) = sink.close()
+
+    table = pq.read_table(written.path)
+    assert table.column("clpr").to_pylist()[0] is None
+    assert table.column("fltRt").to_pylist()[0] is None
+    assert table.column("trqu").to_pylist()[0] is None
+    assert "basDt" not in table.schema.names
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+from kr_data_portal.client import DataPortalClient
+from kr_data_portal.financial_services import PLANS, FinancialClient
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+from kr_data_portal.planner import get_prices
+from kr_data_portal.plans import Param, RequestPlan, SpecClient
+
+
+def test_plan_normalizes_url_once():
+    plan = RequestPlan("op", "http://example.com/op", None)
+
+    assert plan.url == "https://example.com/op"
+    assert plan.endpoint.url == "https://example.com/op"
+
+
+def test_query_validates_and_drops_none():
+    plan = PLANS["getStockPriceInfo"]
+
+    params = plan.query({"numOfRows": "100", "pageNo": 2, "basDt": date(2026, 2, 5), "crno": None})
+
+    assert params == {"resultType": "json", "numOfRows": 100, "pageNo": 2, "basDt": "20260205"}
+    with pytest.raises(ValueError, match="numOfRows must be an integer"):
+        plan.query({"numOfRows": "ten"})
+    with pytest.raises(ValueError, match="pageNo must be an integer"):
+        plan.query({"pageNo": True})
+
+
+def test_query_accepts_numpy_integers():
+    np = pytest.importorskip("numpy")
+
+    params = PLANS["getStockPriceInfo"].query({"numOfRows": np.int64(100)})
+
+    assert params["numOfRows"] == 100
+    assert type(params["numOfRows"]) is int
+
+
+def test_required_parameters():
+    plan = RequestPlan("op", "https://example.com/op", None, [Param("basDt", required=True)])
+
+    with pytest.raises(ValueError, match="missing required parameters: basDt"):
+        plan.query({"basDt": None})
+
+
+def test_build_url_keeps_key_unencoded():
+    client = DataPortalClient("a%2Bb==")
+
+    url = client._build_url("https://example.com/op", "pageNo=1&basDt=20260205", "a%2Bb==")
+
+    assert url == "https://example.com/op?pageNo=1&basDt=20260205&serviceKey=a%2Bb=="
+    assert (
+        client._build_url("https://example.com/op", "", "k")
+        == "https://example.com/op?serviceKey=k"
+    )
+
+
+def test_from_yaml_is_compiled_once(spec):
+    first = SpecClient.from_yaml(spec)
+
+    assert SpecClient.from_yaml(str(spec)) is first
+    assert set(first.plans) == set(FinancialClient.endpoints)
+    assert first.endpoints["getStockPriceInfo"] == FinancialClient.endpoints[
+        "getStockPriceInfo"
+    ]._replace(model=None)
+
+
+@pytest.mark.portal(total_count=25)
+async def test_spec_client_calls_operations(spec, portal):
+    cls = SpecClient.from_yaml(spec, models={"getStockPriceInfo": StockPriceInfoItem})
+    client = cls("test_key", requests_per_second=1000, transport=portal.transport())
+
+    response = await client.getStockPriceInfo(basDt="20260205", numOfRows=10)
+    etf = await client.call("getEtfPriceInfo", basDt="20260205", pageNo=3)
+    rows = [item async for item in client.paginate(client.getStockPriceInfo, numOfRows=10)]
+    prices = await get_prices(client, ["종목1", "종목2"], "20260205")
+
+    assert isinstance(response.items()[0], StockPriceInfoItem)
+    assert etf.raw_items()[0]["srtnCd"] == "000020"
+    assert len(rows) == 25
+    assert prices["종목2"].srtnCd == "000002"
+    with pytest.raises(ValueError, match="no operation"):
+        await client.call("getNothing")
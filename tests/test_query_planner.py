@@ -0,0 +1,76 @@
+import pytest
+
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+from kr_data_portal.planner import FANOUT, SCAN, get_prices, plan_prices, plan_query
+
+
+def test_plan_query_prefers_fewer_requests():
+    few = plan_query(3, 2500, 10.0, numOfRows=1000)
+    many = plan_query(300, 2500, 10.0, numOfRows=1000)
+
+    assert few.strategy == FANOUT
+    assert few.requests == 3
+    assert many.strategy == SCAN
+    assert many.requests == 3
+    assert many.fanout_seconds == pytest.approx(30.0)
+    assert many.seconds == pytest.approx(0.3)
+
+
+def test_plan_query_latency_bounds_waves():
+    plan = plan_query(8, 10_000, 1000.0, numOfRows=1000, concurrency=4, latency=0.5)
+
+    assert plan.fanout_seconds == pytest.approx(1.0)
+    assert plan.scan_seconds == pytest.approx(1.5)
+    assert plan.strategy == FANOUT
+
+
+def test_plan_query_scan_pages_take_longer():
+    probe_only = plan_query(12, 3000, 1000.0, numOfRows=1000, latency=0.5)
+    plan = plan_query(12, 3000, 1000.0, numOfRows=1000, latency=0.5, scan_latency=2.0)
+
+    assert probe_only.strategy == SCAN
+    assert plan.fanout_seconds == pytest.approx(1.5)
+    assert plan.scan_seconds == pytest.approx(2.0)
+    assert plan.strategy == FANOUT
+
+
+def test_plan_query_without_fanout_filter_scans():
+    plan = plan_query(1, 2500, 10.0, fanout=False)
+
+    assert plan.strategy == SCAN
+    assert plan.fanout_requests is None
+
+
+@pytest.mark.portal(total_count=250)
+async def test_many_symbols_scan_the_market(portal, client):
+    names = [f"종목{i}" for i in range(0, 250, 5)] + ["없는종목"]
+
+    rows = await get_prices(client, names, "20260205", numOfRows=100)
+
+    # Probe, then three pages instead of 51 filtered requests.
+    assert portal.requests == 4
+    assert list(rows) == names[:-1]
+    assert isinstance(rows["종목5"], StockPriceInfoItem)
+    assert rows["종목5"].srtnCd == "000005"
+
+
+@pytest.mark.portal(total_count=250)
+async def test_few_symbols_fan_out(client):
+    plan = await plan_prices(client, ["종목1", "종목2"], "20260205", numOfRows=100)
+    rows = await get_prices(client, ["종목1", "종목2"], "20260205", numOfRows=100)
+
+    assert plan.strategy == FANOUT
+    assert plan.total_count == 250
+    assert {name: row.srtnCd for name, row in rows.items()} == {
+        "종목1": "000001",
+        "종목2": "000002",
+    }
+
+
+@pytest.mark.portal(total_count=30)
+async def test_codes_are_matched_locally(client):
+    rows = await get_prices(client, ["000007"], "20260205", key="srtnCd")
+
+    assert rows["000007"].itmsNm == "종목7"
+    with pytest.raises(ValueError, match="cannot filter"):
+        await get_prices(client, ["000007"], "20260205", key="srtnCd", strategy=FANOUT)
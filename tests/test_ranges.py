@@ -0,0 +1,75 @@
+import pytest
+
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.ranges import fetch_range, shard_range
+
+pytestmark = pytest.mark.client(coalesce=False)
+
+
+def test_shard_range_covers_the_interval():
+    assert shard_range("20260101", "20260110", 4) == [
+        ("20260101", "20260104"),
+        ("20260105", "20260108"),
+        ("20260109", "20260110"),
+    ]
+    assert shard_range("20260105", "20260105", 30) == [("20260105", "20260105")]
+
+
+@pytest.mark.portal(total_count=5)
+async def test_range_filters_are_generated(client):
+    response = await client.getStockPriceInfo(
+        beginBasDt="20260202", endBasDt="20260207", likeItmsNm="종목", numOfRows=100
+    )
+
+    days = {row["basDt"] for row in response.raw_items()}
+    assert days == {"20260202", "20260203", "20260204", "20260205", "20260206"}
+    assert FinancialClient.endpoints["getEtfPriceInfo"].filter_param("basDt", "lt") == "endBasDt"
+
+
+@pytest.mark.portal(total_count=20)
+async def test_one_year_single_ticker_is_one_shard(portal, client):
+    rows = await fetch_range(
+        client, client.getStockPriceInfo, "20250101", "20251231", itmsNm="종목3"
+    )
+
+    # The probe, then a single page instead of one request per trading day.
+    assert portal.requests == 2
+    assert len(rows) == 261
+    assert rows[0].basDt == "20250101"
+    assert rows[-1].basDt == "20251231"
+    assert {row.itmsNm for row in rows} == {"종목3"}
+
+
+@pytest.mark.portal(total_count=10)
+async def test_shards_are_merged_in_date_order(portal, client):
+    rows = await fetch_range(
+        client, "getEtfPriceInfo", "20260105", "20260130", numOfRows=30, raw=True
+    )
+
+    assert len(rows) == 200
+    days = [row["basDt"] for row in rows]
+    assert days == sorted(days)
+    assert portal.requests > 2
+
+
+@pytest.mark.portal(total_count=10)
+async def test_oversized_shards_are_paginated(client):
+    rows = await fetch_range(
+        client, "getStockPriceInfo", "20260105", "20260116", numOfRows=15, shard_days=7, raw=True
+    )
+
+    assert len(rows) == 100
+    assert len({(row["basDt"], row["srtnCd"]) for row in rows}) == 100
+
+
+async def test_operation_without_range_filters(portal):
+    class PlainClient(FinancialClient):
+        endpoints = {
+            name: endpoint._replace(filters=())
+            for name, endpoint in FinancialClient.endpoints.items()
+        }
+
+    client = PlainClient("test_key", transport=portal.transport())
+
+    with pytest.raises(ValueError, match="no basDt range"):
+        await fetch_range(client, "getStockPriceInfo", "20260101", "20260131")
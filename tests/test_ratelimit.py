@@ -0,0 +1,127 @@
+import httpx
+import pytest
+
+from kr_data_portal.client import DataPortalClient, DataPortalError, ServiceError
+from kr_data_portal.codes import error_code, is_throttling
+from kr_data_portal.ratelimit import AdaptiveLimiter
+from kr_data_portal.retry import RetryPolicy
+
+OK_BODY = b'{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL SERVICE"},"body":{}}}'
+THROTTLED_BODY = (
+    b"<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+    b"<returnAuthMsg>SERVICE_TIMEOUT_ERROR</returnAuthMsg>"
+    b"<returnReasonCode>05</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+)
+
+
+def test_rate_increases_additively_on_success():
+    limiter = AdaptiveLimiter(10.0, latency_spike=None)
+
+    for _ in range(10):
+        limiter.record_success()
+
+    # ``rate`` successes add about ``increase`` requests/s.
+    assert 10.9 < limiter.rate < 11.0
+
+
+def test_rate_decreases_multiplicatively_once_per_cooldown():
+    limiter = AdaptiveLimiter(10.0, min_rate=1.0, cooldown=60.0)
+
+    limiter.record_throttle()
+    limiter.record_throttle()
+
+    assert limiter.rate == 5.0
+    assert limiter.throttle_events == 1
+
+
+def test_rate_stays_within_bounds():
+    limiter = AdaptiveLimiter(10.0, min_rate=4.0, max_rate=10.5, cooldown=0.0)
+
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.rate == 10.5
+
+    for _ in range(5):
+        limiter.record_throttle()
+    assert limiter.rate == 4.0
+
+
+def test_latency_spike_counts_as_throttling():
+    limiter = AdaptiveLimiter(10.0)
+    for _ in range(10):
+        limiter.record_success(0.1)
+    rate = limiter.rate
+
+    limiter.record_success(1.0)
+
+    assert limiter.rate == pytest.approx(rate / 2)
+    # The spike enters the average capped at three times the baseline.
+    assert limiter.average_latency == pytest.approx(0.12)
+
+
+def test_latency_baseline_follows_a_lasting_step_up():
+    limiter = AdaptiveLimiter(10.0, cooldown=0.0)
+    for _ in range(10):
+        limiter.record_success(0.1)
+    rate = limiter.rate
+
+    for _ in range(200):
+        limiter.record_success(0.4)
+
+    assert limiter.throttle_events <= 2
+    assert limiter.average_latency == pytest.approx(0.4)
+    assert limiter.rate > rate
+
+
+async def test_acquire_paces_requests(monkeypatch):
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr("kr_data_portal.ratelimit.asyncio.sleep", fake_sleep)
+    limiter = AdaptiveLimiter(1000.0)
+
+    for _ in range(3):
+        async with limiter:
+            pass
+
+    assert len(slept) == 2
+    # Time does not advance while "sleeping", so the waits queue up 1 ms apart.
+    assert all(0 < delay <= 0.002 for delay in slept)
+
+
+def test_throttling_classification():
+    response = httpx.Response(429)
+
+    assert is_throttling(ServiceError("x", code="22"))
+    assert is_throttling(ServiceError("x", code="05"))
+    assert is_throttling(ServiceError("Service Error Detected: SERVICE_TIMEOUT"))
+    assert is_throttling(DataPortalError("HTTP 429", response=response))
+    assert is_throttling(httpx.ReadTimeout("timed out"))
+    assert not is_throttling(ServiceError("x", code="30"))
+    assert not is_throttling(ServiceError("x", code="03"))
+    assert error_code(ServiceError("x", code="03")) == "3"
+
+
+async def test_client_adapts_to_throttling():
+    responses = iter([THROTTLED_BODY, OK_BODY])
+    client = DataPortalClient(
+        "test_key",
+        requests_per_second=20.0,
+        adaptive_rate=True,
+        retry=RetryPolicy(base_delay=0),
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=next(responses))),
+    )
+
+    data = await client._request("https://example.com/op", params={"pageNo": 1})
+
+    assert data["response"]["header"]["resultCode"] == "00"
+    # Halved on the service timeout, then nudged up by the success.
+    assert 10.0 < client.rate < 10.2
+
+
+async def test_client_rate_is_fixed_by_default():
+    client = DataPortalClient("test_key", requests_per_second=7.0)
+
+    assert client.rate == 7.0
@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from kr_data_portal.client import DataPortalClient, DataPortalError, ServiceError
+from kr_data_portal.decoders import default_json_loads, get_json_loads
+
+RAW_BYTES = (Path(__file__).parent.parent / "response_raw.json").read_bytes()
+
+XML_ERROR = (
+    b"<OpenAPI_ServiceResponse>\n\t<cmmMsgHeader>\n\t\t<errMsg>SERVICE ERROR</errMsg>\n"
+    b"\t\t<returnAuthMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR</returnAuthMsg>\n"
+    b"\t\t<returnReasonCode>22</returnReasonCode>\n\t</cmmMsgHeader>\n</OpenAPI_ServiceResponse>"
+)
+
+
+@pytest.fixture
+def client():
+    return DataPortalClient(service_key="test_key")
+
+
+def test_handle_response_decodes_json(client):
+    data = client._handle_response(httpx.Response(200, content=RAW_BYTES))
+
+    assert data == json.loads(RAW_BYTES)
+
+
+def test_handle_response_raises_on_json_error_header(client):
+    body = b'{"response":{"header":{"resultCode":"03","resultMsg":"NODATA_ERROR"}}}'
+
+    with pytest.raises(ServiceError) as excinfo:
+        client._handle_response(httpx.Response(200, content=body))
+
+    assert excinfo.value.code == "03"
+
+
+def test_handle_response_raises_on_xml_envelope(client):
+    with pytest.raises(ServiceError) as excinfo:
+        client._handle_response(httpx.Response(200, content=b"  " + XML_ERROR))
+
+    assert excinfo.value.code == "22"
+    assert excinfo.value.message == "API Error (22): SERVICE ERROR"
+
+
+def test_handle_response_rejects_garbage(client):
+    with pytest.raises(DataPortalError, match="Invalid JSON"):
+        client._handle_response(httpx.Response(200, content=b"not json"))
+
+    with pytest.raises(ServiceError, match="SERVICE_TIMEOUT"):
+        client._handle_response(httpx.Response(200, content=b"SERVICE_TIMEOUT"))
+
+
+def test_json_loads_hook_is_used():
+    seen = []
+
+    def loads(content: bytes):
+        seen.append(type(content))
+        return json.loads(content)
+
+    client = DataPortalClient(service_key="test_key", json_loads=loads)
+    client._handle_response(httpx.Response(200, content=RAW_BYTES))
+
+    assert seen == [bytes]
+
+
+def test_named_decoders():
+    assert get_json_loads("json")(b'{"a": 1}') == {"a": 1}
+    assert default_json_loads()(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError, match="Unknown"):
+        get_json_loads("yaml")
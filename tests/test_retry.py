@@ -0,0 +1,146 @@
+import httpx
+import pytest
+
+from kr_data_portal.client import DataPortalClient, DataPortalError, ServiceError
+from kr_data_portal.codes import is_retryable
+from kr_data_portal.keys import ServiceKeyPool
+from kr_data_portal.retry import RetryBudget, RetryPolicy
+
+OK_BODY = b'{"response":{"header":{"resultCode":"00","resultMsg":"NORMAL SERVICE"},"body":{}}}'
+
+
+def error_body(code: str) -> bytes:
+    return (f'{{"response":{{"header":{{"resultCode":"{code}","resultMsg":"ERROR"}}}}}}').encode()
+
+
+def scripted_client(responses, **kwargs):
+    """Client answering with ``responses`` in order; records the keys used."""
+    responses = iter(responses)
+    keys: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.url.params["serviceKey"])
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    kwargs.setdefault("service_key", "test_key")
+    client = DataPortalClient(
+        requests_per_second=1000, transport=httpx.MockTransport(handler), **kwargs
+    )
+    return client, keys
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays: list[float] = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("kr_data_portal.client.asyncio.sleep", sleep)
+    return delays
+
+
+def test_error_classification():
+    assert is_retryable(ServiceError("x", code="05"))
+    assert is_retryable(ServiceError("x", code="01"))
+    assert is_retryable(httpx.ConnectError("refused"))
+    assert is_retryable(DataPortalError("HTTP 502", response=httpx.Response(502)))
+    assert not is_retryable(ServiceError("x", code="03"))
+    assert not is_retryable(ServiceError("x", code="10"))
+    assert not is_retryable(ServiceError("x", code="30"))
+    assert not is_retryable(ServiceError("x", code="22"))
+    assert not is_retryable(DataPortalError("HTTP 404", response=httpx.Response(404)))
+
+
+def test_delays_grow_exponentially_within_bounds():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+
+    assert [policy.delay(a) for a in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    jittered = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert all(0 <= jittered.delay(2) <= 4.0 for _ in range(100))
+
+
+def test_retry_after_is_a_lower_bound():
+    policy = RetryPolicy(base_delay=0.1, jitter=False)
+    error = DataPortalError("HTTP 429", response=httpx.Response(429, headers={"Retry-After": "3"}))
+
+    assert policy.delay(0, error) == 3.0
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=10.0)
+    budget._balance = 0.0
+
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+async def test_transient_errors_are_retried_with_backoff(no_sleep):
+    policy = RetryPolicy(max_retries=3, jitter=False, base_delay=0.5)
+    client, keys = scripted_client(
+        [
+            httpx.ConnectError("refused"),
+            httpx.Response(200, content=error_body("05")),
+            httpx.Response(200, content=OK_BODY),
+        ],
+        retry=policy,
+    )
+
+    data = await client._request("https://example.com/op", params={"pageNo": 1})
+
+    assert data["response"]["header"]["resultCode"] == "00"
+    assert len(keys) == 3
+    assert no_sleep == [0.5, 1.0]
+    assert policy.retries == 2
+
+
+async def test_permanent_errors_are_not_retried(no_sleep):
+    client, keys = scripted_client([httpx.Response(200, content=error_body("30"))], use_retry=True)
+
+    with pytest.raises(ServiceError):
+        await client._request("https://example.com/op", params={"pageNo": 1})
+
+    assert len(keys) == 1
+    assert no_sleep == []
+
+
+async def test_retries_stop_at_max_retries(no_sleep):
+    client, keys = scripted_client([httpx.Response(503)] * 3, use_retry=True, max_retries=2)
+
+    with pytest.raises(DataPortalError, match="HTTP 503"):
+        await client._request("https://example.com/op", params={"pageNo": 1})
+
+    assert len(keys) == 3
+
+
+async def test_exhausted_budget_stops_retries(no_sleep):
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0)
+    budget._balance = 1.0
+    policy = RetryPolicy(max_retries=5, budget=budget)
+    client, keys = scripted_client([httpx.Response(503)] * 3, retry=policy)
+
+    with pytest.raises(DataPortalError):
+        await client._request("https://example.com/op", params={"pageNo": 1})
+
+    assert len(keys) == 2
+    assert policy.denied == 1
+
+
+async def test_key_error_is_retried_on_another_pooled_key(no_sleep):
+    pool = ServiceKeyPool(["bad", "good"], requests_per_second=1000)
+    client, keys = scripted_client(
+        [httpx.Response(200, content=error_body("30")), httpx.Response(200, content=OK_BODY)],
+        service_key=pool,
+        use_retry=True,
+    )
+
+    await client._request("https://example.com/op", params={"pageNo": 1})
+
+    assert keys == ["bad", "good"]
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from kr_data_portal import services
+from kr_data_portal.financial_services import FinancialClient, StockPriceInfoResponse
+from kr_data_portal.models.base import DataPortalResponse
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def test_registry_resolves_modules_and_clients():
+    assert services.FinancialClient is FinancialClient
+    assert services.financial_services.FinancialClient is FinancialClient
+    assert "FinancialClient" in dir(services)
+
+
+def test_unknown_service():
+    with pytest.raises(AttributeError, match="no attribute 'nope'"):
+        _ = services.nope
+
+
+def test_registry_imports_clients_on_first_access():
+    code = (
+        "import sys, kr_data_portal.services as s;"
+        "print('kr_data_portal.client' in sys.modules);"
+        "s.FinancialClient;"
+        "print('kr_data_portal.financial_services' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        env={"PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.split() == ["False", "True"]
+
+
+def test_response_types_are_specialized_once():
+    assert StockPriceInfoResponse is DataPortalResponse[StockPriceInfoItem]
+    assert StockPriceInfoResponse.item_model() is StockPriceInfoItem
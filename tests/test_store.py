@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from kr_data_portal.client import DataPortalError
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+from kr_data_portal.store import PriceStore
+
+pytestmark = pytest.mark.portal(total_count=30)
+
+
+@pytest.fixture
+def store(tmp_path, client):
+    store = PriceStore(tmp_path / "prices.db", client, numOfRows=10)
+    yield store
+    store.close()
+
+
+async def test_prices_fetch_missing_days_once(store, portal):
+    # 2026-01-05 (Mon) .. 2026-01-09 (Fri): five trading days of three pages each.
+    rows = await store.prices(srtnCd="000007", start="20260105", end="20260109")
+
+    assert [row.basDt for row in rows] == [
+        "20260105",
+        "20260106",
+        "20260107",
+        "20260108",
+        "20260109",
+    ]
+    assert all(isinstance(row, StockPriceInfoItem) for row in rows)
+    assert portal.requests == 15
+    assert len(store) == 150
+
+    again = await store.prices(isinCd="KR7000007003", start="20260105", end="20260109")
+    assert [row.clpr for row in again] == [row.clpr for row in rows]
+    assert portal.requests == 15
+
+    await store.prices(itmsNm="종목7", start="20260105", end="20260112")
+    assert portal.requests == 18
+    assert store.fetched_days == 6
+
+
+async def test_weekends_are_not_fetched(store, portal):
+    await store.fill("20260110", "20260111")
+
+    assert portal.requests == 0
+    assert store.missing_days("20260109", "20260112") == ["20260109", "20260112"]
+
+
+async def test_recent_days_are_not_marked_complete(store):
+    await store.fill("20991231", "20991231")
+
+    assert store.missing_days("20991231", "20991231") == ["20991231"]
+    assert len(store.query(start="20991231")) == 30
+
+
+async def test_failed_day_cancels_the_others(tmp_path, client, portal):
+    store = PriceStore(tmp_path / "prices.db", client, numOfRows=10, concurrency=1)
+    portal.inject("30")
+
+    with pytest.raises(DataPortalError):
+        await store.fill("20260105", "20260109")
+    await asyncio.sleep(0.1)
+
+    # The next day may have sent its first page before the failure was seen.
+    assert portal.requests <= 2
+    assert len(store) == 0
+    assert store.missing_days("20260105", "20260109") == [
+        "20260105",
+        "20260106",
+        "20260107",
+        "20260108",
+        "20260109",
+    ]
+    store.close()
+
+
+async def test_invalid_rows_are_returned_raw(store):
+    store.write("getStockPriceInfo", [{"basDt": "20260105", "srtnCd": "000001", "clpr": "1"}])
+    store.write("getStockPriceInfo", [{"basDt": "20260105", "srtnCd": "000002", "clpr": ["x"]}])
+
+    rows = await store.prices(start="20260105")
+
+    assert isinstance(rows[0], StockPriceInfoItem)
+    assert rows[1] == {"basDt": "20260105", "srtnCd": "000002", "clpr": ["x"]}
+
+
+async def test_query_without_client(tmp_path):
+    store = PriceStore(tmp_path / "prices.db")
+    store.write("getStockPriceInfo", [{"basDt": "20260105", "srtnCd": "005930", "clpr": "1"}])
+    store.write("getStockPriceInfo", [{"basDt": "20260105", "srtnCd": "005930", "clpr": "2"}])
+
+    assert store.query(srtnCd="005930") == [{"basDt": "20260105", "srtnCd": "005930", "clpr": "2"}]
+    assert store.query(srtnCd="005930", endpoint="getEtfPriceInfo") == []
+    with pytest.raises(ValueError, match="no client"):
+        await store.fill("20260105", "20260105")
+    store.close()
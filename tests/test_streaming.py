@@ -0,0 +1,144 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from kr_data_portal.client import ServiceError
+from kr_data_portal.financial_services import FinancialClient
+from kr_data_portal.models.financial_services import StockPriceInfoItem
+from kr_data_portal.streaming import ItemStreamParser
+
+RAW = json.loads((Path(__file__).parent.parent / "response_raw.json").read_text(encoding="utf-8"))
+ROW = RAW["response"]["body"]["items"]["item"][0]
+
+
+def make_body(rows: int, result_code: str = "00") -> bytes:
+    data = {
+        "response": {
+            "header": {"resultCode": result_code, "resultMsg": "NORMAL SERVICE."},
+            "body": {
+                "numOfRows": rows,
+                "pageNo": 1,
+                "totalCount": rows,
+                "items": {"item": [{**ROW, "srtnCd": f"{i:06d}"} for i in range(rows)]},
+            },
+        }
+    }
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def parse_in_chunks(body: bytes, size: int) -> tuple[list[dict], ItemStreamParser]:
+    parser = ItemStreamParser()
+    rows = []
+    for i in range(0, len(body), size):
+        rows.extend(parser.feed(body[i : i + size]))
+    rows.extend(parser.close())
+    return rows, parser
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_parser_yields_rows_for_any_chunking(size):
+    rows, parser = parse_in_chunks(make_body(5), size)
+
+    assert [row["srtnCd"] for row in rows] == [f"{i:06d}" for i in range(5)]
+    assert rows[0]["itmsNm"] == "삼성전자"
+    assert parser.header == {"resultCode": "00", "resultMsg": "NORMAL SERVICE."}
+    assert parser.body == {"numOfRows": 5, "pageNo": 1, "totalCount": 5}
+
+
+def test_parser_handles_single_item_object_and_empty_items():
+    single = b'{"response":{"header":{"resultCode":"00"},"body":{"items":{"item":{"a":1}}}}}'
+    empty = b'{"response":{"header":{"resultCode":"00"},"body":{"items":"","totalCount":0}}}'
+
+    assert parse_in_chunks(single, 5)[0] == [{"a": 1}]
+    rows, parser = parse_in_chunks(empty, 5)
+    assert rows == []
+    assert parser.body == {"totalCount": 0}
+
+
+def test_parser_buffer_stays_bounded():
+    body = make_body(5000)
+    parser = ItemStreamParser()
+    largest = 0
+    count = 0
+    for i in range(0, len(body), 4096):
+        count += len(parser.feed(body[i : i + 4096]))
+        largest = max(largest, len(parser._buf) - parser._pos)
+    count += len(parser.close())
+
+    assert count == 5000
+    assert largest < 4096 + 1024
+
+
+def test_parser_rejects_truncated_body():
+    parser = ItemStreamParser()
+    parser.feed(make_body(3)[:-40])
+    with pytest.raises(ValueError, match="ended inside"):
+        parser.close()
+
+
+async def collect(items, into: list | None = None) -> list:
+    into = [] if into is None else into
+    async for item in items:
+        into.append(item)
+    return into
+
+
+def streaming_client(body: bytes, chunk: int = 100) -> FinancialClient:
+    async def chunks():
+        for i in range(0, len(body), chunk):
+            yield body[i : i + chunk]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunks())
+
+    client = FinancialClient(service_key="test_key")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_stream_items_yields_models():
+    async with streaming_client(make_body(20)) as client:
+        items = [
+            item async for item in client.stream_items(client.getStockPriceInfo, basDt="20260205")
+        ]
+
+    assert len(items) == 20
+    assert all(isinstance(item, StockPriceInfoItem) for item in items)
+
+
+async def test_stream_items_raw_by_name():
+    async with streaming_client(make_body(2)) as client:
+        items = await collect(client.stream_items("getStockPriceInfo", raw=True))
+
+    assert items[1]["srtnCd"] == "000001"
+
+
+async def test_stream_items_checks_header_before_items():
+    async with streaming_client(make_body(3, result_code="22")) as client:
+        received = []
+        with pytest.raises(ServiceError) as excinfo:
+            await collect(client.stream_items(client.getStockPriceInfo), received)
+
+    assert excinfo.value.code == "22"
+    assert received == []
+
+
+async def test_stream_items_raises_xml_errors():
+    body = (
+        b"<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+        b"<returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>"
+        b"<returnReasonCode>30</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+    )
+    async with streaming_client(body, chunk=16) as client:
+        with pytest.raises(ServiceError) as excinfo:
+            await collect(client.stream_items(client.getStockPriceInfo))
+
+    assert excinfo.value.code == "30"
+
+
+async def test_stream_items_rejects_unknown_operation():
+    client = FinancialClient(service_key="test_key")
+    with pytest.raises(ValueError, match="getNothing"):
+        await collect(client.stream_items("getNothing"))
@@ -0,0 +1,80 @@
+import pytest
+
+from kr_data_portal.symbols import SymbolIndex, choseong
+
+ROWS = [
+    {"srtnCd": "005930", "isinCd": "KR7005930003", "itmsNm": "삼성전자", "mrktCtg": "KOSPI",
+     "crno": "1301110006246"},
+    {"srtnCd": "005935", "isinCd": "KR7005931001", "itmsNm": "삼성전자우", "mrktCtg": "KOSPI",
+     "crno": "1301110006246"},
+    {"srtnCd": "000660", "isinCd": "KR7000660001", "itmsNm": "SK하이닉스", "mrktCtg": "KOSPI"},
+    {"srtnCd": "035420", "isinCd": "KR7035420009", "itmsNm": "NAVER", "mrktCtg": "KOSPI"},
+    {"srtnCd": "028260", "isinCd": "KR7028260008", "itmsNm": "삼성물산", "mrktCtg": "KOSPI"},
+]  # fmt: skip
+
+
+@pytest.fixture
+def index():
+    return SymbolIndex.from_rows(ROWS, "20260205")
+
+
+def test_choseong():
+    assert choseong("삼성전자우") == "ㅅㅅㅈㅈㅇ"
+    assert choseong("SK하이닉스") == "SKㅎㅇㄴㅅ"
+
+
+def test_exact_lookups(index):
+    assert index.get("005930").itmsNm == "삼성전자"
+    assert index.get("A000660").itmsNm == "SK하이닉스"
+    assert index.get("KR7035420009").srtnCd == "035420"
+    assert index.get("naver").srtnCd == "035420"
+    assert index.get("999999") is None
+    assert [s.srtnCd for s in index.by_crno("130111-0006246")] == ["005930", "005935"]
+    assert index.get("000660").crno == ""
+
+
+def test_prefix_and_choseong_prefix(index):
+    assert [s.itmsNm for s in index.prefix("삼성")] == ["삼성물산", "삼성전자", "삼성전자우"]
+    assert [s.itmsNm for s in index.prefix("ㅅㅅㅈ")] == ["삼성전자", "삼성전자우"]
+    assert [s.itmsNm for s in index.prefix("sk")] == ["SK하이닉스"]
+    assert index.prefix("삼성", limit=1)[0].itmsNm == "삼성물산"
+
+
+def test_fuzzy_search(index):
+    # One wrong vowel: 삼성전자 misspelt as 삼성잔자.
+    best, score = index.search("삼성잔자")[0]
+    assert best.itmsNm == "삼성전자"
+    assert 0.6 <= score < 1
+    assert [s.itmsNm for s, _ in index.search("하이닉스")] == ["SK하이닉스"]
+    assert index.search("현대차") == []
+
+
+def test_saved_index_is_memory_mapped(index, tmp_path):
+    path = tmp_path / "symbols.idx"
+    index.save(path)
+
+    opened = SymbolIndex.open(path)
+    assert (opened.basDt, len(opened)) == ("20260205", 5)
+    assert list(opened) == list(index)
+    assert opened.prefix("ㅅㅅ")[0].itmsNm == "삼성물산"
+    opened.close()
+
+    path.write_bytes(b"garbage" * 10)
+    with pytest.raises(ValueError, match="Not a symbol index"):
+        SymbolIndex.open(path)
+
+
+@pytest.mark.portal(total_count=2500)
+async def test_load_or_build_fetches_once_per_day(tmp_path, portal, client):
+    path = tmp_path / "symbols.idx"
+
+    index = await SymbolIndex.load_or_build(path, client, basDt="20260205")
+    assert len(index) == 2500
+    assert index.get("종목1234").srtnCd == "001234"
+    assert portal.requests == 3
+
+    again = await SymbolIndex.load_or_build(path, client, basDt="20260205")
+    assert again.get("001234").itmsNm == "종목1234"
+    assert portal.requests == 3
+    index.close()
+    again.close()